@@ -1,27 +1,70 @@
 import boto3
 import json
 import logging
+import threading
+import time
+from functools import lru_cache
+from app.core.metrics import timed
 
 logger = logging.getLogger("uvicorn")
 
+# Secret 캐시: secret_arn -> (조회 시각, 만료 시각, 값)
+_secret_cache = {}
+_secret_lock = threading.Lock()
 
-def get_secret(secret_arn: str, region_name: str = "ap-northeast-2") -> dict:
+
+@lru_cache(maxsize=None)
+def _get_client(region_name: str):
+    """리전별 Secrets Manager 클라이언트 재사용 (boto3 client는 thread-safe)"""
+    session = boto3.session.Session()
+    return session.client(service_name="secretsmanager", region_name=region_name)
+
+
+def get_secret(
+    secret_arn: str,
+    region_name: str = "ap-northeast-2",
+    force_refresh: bool = False,
+    ttl_seconds: float = 300,
+) -> dict:
     """
     AWS Secrets Manager에서 Secret Value(JSON)를 가져옵니다.
+    ttl_seconds 동안 결과를 캐시하며, force_refresh=True면 다시 조회합니다.
+    동시 조회는 락으로 합쳐 API 호출을 1회만 수행합니다.
     """
-    session = boto3.session.Session()
-    client = session.client(service_name="secretsmanager", region_name=region_name)
-
-    try:
-        logger.info(f"🔐 [AWS Secrets] Fetching secret from: {secret_arn}")
-        get_secret_value_response = client.get_secret_value(SecretId=secret_arn)
-    except Exception as e:
-        logger.error(f"❌ [AWS Secrets Error] Failed to fetch secret: {str(e)}")
-        raise e
-
-    if "SecretString" in get_secret_value_response:
-        secret = get_secret_value_response["SecretString"]
-        return json.loads(secret)
-    else:
-        # Binary secret인 경우 (거의 안 씀)
-        raise Exception("Binary secret not supported")
+    requested_at = time.monotonic()
+    with _secret_lock:
+        cached = _secret_cache.get(secret_arn)
+        if cached is not None:
+            fetched_at, expires_at, secret = cached
+            # 락을 기다리는 동안 다른 스레드가 새로 조회했다면 그 결과를 공유
+            if fetched_at >= requested_at or (
+                not force_refresh and time.monotonic() < expires_at
+            ):
+                return dict(secret)
+
+        client = _get_client(region_name)
+
+        try:
+            logger.info(f"🔐 [AWS Secrets] Fetching secret from: {secret_arn}")
+            with timed("secrets_manager_fetch"):
+                get_secret_value_response = client.get_secret_value(SecretId=secret_arn)
+        except Exception as e:
+            logger.error(f"❌ [AWS Secrets Error] Failed to fetch secret: {str(e)}")
+            raise e
+
+        if "SecretString" in get_secret_value_response:
+            secret = json.loads(get_secret_value_response["SecretString"])
+        else:
+            # Binary secret인 경우 (거의 안 씀)
+            raise Exception("Binary secret not supported")
+
+        now = time.monotonic()
+        _secret_cache[secret_arn] = (now, now + ttl_seconds, secret)
+        return dict(secret)
+
+
+def clear_secret_cache():
+    """캐시된 Secret/클라이언트 폐기 (프로세스 fork 이후 등)"""
+    with _secret_lock:
+        _secret_cache.clear()
+    _get_client.cache_clear()
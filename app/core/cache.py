@@ -0,0 +1,198 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, Optional, Tuple
+from app.core.config import settings
+from app.core import onprem_client
+
+logger = logging.getLogger("uvicorn")
+
+
+class AsyncTTLCache:
+    """
+    프로세스 메모리 전용 LRU + TTL 캐시.
+    - max_entries 초과 시 가장 오래 사용되지 않은 항목부터 제거 (LRU)
+    - ttl_seconds 경과한 항목은 조회 시점에 만료 처리
+    - 동일 key에 대한 동시 Miss는 하나의 loader 호출로 합쳐짐 (Stampede 방지)
+    값은 메모리에만 보관되며 디스크/외부 저장소로 직렬화하지 않음 (PII 보관 용도).
+    """
+
+    def __init__(self, name: str, max_entries: int, ttl_seconds: float):
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+        # 사이징용 카운터
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+        self.coalesced = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """캐시된 값 반환 (없거나 만료되면 None)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any):
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    async def get_or_load(
+        self, key: Hashable, loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        캐시 Hit이면 즉시 반환, Miss면 loader를 호출하여 채움.
+        이미 같은 key를 로딩 중이면 그 결과를 함께 기다림.
+        loader 예외는 캐시하지 않고 대기 중인 호출자 모두에게 전파.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.coalesced += 1
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await loader()
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # 대기자가 없을 때 "never retrieved" 경고 방지
+            raise
+        else:
+            future.set_result(value)
+            # 로딩 중 invalidate 되었다면 오래된 값을 저장하지 않음
+            if self._inflight.get(key) is future:
+                self.set(key, value)
+            return value
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def is_inflight(self, key: Hashable) -> bool:
+        """같은 key를 로딩 중인지 (get_or_load가 그 결과를 함께 기다리게 되는지)"""
+        return key in self._inflight
+
+    def invalidate(self, key: Hashable) -> bool:
+        """단일 항목 무효화. 로딩 중인 결과도 저장되지 않도록 분리."""
+        self._inflight.pop(key, None)
+        removed = self._entries.pop(key, None) is not None
+        if removed:
+            self.invalidations += 1
+        return removed
+
+    def clear(self):
+        self.invalidations += len(self._entries)
+        self._entries.clear()
+        self._inflight.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "name": self.name,
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+            "coalesced": self.coalesced,
+            "inflight": len(self._inflight),
+        }
+
+
+# -----------------------------------------------------------------------------
+# Cloud 측 PII 캐시 (온프레미스 조회 앞단)
+# -----------------------------------------------------------------------------
+pii_cache = AsyncTTLCache(
+    "pii",
+    max_entries=settings.PII_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.PII_CACHE_TTL_SECONDS,
+)
+
+
+async def get_pii_cached(user_id: str) -> dict:
+    """캐시를 거쳐 단일 사용자 PII 조회"""
+    if not settings.PII_CACHE_ENABLED:
+        return await onprem_client.fetch_pii(user_id)
+
+    return await pii_cache.get_or_load(
+        user_id, lambda: onprem_client.fetch_pii(user_id)
+    )
+
+
+async def get_pii_batch_cached(user_ids: Iterable[str]) -> Dict[str, Optional[dict]]:
+    """캐시 Hit은 바로 사용하고, Miss만 모아 온프레미스 일괄 조회"""
+    unique_ids = list(dict.fromkeys(user_ids))
+    if not settings.PII_CACHE_ENABLED:
+        return await onprem_client.fetch_pii_batch(unique_ids)
+
+    results: Dict[str, Optional[dict]] = {}
+    missing = []
+    for user_id in unique_ids:
+        value = pii_cache.get(user_id)
+        if value is None:
+            missing.append(user_id)
+        else:
+            results[user_id] = value
+
+    if missing:
+        fetched = await onprem_client.fetch_pii_batch(missing)
+        for user_id, value in fetched.items():
+            if value is not None:
+                pii_cache.set(user_id, value)
+            results[user_id] = value
+
+    return results
+
+
+# -----------------------------------------------------------------------------
+# Idempotency-Key 결과 캐시 (클라이언트 재시도 시 상위 호출 반복 방지)
+# -----------------------------------------------------------------------------
+idempotency_cache = AsyncTTLCache(
+    "idempotency",
+    max_entries=settings.IDEMPOTENCY_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.IDEMPOTENCY_TTL_SECONDS,
+)
+
+
+async def run_idempotent(
+    key: str, loader: Callable[[], Awaitable[Any]]
+) -> Tuple[Any, bool]:
+    """
+    같은 key의 완료된 결과가 있으면 재사용, 처리 중이면 그 결과를 함께 기다림.
+    반환값: (결과, 재사용 여부). 실패(예외)는 캐시하지 않으므로 재시도 시 다시 수행.
+    프로세스 메모리 캐시이므로 인스턴스 간 중복은 DB의 PROCESSING 선점이 막음.
+    """
+    cached = idempotency_cache.get(key)
+    if cached is not None:
+        return cached, True
+    replayed = idempotency_cache.is_inflight(key)
+    return await idempotency_cache.get_or_load(key, loader), replayed
@@ -0,0 +1,129 @@
+import logging
+import time
+from collections import deque
+from typing import Deque
+from app.core.metrics import CIRCUIT_STATE
+
+logger = logging.getLogger("uvicorn")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+_STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitOpenError(Exception):
+    """Circuit이 열려 있어 호출하지 않고 즉시 실패"""
+
+    def __init__(self, name: str, retry_after: float):
+        super().__init__(f"Circuit '{name}' is open")
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    최근 window_size회 호출의 실패율 기반 Circuit Breaker (이벤트 루프 단일 스레드 전용).
+    - CLOSED: 정상 호출. 최근 호출이 min_calls 이상이고 실패율이 임계치 이상이면 OPEN
+    - OPEN: open_seconds 동안 호출 없이 즉시 실패 (타임아웃까지 기다리지 않음)
+    - HALF_OPEN: 쿨다운 후 half_open_max_calls개의 시험 호출만 허용.
+      성공하면 CLOSED, 하나라도 실패하면 다시 OPEN
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate_threshold: float = 0.5,
+        window_size: int = 20,
+        min_calls: int = 10,
+        open_seconds: float = 10.0,
+        half_open_max_calls: int = 1,
+    ):
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.min_calls = min_calls
+        self.open_seconds = open_seconds
+        self.half_open_max_calls = half_open_max_calls
+
+        self.state = CLOSED
+        self._window: Deque[bool] = deque(maxlen=window_size)  # True = 실패
+        self._opened_at = 0.0
+        self._half_open_inflight = 0
+        self._half_open_successes = 0
+
+        # 메트릭
+        self.opened_count = 0
+        self.rejected = 0
+        CIRCUIT_STATE.labels(name).set(_STATE_VALUES[CLOSED])
+
+    def _transition(self, state: str):
+        if state == self.state:
+            return
+        logger.warning("⚡ [Circuit:%s] %s -> %s", self.name, self.state, state)
+        self.state = state
+        CIRCUIT_STATE.labels(self.name).set(_STATE_VALUES[state])
+        if state == OPEN:
+            self._opened_at = time.monotonic()
+            self.opened_count += 1
+        elif state == HALF_OPEN:
+            self._half_open_inflight = 0
+            self._half_open_successes = 0
+        else:
+            self._window.clear()
+
+    def retry_after(self) -> float:
+        """OPEN 상태가 끝날 때까지 남은 시간 (초)"""
+        if self.state != OPEN:
+            return 0.0
+        return max(self._opened_at + self.open_seconds - time.monotonic(), 0.0)
+
+    def before_call(self):
+        """호출 직전에 확인. 호출할 수 없으면 CircuitOpenError."""
+        if self.state == OPEN:
+            if self.retry_after() > 0:
+                self.rejected += 1
+                raise CircuitOpenError(self.name, self.retry_after())
+            self._transition(HALF_OPEN)
+
+        if self.state == HALF_OPEN:
+            if self._half_open_inflight >= self.half_open_max_calls:
+                self.rejected += 1
+                raise CircuitOpenError(self.name, 1.0)
+            self._half_open_inflight += 1
+
+    def record_success(self):
+        if self.state == HALF_OPEN:
+            self._half_open_inflight = max(self._half_open_inflight - 1, 0)
+            self._half_open_successes += 1
+            if self._half_open_successes >= self.half_open_max_calls:
+                self._transition(CLOSED)
+            return
+        self._window.append(False)
+
+    def record_ignored(self):
+        """결과를 판정하지 않은 호출 (취소 등): HALF_OPEN 시험 슬롯만 반환"""
+        if self.state == HALF_OPEN:
+            self._half_open_inflight = max(self._half_open_inflight - 1, 0)
+
+    def record_failure(self):
+        if self.state == HALF_OPEN:
+            self._transition(OPEN)
+            return
+        if self.state == OPEN:
+            return
+
+        self._window.append(True)
+        if len(self._window) >= self.min_calls:
+            failure_rate = sum(self._window) / len(self._window)
+            if failure_rate >= self.failure_rate_threshold:
+                self._transition(OPEN)
+
+    def snapshot(self) -> dict:
+        calls = len(self._window)
+        return {
+            "state": self.state,
+            "failure_rate": round(sum(self._window) / calls, 4) if calls else 0.0,
+            "window_calls": calls,
+            "retry_after_s": round(self.retry_after(), 3),
+            "opened_count": self.opened_count,
+            "rejected": self.rejected,
+        }
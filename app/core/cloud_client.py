@@ -0,0 +1,27 @@
+import logging
+import httpx
+from app.core.config import settings
+
+logger = logging.getLogger("uvicorn")
+
+
+def notify_pii_invalidation(user_id: str):
+    """
+    [On-Prem] PII 변경 시 클라우드 측 PII 캐시 무효화 요청.
+    실패해도 캐시 TTL이 최대 지연을 보장하므로 로그만 남김 (BackgroundTasks에서 호출).
+    """
+    if not settings.CLOUD_SERVICE_URL:
+        return
+
+    try:
+        response = httpx.delete(
+            f"{settings.CLOUD_SERVICE_URL}/internal/pii-cache/{user_id}",
+            headers={"x-internal-token": settings.INTERNAL_API_TOKEN},
+            timeout=settings.ONPREM_CONNECT_TIMEOUT,
+        )
+        if response.status_code != 200:
+            logger.warning(
+                "⚠️ [Cache Invalidation] Cloud responded %d for user %s", response.status_code, user_id
+            )
+    except httpx.RequestError as exc:
+        logger.warning("⚠️ [Cache Invalidation] Could not reach Cloud: %s", exc)
@@ -6,6 +6,20 @@ from typing import Optional
 logger = logging.getLogger("uvicorn")
 
 
+def _available_cpus() -> int:
+    """컨테이너 CPU 할당량 (cgroup v2 cpu.max, 없으면 affinity 기준 CPU 수)"""
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()
+        if quota != "max":
+            return max(int(int(quota) / int(period)), 1)
+    except (OSError, ValueError):
+        pass
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
 class Settings(BaseSettings):
     PROJECT_NAME: str = "Hybrid PII Service PoC"
     ENV: str = "prod"
@@ -17,6 +31,8 @@ class Settings(BaseSettings):
     VAULT_ADDR: str = "http://127.0.0.1:8200"
     VAULT_ROLE_ID: Optional[str] = None
     VAULT_SECRET_ID: Optional[str] = None
+    # lease/TTL 정보가 없는 Secret의 캐시 유효 시간 (초)
+    VAULT_SECRET_CACHE_TTL: float = float(os.getenv("VAULT_SECRET_CACHE_TTL", "300"))
 
     # DB 설정
     DATABASE_URL: Optional[str] = None
@@ -24,33 +40,227 @@ class Settings(BaseSettings):
     # AWS Secrets Manager ARN (Terraform 주입)
     DB_SECRET_ARN: Optional[str] = os.getenv("DB_SECRET_ARN")
     AWS_REGION: str = os.getenv("AWS_REGION", "ap-northeast-2")
+    # Secret 캐시 유효 시간 (초)
+    AWS_SECRET_CACHE_TTL: float = float(os.getenv("AWS_SECRET_CACHE_TTL", "300"))
 
     # DB Connection Pool 설정 (Auto Scaling 대비)
     DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "5"))
     DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    # 컨테이너(모든 워커 합계)의 DB 연결 상한. 설정 시 워커당 pool_size + max_overflow를
+    # DB_MAX_CONNECTIONS / 워커 수 - 1(sync 엔진) 이내로 줄임 (0이면 프로세스마다 위 값을 그대로 사용)
+    # Credential Rotation 중에는 이전 Pool이 Drain될 때까지 일시적으로 최대 2배까지 사용
+    DB_MAX_CONNECTIONS: int = int(os.getenv("DB_MAX_CONNECTIONS", "0"))
+
+    # 읽기 전용 Replica (Aurora Reader 엔드포인트 / 온프레미스 Replica). 쉼표로 구분한 host[:port]
+    # 미설정 시 Secret(reader_host)/Vault(reader_hosts) 값을 사용하고, 둘 다 없으면 모든 조회를 Writer로 보냄
+    DB_READER_HOSTS: str = os.getenv("DB_READER_HOSTS", "")
+    # 복제 지연이 이 값(초)을 넘거나 측정에 실패한 리더는 제외하고 Writer로 조회
+    DB_READER_MAX_LAG_SECONDS: float = float(os.getenv("DB_READER_MAX_LAG_SECONDS", "2.0"))
+    # 리더 복제 지연 측정 주기 (초)
+    DB_READER_LAG_CHECK_INTERVAL: float = float(os.getenv("DB_READER_LAG_CHECK_INTERVAL", "5"))
+
+    # Credential Rotation (무중단 Pool 교체)
+    # Vault lease의 이 비율만큼 지났을 때 새 Credential로 Pool을 선제 교체
+    DB_CREDENTIAL_REFRESH_RATIO: float = float(
+        os.getenv("DB_CREDENTIAL_REFRESH_RATIO", "0.75")
+    )
+    # lease 정보가 없을 때의 고정 교체 주기 (초, 0이면 인증 실패 시에만 갱신)
+    DB_CREDENTIAL_REFRESH_INTERVAL: int = int(
+        os.getenv("DB_CREDENTIAL_REFRESH_INTERVAL", "0")
+    )
+    # 이전 Pool의 사용 중 연결이 반환되기를 기다리는 최대 시간 (초)
+    DB_POOL_DRAIN_TIMEOUT: float = float(os.getenv("DB_POOL_DRAIN_TIMEOUT", "60"))
+
+    # 시작 (Lifespan): DB 초기화는 백그라운드로 진행하고 /health는 즉시 응답
+    # 초기화 중 들어온 DB 요청이 완료를 기다리는 최대 시간 (초과 시 503)
+    DB_INIT_WAIT_TIMEOUT: float = float(os.getenv("DB_INIT_WAIT_TIMEOUT", "10"))
+    # 콜드 스타트 목표: 앱 임포트부터 /health 응답 가능까지 (초과 시 경고 로그)
+    STARTUP_TARGET_SECONDS: float = float(os.getenv("STARTUP_TARGET_SECONDS", "2"))
+
+    # 견적 엔진 설정
+    # 고정 seed 지정 시 모든 견적이 동일 난수열 사용 (회귀 테스트용 재현 모드)
+    QUOTE_SEED: Optional[int] = (
+        int(os.getenv("QUOTE_SEED")) if os.getenv("QUOTE_SEED") else None
+    )
+    QUOTE_BATCH_MAX_SIZE: int = int(os.getenv("QUOTE_BATCH_MAX_SIZE", "100"))
+    # 견적 계산 전용 프로세스 수 (0이면 프로세스 풀 없이 스레드풀에서 실행)
+    QUOTE_PROCESS_WORKERS: int = int(os.getenv("QUOTE_PROCESS_WORKERS", "2"))
+    # 대기 + 실행 중 견적 작업 상한 (초과 시 429)
+    QUOTE_MAX_PENDING: int = int(os.getenv("QUOTE_MAX_PENDING", "32"))
+
+    # 예약 일괄 등록 (/bookings/bulk)
+    BOOKING_BULK_MAX_SIZE: int = int(os.getenv("BOOKING_BULK_MAX_SIZE", "5000"))
+    # 트랜잭션 1개(= multi-row INSERT 1회)당 행 수
+    BOOKING_BULK_CHUNK_SIZE: int = int(os.getenv("BOOKING_BULK_CHUNK_SIZE", "500"))
+
+    # 예약 일괄 확정 (/bookings/confirm)
+    BOOKING_CONFIRM_BATCH_MAX_SIZE: int = int(
+        os.getenv("BOOKING_CONFIRM_BATCH_MAX_SIZE", "500")
+    )
+    # 벤더(항공/호텔) 호출 동시 실행 상한
+    CONFIRM_VENDOR_CONCURRENCY: int = int(os.getenv("CONFIRM_VENDOR_CONCURRENCY", "16"))
+    # 백그라운드 확정 작업 결과 보관 (개수, 초)
+    CONFIRM_JOB_MAX_ENTRIES: int = int(os.getenv("CONFIRM_JOB_MAX_ENTRIES", "1000"))
+    CONFIRM_JOB_TTL_SECONDS: float = float(os.getenv("CONFIRM_JOB_TTL_SECONDS", "3600"))
+
+    # PROCESSING 상태로 선점된 예약을 다른 요청이 다시 가져갈 수 있게 되는 시간 (초, 프로세스 중단 대비)
+    CONFIRM_CLAIM_TIMEOUT_SECONDS: int = int(
+        os.getenv("CONFIRM_CLAIM_TIMEOUT_SECONDS", "300")
+    )
+    # 단건 확정(/bookings/{id}/confirm)을 Outbox에 기록하고 202로 즉시 응답 (false면 벤더 호출까지 동기 처리)
+    CONFIRM_USE_OUTBOX: bool = os.getenv("CONFIRM_USE_OUTBOX", "true").lower() == "true"
+    # API 프로세스 안에서 Outbox 워커 실행 (별도 프로세스 scripts/outbox_worker.py로 돌리면 false)
+    OUTBOX_WORKER_ENABLED: bool = os.getenv("OUTBOX_WORKER_ENABLED", "true").lower() == "true"
+    # 워커 1회 처리 행 수 / 대기 행이 없을 때 폴링 간격 (초)
+    OUTBOX_BATCH_SIZE: int = int(os.getenv("OUTBOX_BATCH_SIZE", "100"))
+    OUTBOX_POLL_INTERVAL: float = float(os.getenv("OUTBOX_POLL_INTERVAL", "1.0"))
+    # 처리 중 워커가 중단되면 리스(초)가 지난 뒤 다른 워커가 다시 가져감
+    OUTBOX_LEASE_SECONDS: int = int(os.getenv("OUTBOX_LEASE_SECONDS", "60"))
+    # 재시도: 최대 시도 횟수, 지수 백오프 기준/상한 (초). 소진 시 예약은 PENDING으로 복귀
+    OUTBOX_MAX_ATTEMPTS: int = int(os.getenv("OUTBOX_MAX_ATTEMPTS", "5"))
+    OUTBOX_RETRY_BACKOFF: float = float(os.getenv("OUTBOX_RETRY_BACKOFF", "2.0"))
+    OUTBOX_RETRY_BACKOFF_MAX: float = float(os.getenv("OUTBOX_RETRY_BACKOFF_MAX", "300"))
+    # Idempotency-Key 결과 캐시 (개수, 초)
+    IDEMPOTENCY_CACHE_MAX_ENTRIES: int = int(
+        os.getenv("IDEMPOTENCY_CACHE_MAX_ENTRIES", "10000")
+    )
+    IDEMPOTENCY_TTL_SECONDS: float = float(os.getenv("IDEMPOTENCY_TTL_SECONDS", "3600"))
+
+    # 로깅 (app/core/logging_config.py)
+    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+    LOG_FORMAT: str = os.getenv("LOG_FORMAT", "json")  # json, text
+    # 요청마다 남는 대량 INFO 로그(extra=SAMPLED)의 기록 비율 (1.0이면 전부)
+    LOG_SAMPLE_RATE: float = float(os.getenv("LOG_SAMPLE_RATE", "1.0"))
+    # 접근 로그 (/health, /ready, /metrics 성공 응답은 제외)
+    ACCESS_LOG: bool = os.getenv("ACCESS_LOG", "true").lower() == "true"
+
+    # 응답 Fast-path: PII/예약 조회 응답을 response_model 재검증 없이 orjson으로 직렬화
+    RESPONSE_FAST_PATH: bool = os.getenv("RESPONSE_FAST_PATH", "true").lower() == "true"
 
     # 웹 서버 설정
     PORT: int = 8000
+    # 워커 프로세스 수 (gunicorn.conf.py). 0이면 컨테이너에 할당된 CPU 수
+    # 견적 프로세스 풀은 워커마다 생성되므로 총 프로세스 수는 워커 수 x QUOTE_PROCESS_WORKERS
+    WEB_CONCURRENCY: int = int(os.getenv("WEB_CONCURRENCY", "1"))
 
     # 온프레미스 서비스 주소 (VPN 내부 IP)
     ONPREM_SERVICE_URL: str = os.getenv("ONPREM_SERVICE_URL", "http://10.10.10.20:8000")
 
+    # 온프레미스 HTTP 클라이언트 (앱 수명 동안 공유되는 Keep-Alive Connection Pool)
+    ONPREM_HTTP2: bool = os.getenv("ONPREM_HTTP2", "false").lower() == "true"
+    ONPREM_MAX_CONNECTIONS: int = int(os.getenv("ONPREM_MAX_CONNECTIONS", "100"))
+    ONPREM_MAX_KEEPALIVE_CONNECTIONS: int = int(
+        os.getenv("ONPREM_MAX_KEEPALIVE_CONNECTIONS", "20")
+    )
+    ONPREM_KEEPALIVE_EXPIRY: float = float(os.getenv("ONPREM_KEEPALIVE_EXPIRY", "30"))
+    ONPREM_CONNECT_TIMEOUT: float = float(os.getenv("ONPREM_CONNECT_TIMEOUT", "2"))
+    ONPREM_TIMEOUT: float = float(os.getenv("ONPREM_TIMEOUT", "5"))  # read/write
+    ONPREM_POOL_TIMEOUT: float = float(os.getenv("ONPREM_POOL_TIMEOUT", "5"))
+
+    # 온프레미스 호출 보호 (장애 시 타임아웃까지 기다리지 않고 즉시 실패)
+    # 프로세스 전체 동시 호출 상한과 슬롯 대기 최대 시간 (초과 시 503)
+    ONPREM_MAX_CONCURRENCY: int = int(os.getenv("ONPREM_MAX_CONCURRENCY", "50"))
+    ONPREM_QUEUE_TIMEOUT: float = float(os.getenv("ONPREM_QUEUE_TIMEOUT", "1"))
+    # 네트워크 에러/5xx 재시도 횟수와 지터 백오프 기준 (초). 총 소요는 ONPREM_TIMEOUT 이내로 제한
+    ONPREM_RETRY_ATTEMPTS: int = int(os.getenv("ONPREM_RETRY_ATTEMPTS", "2"))
+    ONPREM_RETRY_BACKOFF: float = float(os.getenv("ONPREM_RETRY_BACKOFF", "0.1"))
+    # Circuit Breaker: 최근 WINDOW회 중 MIN_CALLS 이상 호출, 실패율 FAILURE_RATE 이상이면 OPEN_SECONDS 동안 차단
+    ONPREM_CIRCUIT_FAILURE_RATE: float = float(
+        os.getenv("ONPREM_CIRCUIT_FAILURE_RATE", "0.5")
+    )
+    ONPREM_CIRCUIT_WINDOW: int = int(os.getenv("ONPREM_CIRCUIT_WINDOW", "20"))
+    ONPREM_CIRCUIT_MIN_CALLS: int = int(os.getenv("ONPREM_CIRCUIT_MIN_CALLS", "10"))
+    ONPREM_CIRCUIT_OPEN_SECONDS: float = float(
+        os.getenv("ONPREM_CIRCUIT_OPEN_SECONDS", "10")
+    )
+
+    # Cloud 측 PII 캐시 (메모리 전용, LRU + 짧은 TTL)
+    PII_CACHE_ENABLED: bool = os.getenv("PII_CACHE_ENABLED", "true").lower() == "true"
+    PII_CACHE_MAX_ENTRIES: int = int(os.getenv("PII_CACHE_MAX_ENTRIES", "10000"))
+    PII_CACHE_TTL_SECONDS: float = float(os.getenv("PII_CACHE_TTL_SECONDS", "30"))
+
+    # PII 필드 암호화 (On-Prem, Envelope Encryption: 필드는 데이터 키로, 데이터 키는 KEK로 암호화)
+    # 데이터 키 발급/복호화: local (PII_MASTER_KEY로 래핑, KMS 대체) 또는 vault (Transit Engine)
+    PII_KEY_PROVIDER: str = os.getenv("PII_KEY_PROVIDER", "local")
+    # 기본값은 저장소에 공개된 값이므로 PII_ALLOW_DEFAULT_MASTER_KEY=true(로컬 개발)가 아니면 시작 시 실패
+    PII_MASTER_KEY: str = os.getenv("PII_MASTER_KEY", "my-pii-master-key")
+    PII_ALLOW_DEFAULT_MASTER_KEY: bool = (
+        os.getenv("PII_ALLOW_DEFAULT_MASTER_KEY", "false").lower() == "true"
+    )
+    PII_TRANSIT_KEY_NAME: str = os.getenv("PII_TRANSIT_KEY_NAME", "pii")
+    # email Blind Index용 HMAC 키 (미설정 시 PII_MASTER_KEY에서 파생). 바꾸면 기존 인덱스 재계산 필요
+    PII_BLIND_INDEX_KEY: Optional[str] = os.getenv("PII_BLIND_INDEX_KEY")
+    # 암호화용 데이터 키 교체 주기 (초, 사용 횟수): AES-GCM 랜덤 nonce 한도보다 충분히 작게 유지
+    PII_DATA_KEY_TTL_SECONDS: float = float(os.getenv("PII_DATA_KEY_TTL_SECONDS", "3600"))
+    PII_DATA_KEY_MAX_USES: int = int(os.getenv("PII_DATA_KEY_MAX_USES", "1000000"))
+    # 복호화용 데이터 키 캐시 크기 (이 안에서는 KEK 호출 없이 복호화)
+    PII_DATA_KEY_CACHE_SIZE: int = int(os.getenv("PII_DATA_KEY_CACHE_SIZE", "1024"))
+
+    # 클라우드 서비스 주소 (온프레미스 -> 클라우드 캐시 무효화 통지용, 미설정 시 통지 생략)
+    CLOUD_SERVICE_URL: Optional[str] = os.getenv("CLOUD_SERVICE_URL")
+
     # 내부 통신용 보안 토큰
     INTERNAL_API_TOKEN: str = os.getenv("INTERNAL_API_TOKEN", "my-secret-token")
+    # 호출자별 추가 토큰 ("batch-job:토큰,reporting:토큰"). INTERNAL_API_TOKEN은 호출자 "default"
+    INTERNAL_API_CALLERS: str = os.getenv("INTERNAL_API_CALLERS", "")
+
+    # 내부 PII API 호출자별 Rate Limit (토큰 버킷: 초당 RPS개 충전, 최대 BURST개) / 동시 요청 상한
+    # 토큰은 조회 건수 기준 (일괄 조회는 user_id 수만큼 차감, BURST보다 큰 요청은 BURST만큼)
+    INTERNAL_RATE_LIMIT_ENABLED: bool = (
+        os.getenv("INTERNAL_RATE_LIMIT_ENABLED", "true").lower() == "true"
+    )
+    INTERNAL_RATE_LIMIT_RPS: float = float(os.getenv("INTERNAL_RATE_LIMIT_RPS", "200"))
+    INTERNAL_RATE_LIMIT_BURST: int = int(os.getenv("INTERNAL_RATE_LIMIT_BURST", "400"))
+    # 호출자 하나가 동시에 처리 중일 수 있는 요청 수 (프로세스 단위, DB Pool 크기 이하로 설정)
+    INTERNAL_MAX_CONCURRENCY_PER_CALLER: int = int(
+        os.getenv("INTERNAL_MAX_CONCURRENCY_PER_CALLER", "4")
+    )
+    # 주 호출자(클라우드 서비스, INTERNAL_API_TOKEN = "default")의 별도 한도.
+    # 클라우드는 워커마다 최대 ONPREM_MAX_CONCURRENCY개를 동시에 호출하므로 동시 요청 상한은 그 이상으로 둠
+    # (슬롯은 응답 전송 후 반납되므로 2배 여유. 클라우드 워커가 여럿이면 워커 수에 맞춰 조정).
+    # 토큰 버킷은 RPS가 0이면 적용하지 않음 (클라우드 측 동시 호출 상한/Circuit Breaker로 이미 제한됨)
+    INTERNAL_DEFAULT_CALLER_RATE_LIMIT_RPS: float = float(
+        os.getenv("INTERNAL_DEFAULT_CALLER_RATE_LIMIT_RPS", "0")
+    )
+    INTERNAL_DEFAULT_CALLER_RATE_LIMIT_BURST: int = int(
+        os.getenv("INTERNAL_DEFAULT_CALLER_RATE_LIMIT_BURST", "0")
+    )
+    INTERNAL_DEFAULT_CALLER_MAX_CONCURRENCY: int = int(
+        os.getenv("INTERNAL_DEFAULT_CALLER_MAX_CONCURRENCY", str(ONPREM_MAX_CONCURRENCY * 2))
+    )
+    # 토큰 버킷 저장소: memory (프로세스 단위) 또는 redis (워커/호스트 간 공유, redis 패키지 필요)
+    RATE_LIMIT_BACKEND: str = os.getenv("RATE_LIMIT_BACKEND", "memory")
+    RATE_LIMIT_REDIS_URL: str = os.getenv("RATE_LIMIT_REDIS_URL", "redis://localhost:6379/0")
 
-    def __init__(self, **values):
-        super().__init__(**values)
-        self._load_db_config()
+    # PII 일괄 조회 (/pii/internal/batch) 1회 요청당 최대 user_id 수
+    PII_BATCH_MAX_SIZE: int = int(os.getenv("PII_BATCH_MAX_SIZE", "500"))
+    # 일괄 조회 청크를 온프레미스로 동시에 보내는 상한 (VPN/온프레미스 DB 보호)
+    PII_BATCH_CONCURRENCY: int = int(os.getenv("PII_BATCH_CONCURRENCY", "4"))
 
-    def _load_db_config(self):
-        """환경에 따라 DB 접속 정보를 동적으로 로드"""
+    @property
+    def web_workers(self) -> int:
+        """실제 워커 수 (WEB_CONCURRENCY=0이면 CPU 할당량 기준)"""
+        if self.WEB_CONCURRENCY > 0:
+            return self.WEB_CONCURRENCY
+        return _available_cpus()
+
+    def _load_db_config(self, force_refresh: bool = False):
+        """
+        환경에 따라 DB 접속 정보를 동적으로 로드 (force_refresh: Secret 캐시 무시).
+        임포트 시점이 아닌 첫 DB 초기화 시점에 database 모듈이 호출 (시작 지연 방지).
+        """
         if not self.IS_ONPREM:
             # [Cloud] AWS Secrets Manager 사용
             if self.DB_SECRET_ARN:
                 try:
                     from app.core.aws_secrets import get_secret
 
-                    secrets = get_secret(self.DB_SECRET_ARN, self.AWS_REGION)
+                    secrets = get_secret(
+                        self.DB_SECRET_ARN,
+                        self.AWS_REGION,
+                        force_refresh=force_refresh,
+                        ttl_seconds=self.AWS_SECRET_CACHE_TTL,
+                    )
                     # Terraform이 저장한 JSON 키: username, password, host, port, dbname
                     user = secrets["username"]
                     password = secrets["password"]
@@ -61,6 +271,9 @@ class Settings(BaseSettings):
                     self.DATABASE_URL = (
                         f"mysql+pymysql://{user}:{password}@{host}:{port}/{dbname}"
                     )
+                    # Aurora Reader 엔드포인트 (Terraform이 저장한 경우, 환경 변수가 우선)
+                    if not self.DB_READER_HOSTS and secrets.get("reader_host"):
+                        self.DB_READER_HOSTS = secrets["reader_host"]
                     logger.info(
                         "✅ [Config] Cloud Mode: Loaded DB credentials from AWS Secrets Manager"
                     )
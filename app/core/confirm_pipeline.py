@@ -0,0 +1,363 @@
+import asyncio
+import logging
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional
+from fastapi import HTTPException
+from sqlalchemy import and_, bindparam, exists, func, or_, select, text, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.cache import AsyncTTLCache, get_pii_batch_cached
+from app.core.config import settings
+from app.core.database import async_session_scope
+from app.core.logging_config import SAMPLED
+from app.models import booking as models
+
+logger = logging.getLogger("uvicorn")
+
+
+async def execute_vendor_booking(booking: models.Booking, pii_data: dict) -> str:
+    """
+    Mock Business Logic (여권번호 + 일정으로 벤더 예약 수행).
+    배정된 호텔 이름을 반환. 실제 벤더 연동 시 이 함수만 비동기 HTTP 호출로 교체.
+    """
+    passport = pii_data.get("passport_no", "UNKNOWN")
+
+    # 로그에는 여권번호 뒤 3자리만 남김 (PII 원문은 벤더 호출에만 사용)
+    logger.info(
+        "✈️ [MOCK EXECUTION] Booking #%s sent to Airline/Hotel Vendor API... SUCCESS",
+        booking.booking_id,
+        extra={
+            **SAMPLED,
+            "booking_id": booking.booking_id,
+            "destination": booking.destination,
+            "departure_date": str(booking.departure_date),
+            "arrival_date": str(booking.arrival_date),
+            "passport_suffix": passport[-3:],
+        },
+    )
+
+    return f"Hilton {booking.destination} (Auto-Assigned)"
+
+
+# -----------------------------------------------------------------------------
+# 선점 (PENDING -> PROCESSING): 동시 확정 요청 중 하나만 온프레미스/벤더를 호출
+# -----------------------------------------------------------------------------
+def _stale_before(db: AsyncSession):
+    """
+    DB 시각 기준 CONFIRM_CLAIM_TIMEOUT_SECONDS 전.
+    updated_at은 DB의 now()로 기록되므로 애플리케이션 시계가 아닌 DB 시계/세션 시간대로 비교.
+    """
+    seconds = int(settings.CONFIRM_CLAIM_TIMEOUT_SECONDS)
+    if db.bind.dialect.name == "sqlite":
+        return func.datetime("now", f"-{seconds} seconds")
+    return func.date_sub(func.now(), text(f"INTERVAL {seconds} SECOND"))  # MySQL/Aurora
+
+
+def _claimable(db: AsyncSession):
+    """
+    선점 가능 조건: PENDING, 또는 CONFIRM_CLAIM_TIMEOUT_SECONDS 넘게 방치된 PROCESSING.
+    처리 대기 중인 Outbox 행이 있는 PROCESSING은 워커가 처리하므로 오래돼도 가져가지 않음.
+    """
+    return or_(
+        models.Booking.status == "PENDING",
+        and_(
+            models.Booking.status == "PROCESSING",
+            models.Booking.updated_at < _stale_before(db),
+            ~exists().where(
+                models.VendorOutbox.booking_id == models.Booking.booking_id,
+                models.VendorOutbox.status == "PENDING",
+            ),
+        ),
+    )
+
+
+async def claim_booking(db: AsyncSession, booking_id: int) -> bool:
+    """
+    조건부 UPDATE 한 문장으로 선점 후 커밋. 영향 행이 1이면 이 요청이 확정 권한을 가짐.
+    (읽고-검사하고-쓰는 사이에 다른 요청이 끼어들 틈이 없음)
+    """
+    result = await db.execute(
+        update(models.Booking)
+        .where(models.Booking.booking_id == booking_id, _claimable(db))
+        .values(status="PROCESSING")
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    return result.rowcount == 1
+
+
+async def enqueue_confirmation(db: AsyncSession, booking_id: int) -> bool:
+    """
+    선점 + vendor_outbox INSERT를 커밋 1회로 수행 (벤더 호출은 Outbox 워커가 수행).
+    둘 중 하나만 커밋되는 일이 없으므로 Outbox로 선점된 PROCESSING 예약은 항상 처리할 행을 가짐.
+    """
+    result = await db.execute(
+        update(models.Booking)
+        .where(models.Booking.booking_id == booking_id, _claimable(db))
+        .values(status="PROCESSING")
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount != 1:
+        await db.rollback()
+        return False
+
+    db.add(
+        models.VendorOutbox(
+            booking_id=booking_id, next_attempt_at=datetime.now(timezone.utc).replace(tzinfo=None)
+        )
+    )
+    await db.commit()
+    return True
+
+
+async def claim_bookings(db: AsyncSession, booking_ids: List[int]) -> List[models.Booking]:
+    """
+    일괄 선점 후 커밋. 선점한 예약 목록을 반환.
+    - UPDATE ... RETURNING 지원 DB (SQLite, MariaDB 등): 조건부 UPDATE 한 문장으로 선점
+    - MySQL: SELECT ... FOR UPDATE SKIP LOCKED로 다른 트랜잭션이 잡고 있는 행은 건너뛰고
+      잠근 행만 PROCESSING으로 변경
+    """
+    claim = (
+        update(models.Booking)
+        .where(models.Booking.booking_id.in_(booking_ids), _claimable(db))
+        .values(status="PROCESSING")
+    )
+
+    if db.bind.dialect.update_returning:
+        rows = await db.execute(
+            claim.returning(models.Booking),
+            execution_options={"synchronize_session": False},
+        )
+        claimed = list(rows.scalars())
+    else:
+        rows = await db.execute(
+            select(models.Booking)
+            .where(models.Booking.booking_id.in_(booking_ids), _claimable(db))
+            .with_for_update(skip_locked=True)
+        )
+        claimed = list(rows.scalars())
+        if claimed:
+            await db.execute(
+                claim.where(
+                    models.Booking.booking_id.in_([b.booking_id for b in claimed])
+                ).execution_options(synchronize_session=False)
+            )
+    await db.commit()
+    return claimed
+
+
+async def release_claims(db: AsyncSession, booking_ids: Iterable[int]):
+    """실패한 예약을 PENDING으로 되돌려 재시도 가능하게 함 (커밋은 호출자가 수행)"""
+    booking_ids = list(booking_ids)
+    if booking_ids:
+        await db.execute(
+            update(models.Booking)
+            .where(
+                models.Booking.booking_id.in_(booking_ids),
+                models.Booking.status == "PROCESSING",
+            )
+            .values(status="PENDING")
+            .execution_options(synchronize_session=False)
+        )
+
+
+async def mark_confirmed(db: AsyncSession, confirmed: List[dict]) -> Dict[int, Optional[str]]:
+    """
+    벤더 호출에 성공한 예약({"booking_id", "hotel_name"})을 CONFIRMED로 변경 (커밋은 호출자가 수행).
+    PK + PROCESSING 조건 executemany이므로 선점 시간 초과 후 다른 요청이 다시 가져가 상태를 바꾼 예약은
+    덮어쓰지 않음. 반영되지 않은 예약의 booking_id -> 현재 상태를 반환.
+    """
+    if not confirmed:
+        return {}
+    table = models.Booking.__table__
+    result = await db.execute(
+        update(table)
+        .where(table.c.booking_id == bindparam("b_booking_id"), table.c.status == "PROCESSING")
+        .values(status="CONFIRMED", hotel_name=bindparam("b_hotel_name")),
+        [{"b_booking_id": r["booking_id"], "b_hotel_name": r["hotel_name"]} for r in confirmed],
+    )
+    if db.bind.dialect.supports_sane_multi_rowcount and result.rowcount == len(confirmed):
+        return {}
+
+    # 일부가 조건에 맞지 않았거나 드라이버가 executemany 영향 행 수를 주지 않음: 현재 상태로 확인
+    rows = await db.execute(
+        select(models.Booking.booking_id, models.Booking.status, models.Booking.hotel_name).where(
+            models.Booking.booking_id.in_([r["booking_id"] for r in confirmed])
+        )
+    )
+    current = {booking_id: (status, hotel_name) for booking_id, status, hotel_name in rows}
+    lost = {
+        r["booking_id"]: current.get(r["booking_id"], (None, None))[0]
+        for r in confirmed
+        if current.get(r["booking_id"]) != ("CONFIRMED", r["hotel_name"])
+    }
+    if lost:
+        logger.warning(
+            "⚠️ [Booking] %d booking(s) changed by another claimant before confirm: %s",
+            len(lost),
+            sorted(lost),
+        )
+    return lost
+
+
+def _result(booking_id: int, outcome: str, status: Optional[str] = None, **extra) -> dict:
+    return dict(booking_id=booking_id, outcome=outcome, status=status, **extra)
+
+
+async def confirm_bookings(db: AsyncSession, booking_ids: List[int]) -> dict:
+    """
+    예약 일괄 확정 파이프라인.
+    1. 확정 가능한 예약을 일괄 선점 (PENDING -> PROCESSING)
+    2. user_id 중복 제거 후 PII 일괄 조회 (캐시 Hit 제외, 청크 단위 동시 호출)
+    3. 벤더 호출을 CONFIRM_VENDOR_CONCURRENCY 상한으로 동시 실행
+    4. 성공 건은 CONFIRMED, 실패 건은 PENDING으로 UPDATE 후 커밋 1회
+    결과는 booking_id 입력 순서대로 건별 outcome을 포함.
+    """
+    booking_ids = list(dict.fromkeys(booking_ids))
+    results: Dict[int, dict] = {}
+
+    # 1. 선점 (Aurora). 선점하지 못한 예약만 상태를 다시 읽어 사유 분류
+    pending = await claim_bookings(db, booking_ids)
+    claimed_ids = {booking.booking_id for booking in pending}
+
+    unclaimed = [booking_id for booking_id in booking_ids if booking_id not in claimed_ids]
+    if unclaimed:
+        rows = await db.execute(
+            select(models.Booking).where(models.Booking.booking_id.in_(unclaimed))
+        )
+        bookings = {booking.booking_id: booking for booking in rows.scalars()}
+        for booking_id in unclaimed:
+            booking = bookings.get(booking_id)
+            if booking is None:
+                results[booking_id] = _result(booking_id, "not_found")
+            elif booking.status == "CONFIRMED":
+                results[booking_id] = _result(
+                    booking_id, "already_confirmed", booking.status, hotel_name=booking.hotel_name
+                )
+            elif booking.status in ("PENDING", "PROCESSING"):
+                # 다른 요청이 잠금/선점 중
+                results[booking_id] = _result(booking_id, "in_progress", "PROCESSING")
+            else:
+                results[booking_id] = _result(booking_id, "invalid_status", booking.status)
+
+    # 2. PII Fan-in (중복 user_id는 1회만 조회)
+    pii_by_user: Dict[str, Optional[dict]] = {}
+    pii_error: Optional[str] = None
+    if pending:
+        try:
+            pii_by_user = await get_pii_batch_cached(b.user_id for b in pending)
+        except HTTPException as exc:
+            pii_error = exc.detail
+            logger.error("❌ [Booking] Batch PII fetch failed: %s", exc.detail)
+
+    # 3. 벤더 호출 (동시 실행 상한)
+    semaphore = asyncio.Semaphore(settings.CONFIRM_VENDOR_CONCURRENCY)
+
+    async def run_vendor(booking: models.Booking):
+        pii_data = pii_by_user.get(booking.user_id)
+        if pii_error is not None:
+            return booking, None, ("pii_unavailable", pii_error)
+        if pii_data is None:
+            return booking, None, ("pii_not_found", "User PII not found")
+        async with semaphore:
+            try:
+                return booking, await execute_vendor_booking(booking, pii_data), None
+            except Exception as exc:
+                logger.error("❌ [Booking] Vendor call failed for #%s: %s", booking.booking_id, exc)
+                return booking, None, ("vendor_failed", str(exc))
+
+    confirmed = []
+    for booking, hotel_name, error in await asyncio.gather(*(run_vendor(b) for b in pending)):
+        if error is not None:
+            outcome, detail = error
+            results[booking.booking_id] = _result(
+                booking.booking_id, outcome, "PENDING", detail=detail
+            )
+        else:
+            confirmed.append({"booking_id": booking.booking_id, "hotel_name": hotel_name})
+    failed_ids = claimed_ids - {row["booking_id"] for row in confirmed}
+
+    # 4. 상태 일괄 업데이트 (PK + PROCESSING 조건 executemany + 실패 건 선점 해제, 커밋 1회)
+    try:
+        lost = await mark_confirmed(db, confirmed)
+        await release_claims(db, failed_ids)
+        await db.commit()
+    except SQLAlchemyError as exc:
+        await db.rollback()
+        logger.error("❌ [Booking] Bulk status update failed: %s", exc)
+        for row in confirmed:
+            results[row["booking_id"]] = _result(
+                row["booking_id"], "commit_failed", "PROCESSING", detail=str(exc)
+            )
+    else:
+        for row in confirmed:
+            if row["booking_id"] in lost:
+                # 선점 시간 초과로 다른 요청이 가져간 예약 (벤더 결과를 반영하지 않음)
+                results[row["booking_id"]] = _result(
+                    row["booking_id"], "claim_lost", lost[row["booking_id"]]
+                )
+            else:
+                results[row["booking_id"]] = _result(
+                    row["booking_id"], "confirmed", "CONFIRMED", hotel_name=row["hotel_name"]
+                )
+
+    ordered = [results[booking_id] for booking_id in booking_ids]
+    succeeded = sum(r["outcome"] in ("confirmed", "already_confirmed") for r in ordered)
+    logger.info("✅ [Booking] Batch confirm: %d/%d succeeded", succeeded, len(ordered))
+    return {
+        "total": len(ordered),
+        "succeeded": succeeded,
+        "failed": len(ordered) - succeeded,
+        "results": ordered,
+    }
+
+
+# -----------------------------------------------------------------------------
+# 백그라운드 작업 모드 (요청은 즉시 202, 결과는 job_id로 조회)
+# -----------------------------------------------------------------------------
+confirm_jobs = AsyncTTLCache(
+    "confirm_jobs",
+    max_entries=settings.CONFIRM_JOB_MAX_ENTRIES,
+    ttl_seconds=settings.CONFIRM_JOB_TTL_SECONDS,
+)
+_job_tasks = set()  # 실행 중 태스크 참조 유지 (GC 방지, 종료 시 취소)
+
+
+async def _run_confirm_job(job: dict, booking_ids: List[int]):
+    try:
+        async with async_session_scope() as db:
+            job["result"] = await confirm_bookings(db, booking_ids)
+        job["status"] = "completed"
+    except Exception as exc:
+        logger.error("❌ [Booking] Confirm job %s failed: %s", job["job_id"], exc)
+        job["status"] = "failed"
+        job["error"] = str(exc)
+
+
+def start_confirm_job(booking_ids: List[int]) -> dict:
+    job = {
+        "job_id": uuid.uuid4().hex,
+        "status": "running",
+        "total": len(set(booking_ids)),
+        "result": None,
+        "error": None,
+    }
+    confirm_jobs.set(job["job_id"], job)
+
+    task = asyncio.create_task(_run_confirm_job(job, booking_ids))
+    _job_tasks.add(task)
+    task.add_done_callback(_job_tasks.discard)
+    return job
+
+
+def get_confirm_job(job_id: str) -> Optional[dict]:
+    return confirm_jobs.get(job_id)
+
+
+async def shutdown_confirm_jobs():
+    """FastAPI lifespan 종료 시 호출: 실행 중인 확정 작업 취소"""
+    for task in list(_job_tasks):
+        task.cancel()
+    if _job_tasks:
+        await asyncio.gather(*_job_tasks, return_exceptions=True)
@@ -1,10 +1,26 @@
+import asyncio
 import logging
 import threading
-from sqlalchemy import create_engine, text
+import time
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import List, Optional, Tuple
+from fastapi import HTTPException
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
-from sqlalchemy.exc import OperationalError
-from app.core.security import get_db_credentials
+from app.core.aws_secrets import clear_secret_cache
+from app.core.security import get_credential_provider, get_db_credentials
 from app.core.config import settings
+from app.core.metrics import (
+    DB_POOL_WAITERS,
+    DB_READ_SESSIONS,
+    DB_REPLICA_LAG,
+    STARTUP_DURATION,
+    timed,
+)
 
 logger = logging.getLogger("uvicorn")
 
@@ -12,100 +28,593 @@ logger = logging.getLogger("uvicorn")
 Base = declarative_base()
 
 # 전역 변수
-_engine = None
-_SessionLocal = None
-_pool_lock = threading.Lock()  # 스레드 경합 방지용 락
+_pool = None  # 현재 사용 중인 DatabasePool (Rotation 시 원자적으로 교체)
+_pool_lock = threading.Lock()  # 스레드 경합 방지용 락 (최초 생성/교체 순간에만 보유)
+_background_tasks = set()  # Drain/Refresh 태스크 참조 유지 (GC 방지)
+_refresher_task = None
+_init_task: Optional[asyncio.Task] = None  # 시작 시 백그라운드 초기화 (Pool 생성 + 테이블 생성)
+_replica_monitor_task: Optional[asyncio.Task] = None  # 리더 복제 지연 측정
+_reader_cursor = 0  # 리더 Round-Robin 위치
+
+# 가장 최근에 조회한 Credential. 설정되면 이후 생성되는 모든 연결(sync/async, Drain 중인
+# 이전 Pool 포함)이 이 정보로 접속함.
+_credentials_url: Optional[URL] = None
+_credentials_lease = 0  # Credential 유효 기간 (초, 0이면 만료 정보 없음)
+_credentials_fetched_at = 0.0
+_credential_lock = threading.Lock()
+_credential_generation = 0  # 갱신 횟수 (동시 갱신 요청 병합용)
+
+# MySQL 인증 에러 코드: 1045 (Access Denied), 1044 (DB Access Denied)
+_AUTH_ERROR_CODES = (1045, 1044)
+
+# 동기 드라이버 -> 비동기 드라이버 매핑
+_ASYNC_DRIVERS = {
+    "mysql": "mysql+aiomysql",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def _fetch_database_url(refresh: bool = False) -> Tuple[str, int]:
+    """
+    DATABASE_URL과 Credential 유효 기간(초)을 결정.
+    - Cloud 환경: settings.DATABASE_URL (최초 호출 시 AWS Secrets Manager에서 로드, refresh 시 재조회)
+    - On-Prem 환경: Vault에서 Credential을 조회하여 CONNECTION_STRING 생성
+    """
+    if not settings.DATABASE_URL or (refresh and settings.DB_SECRET_ARN):
+        # Settings 생성(임포트) 시점이 아닌 첫 DB 초기화 시점에 Secret 조회
+        settings._load_db_config(force_refresh=refresh)
+
+    if settings.DATABASE_URL:
+        # Cloud 모드: 이미 config.py에서 로드됨
+        logger.info("☁️ [Database] Using Cloud Mode (AWS Secrets Manager)")
+        return settings.DATABASE_URL, 0
+
+    # On-Prem 모드: Vault에서 조회
+    creds = get_db_credentials(force_refresh=refresh)
+    logger.info("🏢 [Database] Using On-Premise Mode (Vault)")
+    if not settings.DB_READER_HOSTS and creds.get("reader_hosts"):
+        settings.DB_READER_HOSTS = creds["reader_hosts"]
+    url = f"mysql+pymysql://{creds['user']}:{creds['password']}@{creds['host']}:{creds['port']}/{creds['db']}"
+    return url, creds.get("lease_duration", 0)
+
+
+def _can_refresh_credentials() -> bool:
+    """정적 DATABASE_URL만 설정된 경우 갱신할 Credential 원천이 없음"""
+    if settings.IS_ONPREM:
+        return not settings.DATABASE_URL
+    return bool(settings.DB_SECRET_ARN)
+
+
+def _set_credentials(database_url: str, lease: int):
+    global _credentials_url, _credentials_lease, _credentials_fetched_at, _credential_generation
+    _credentials_url = make_url(database_url)
+    _credentials_lease = lease
+    _credentials_fetched_at = time.monotonic()
+    _credential_generation += 1
+
+
+def _refresh_credentials(seen_generation: Optional[int] = None) -> URL:
+    """
+    Credential 원천을 다시 조회하여 최신 Credential로 교체.
+    seen_generation 이후 다른 스레드가 이미 갱신했다면 재조회 없이 그 결과를 사용.
+    """
+    with _credential_lock:
+        if seen_generation is None or seen_generation == _credential_generation:
+            _set_credentials(*_fetch_database_url(refresh=True))
+        return _credentials_url
+
+
+def _to_async_url(database_url):
+    """mysql+pymysql:// 등 동기 URL을 비동기 드라이버 URL로 변환"""
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if backend not in _ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for '{backend}'")
+    return url.set(drivername=_ASYNC_DRIVERS[backend])
+
+
+def _endpoint_url(url: URL, endpoint: Optional[str]) -> URL:
+    """리더 엔드포인트(host[:port])로 host/port만 바꾼 URL (Credential은 Writer와 공유)"""
+    if not endpoint or url.get_backend_name() == "sqlite":
+        return url
+    host, _, port = endpoint.partition(":")
+    return url.set(host=host, port=int(port) if port else url.port)
+
+
+def _reader_endpoints() -> List[str]:
+    return [host.strip() for host in settings.DB_READER_HOSTS.split(",") if host.strip()]
+
+
+def _connect_with_credential_refresh(dialect, conn_rec, cargs, cparams, endpoint=None):
+    """
+    [do_connect 이벤트] 실제 DB 연결 생성 시점에서 인증 실패(1044/1045)를 감지.
+    Credential을 갱신한 뒤 같은 연결 시도를 1회 투명하게 재시도하므로
+    요청마다 별도의 SELECT 1 프로브를 보낼 필요가 없음.
+    (MySQL은 이미 인증된 세션은 비밀번호가 바뀌어도 유지되므로 인증 실패는 연결 생성 시에만 발생)
+    endpoint: 리더 엔진이면 해당 리더의 host[:port] (Credential 갱신은 Writer와 공유)
+    """
+    if _credentials_url is not None:
+        cparams.update(dialect.create_connect_args(_endpoint_url(_credentials_url, endpoint))[1])
+
+    generation = _credential_generation
+    try:
+        return dialect.connect(*cargs, **cparams)
+    except dialect.loaded_dbapi.OperationalError as e:
+        error_code = e.args[0] if e.args else 0
+        if error_code not in _AUTH_ERROR_CODES or not _can_refresh_credentials():
+            raise
+
+        logger.warning(
+            f"⚠️ [Database] Authentication failed (error: {error_code}). Refreshing credentials..."
+        )
+        new_url = _refresh_credentials(seen_generation=generation)
+
+        cparams.update(dialect.create_connect_args(_endpoint_url(new_url, endpoint))[1])
+        return dialect.connect(*cargs, **cparams)
+
+
+def _checked_out(pool) -> int:
+    # QueuePool 계열만 checkedout()을 제공 (StaticPool 등은 0으로 취급)
+    checkedout = getattr(pool, "checkedout", None)
+    return checkedout() if checkedout else 0
+
+
+def _queue_pool_status(pool) -> dict:
+    # overflow()는 pool_size 미만일 때 음수이므로 실제 초과 연결 수로 보정
+    if not hasattr(pool, "overflow"):
+        return {"size": 0, "checked_out": 0, "checked_in": 0, "overflow": 0}
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+    }
+
+
+# sync 엔진(테이블 생성/관리 스크립트용) Pool 크기: 요청 경로는 async 엔진만 쓰므로 1개로 고정
+_SYNC_POOL_SIZE = 1
+
+
+def pool_limits() -> Tuple[int, int]:
+    """
+    워커(프로세스)당 async 엔진의 (pool_size, max_overflow).
+    DB_MAX_CONNECTIONS가 설정되면 워커 수로 나눈 몫에서 sync 엔진 몫(_SYNC_POOL_SIZE)을 뺀 범위 안에서
+    pool_size를 우선 채우고 나머지를 overflow로 할당.
+    (Aurora max_connections를 태스크 수 x 워커 수가 넘지 않도록 컨테이너 단위 예산으로 관리)
+    - 리더는 별도 인스턴스이므로 리더마다 같은 예산을 따로 사용 (Writer 예산에는 포함되지 않음)
+    - Credential Rotation 중에는 이전 Pool이 Drain될 때까지(DB_POOL_DRAIN_TIMEOUT 이내) 연결 수가 일시적으로 최대 2배
+    """
+    pool_size, max_overflow = settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW
+    if settings.DB_MAX_CONNECTIONS > 0:
+        per_worker = max(settings.DB_MAX_CONNECTIONS // settings.web_workers - _SYNC_POOL_SIZE, 1)
+        pool_size = min(pool_size, per_worker)
+        max_overflow = min(max_overflow, per_worker - pool_size)
+    return pool_size, max_overflow
+
+
+class _Reader:
+    """리더(Replica) 1대의 async 엔진 + 마지막으로 측정한 복제 지연 상태"""
+
+    def __init__(self, endpoint: str, database_url, pool_options: dict):
+        self.endpoint = endpoint
+        self.async_engine = create_async_engine(
+            _to_async_url(_endpoint_url(make_url(database_url), endpoint)), **pool_options
+        )
+        event.listen(
+            self.async_engine.sync_engine,
+            "do_connect",
+            partial(_connect_with_credential_refresh, endpoint=endpoint),
+        )
+        self.AsyncSessionLocal = async_sessionmaker(
+            bind=self.async_engine, autoflush=False, expire_on_commit=False
+        )
+        # 첫 지연 측정 전까지는 Writer 사용 (지연을 모르는 리더로 보내지 않음)
+        self.lag: Optional[float] = None
+        self.healthy = False
+        self.checked = False
+
+
+class DatabasePool:
+    """
+    동일 Credential로 생성한 sync/async 엔진 묶음 (+ 리더별 async 엔진).
+    Credential Rotation 시 이 단위로 통째로 교체하고, 이전 Pool은 Drain 후 정리.
+    요청 경로는 async 엔진만 사용 (sync 엔진은 테이블 생성/관리 스크립트용).
+    """
+
+    def __init__(self, database_url):
+        pool_size, max_overflow = pool_limits()
+        pool_options = dict(
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=30,  # 연결 대기 타임아웃 (초)
+            pool_recycle=1800,  # 연결 재활용 주기 (30분, MySQL wait_timeout 대응)
+            pool_pre_ping=True,  # 연결 전 Ping 테스트 (Stale Connection 방지)
+        )
+
+        # Connection Pool이 포함된 엔진 생성 (연결은 첫 사용 시 생성)
+        self.engine = create_engine(
+            database_url, **dict(pool_options, pool_size=_SYNC_POOL_SIZE, max_overflow=0)
+        )
+        self.async_engine = create_async_engine(
+            _to_async_url(database_url), **pool_options
+        )
+        for sync_engine in (self.engine, self.async_engine.sync_engine):
+            event.listen(sync_engine, "do_connect", _connect_with_credential_refresh)
+        # 리더는 다른 인스턴스이므로 Writer와 같은 Pool 예산을 각각 사용
+        self.readers = [
+            _Reader(endpoint, database_url, pool_options) for endpoint in _reader_endpoints()
+        ]
+
+        self.SessionLocal = sessionmaker(
+            autocommit=False, autoflush=False, bind=self.engine
+        )
+        self.AsyncSessionLocal = async_sessionmaker(
+            bind=self.async_engine, autoflush=False, expire_on_commit=False
+        )
+
+    def checked_out(self) -> int:
+        """현재 사용 중(checked-out)인 연결 수 (sync + async + 리더)"""
+        return (
+            _checked_out(self.engine.pool)
+            + _checked_out(self.async_engine.sync_engine.pool)
+            + sum(_checked_out(r.async_engine.sync_engine.pool) for r in self.readers)
+        )
+
+    def status(self) -> dict:
+        """엔진별 Pool 상태 (메트릭 노출용)"""
+        status = {
+            "sync": _queue_pool_status(self.engine.pool),
+            "async": _queue_pool_status(self.async_engine.sync_engine.pool),
+        }
+        for reader in self.readers:
+            status[f"reader:{reader.endpoint}"] = _queue_pool_status(
+                reader.async_engine.sync_engine.pool
+            )
+        return status
+
+    async def dispose(self):
+        await asyncio.to_thread(self.engine.dispose)
+        await self.async_engine.dispose()
+        for reader in self.readers:
+            await reader.async_engine.dispose()
 
 
 def _init_db_pool():
     """
-    DB 접속 정보를 가져오고 Connection Pool 생성.
-    - Cloud 환경: settings.DATABASE_URL이 이미 설정됨 (config.py에서 AWS Secrets Manager에서 로드)
+    DB 접속 정보를 가져오고 Connection Pool 생성 (최초 1회, Lazy Initialization).
+    - Cloud 환경: settings.DATABASE_URL 또는 AWS Secrets Manager에서 로드
     - On-Prem 환경: Vault에서 Credential을 조회하여 CONNECTION_STRING 생성
-    기존 Pool이 있으면 정리 후 새로 생성 (비밀번호 Rotation 대응).
+    이후 Credential 교체는 rotate_db_pool()이 무중단으로 처리.
     """
-    global _engine, _SessionLocal
+    global _pool
 
-    # 락을 걸어 중복 갱신 방지
+    # 락을 걸어 중복 생성 방지
     with _pool_lock:
-        # 기존 엔진이 있다면 연결 종료 (리소스 정리)
-        if _engine is not None:
-            logger.info("🔄 [Database] Disposing old connection pool...")
-            _engine.dispose()
+        if _pool is not None:
+            return _pool
 
         try:
-            # DATABASE_URL 결정
-            if settings.DATABASE_URL:
-                # Cloud 모드: 이미 config.py에서 로드됨
-                DATABASE_URL = settings.DATABASE_URL
-                logger.info("☁️ [Database] Using Cloud Mode (AWS Secrets Manager)")
-            else:
-                # On-Prem 모드: Vault에서 조회
-                creds = get_db_credentials()
-                DATABASE_URL = f"mysql+pymysql://{creds['user']}:{creds['password']}@{creds['host']}:{creds['port']}/{creds['db']}"
-                logger.info("🏢 [Database] Using On-Premise Mode (Vault)")
-
-            # Connection Pool이 포함된 엔진 생성
-            _engine = create_engine(
-                DATABASE_URL,
-                pool_size=settings.DB_POOL_SIZE,
-                max_overflow=settings.DB_MAX_OVERFLOW,
-                pool_timeout=30,  # 연결 대기 타임아웃 (초)
-                pool_recycle=1800,  # 연결 재활용 주기 (30분, MySQL wait_timeout 대응)
-                pool_pre_ping=True,  # 연결 전 Ping 테스트 (Stale Connection 방지)
-            )
-            _SessionLocal = sessionmaker(
-                autocommit=False, autoflush=False, bind=_engine
+            with _credential_lock:
+                if _credentials_url is None:
+                    _set_credentials(*_fetch_database_url())
+                database_url = _credentials_url
+
+            _pool = DatabasePool(database_url)
+            pool_size, max_overflow = pool_limits()
+            logger.info(
+                f"✅ [Database] Connection Pool initialized successfully "
+                f"(pool_size={pool_size}, max_overflow={max_overflow}, readers={len(_pool.readers)})."
             )
-            logger.info("✅ [Database] Connection Pool initialized successfully.")
+            return _pool
 
         except Exception as e:
             logger.error(f"❌ [Database] Failed to initialize pool: {str(e)}")
             raise e
 
 
-def get_db_session():
+def get_pool_status() -> dict:
+    """현재 Pool 상태. 아직 생성되지 않았으면 빈 dict (스크레이프가 Pool을 만들지 않도록)"""
+    pool = _pool
+    return pool.status() if pool is not None else {}
+
+
+def _get_pool() -> DatabasePool:
+    pool = _pool
+    if pool is None:
+        pool = _init_db_pool()
+    return pool
+
+
+async def _drain_pool(old_pool: DatabasePool):
+    """이전 Pool의 checked-out 연결이 모두 반환될 때까지 기다린 뒤 정리"""
+    deadline = time.monotonic() + settings.DB_POOL_DRAIN_TIMEOUT
+    while old_pool.checked_out() > 0 and time.monotonic() < deadline:
+        await asyncio.sleep(0.5)
+
+    remaining = old_pool.checked_out()
+    if remaining:
+        logger.warning(
+            f"⚠️ [Database] Drain timeout: disposing old pool with {remaining} connection(s) still in use"
+        )
+    await old_pool.dispose()
+    logger.info("🔄 [Database] Old connection pool drained and disposed.")
+
+
+async def rotate_db_pool():
     """
-    Connection Pool에서 세션을 가져와 반환.
-    인증 실패 시 Vault에서 새 Credential을 받아 Pool 재생성 (자동 복구).
+    무중단 Credential Rotation (Dual-Pool Handover).
+    1. 새 Credential 조회 + 새 Pool 생성 (스레드에서 수행, 요청 경로는 락을 기다리지 않음)
+    2. 전역 Pool 참조를 원자적으로 교체 (이후 생성되는 세션은 새 Pool 사용)
+    3. 이전 Pool은 진행 중인 요청의 연결이 반환되는 대로 Drain 후 정리
     """
-    global _SessionLocal
+    global _pool
 
-    # Pool이 없으면 초기화 (Lazy Initialization)
-    if _SessionLocal is None:
-        _init_db_pool()
+    new_url = await asyncio.to_thread(_refresh_credentials)
+    new_pool = await asyncio.to_thread(DatabasePool, new_url)
 
-    db = None
+    with _pool_lock:
+        old_pool, _pool = _pool, new_pool
+    if old_pool is not None:
+        # 같은 리더는 다음 측정까지 이전 지연 상태를 이어서 사용 (교체 직후 Writer로 몰리지 않도록)
+        previous = {r.endpoint: r for r in old_pool.readers}
+        for reader in new_pool.readers:
+            if reader.endpoint in previous:
+                old = previous[reader.endpoint]
+                reader.lag, reader.healthy, reader.checked = old.lag, old.healthy, old.checked
+    logger.info("✅ [Database] Connection Pool rotated to new credentials.")
+
+    if old_pool is not None:
+        task = asyncio.create_task(_drain_pool(old_pool))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+
+
+def _next_refresh_delay() -> Optional[float]:
+    """
+    다음 선제적 Rotation까지 남은 시간 (초).
+    Vault lease가 있으면 lease * DB_CREDENTIAL_REFRESH_RATIO 시점,
+    없으면 DB_CREDENTIAL_REFRESH_INTERVAL 주기, 둘 다 없으면 None (인증 실패 시에만 갱신).
+    """
+    if _credentials_lease > 0:
+        refresh_at = _credentials_fetched_at + (
+            _credentials_lease * settings.DB_CREDENTIAL_REFRESH_RATIO
+        )
+        return max(refresh_at - time.monotonic(), 1.0)
+    if settings.DB_CREDENTIAL_REFRESH_INTERVAL > 0:
+        return settings.DB_CREDENTIAL_REFRESH_INTERVAL
+    return None
+
+
+async def _credential_refresh_loop():
+    while True:
+        delay = _next_refresh_delay()
+        if delay is None:
+            logger.info("ℹ️ [Database] No credential lease/interval; proactive refresh disabled.")
+            return
+
+        await asyncio.sleep(delay)
+        try:
+            await rotate_db_pool()
+        except Exception as e:
+            logger.error(f"❌ [Database] Proactive credential refresh failed: {str(e)}")
+            await asyncio.sleep(min(delay, 30))
+
+
+def start_credential_refresher():
+    """
+    FastAPI lifespan 시작 시 호출: Credential 만료 전에 Pool을 선제적으로 교체.
+    정적 DATABASE_URL처럼 갱신할 원천이 없으면 시작하지 않음.
+    """
+    global _refresher_task
+    if not _can_refresh_credentials() or _refresher_task is not None:
+        return
+    _refresher_task = asyncio.create_task(_credential_refresh_loop())
+
+
+def _replica_lag_seconds(conn) -> Optional[float]:
+    """
+    리더의 복제 지연 (초, 동기 연결에서 실행). None이면 복제가 멈춘 상태.
+    - Aurora MySQL: information_schema.replica_host_status의 자기 인스턴스 행
+    - MySQL Replica: SHOW REPLICA STATUS (8.0.22 미만은 SHOW SLAVE STATUS)
+    - 그 외 (SQLite 등 로컬 개발): 지연 없음
+    """
+    if conn.dialect.name != "mysql":
+        return 0.0
     try:
-        db = _SessionLocal()
-        # 연결 테스트 (SQLAlchemy 2.0 문법: text() 필수)
-        db.execute(text("SELECT 1"))
-        yield db
-    except OperationalError as e:
-        # MySQL 인증 에러 코드: 1045 (Access Denied), 1044 (DB Access Denied)
-        error_code = e.orig.args[0] if e.orig and e.orig.args else 0
+        row = conn.exec_driver_sql(
+            "SELECT replica_lag_in_msec FROM information_schema.replica_host_status "
+            "WHERE server_id = @@aurora_server_id"
+        ).first()
+        return row[0] / 1000 if row is not None and row[0] is not None else 0.0
+    except DBAPIError:
+        pass  # Aurora가 아님
+
+    for statement, column in (
+        ("SHOW REPLICA STATUS", "Seconds_Behind_Source"),
+        ("SHOW SLAVE STATUS", "Seconds_Behind_Master"),
+    ):
+        try:
+            row = conn.exec_driver_sql(statement).mappings().first()
+        except DBAPIError:
+            continue
+        if row is None:
+            return 0.0  # 복제 설정이 없는 인스턴스 (Writer와 동일 데이터)
+        lag = row.get(column)
+        return float(lag) if lag is not None else None
+    return None
 
-        if error_code in [1045, 1044]:
-            logger.warning(
-                f"⚠️ [Database] Authentication failed (error: {error_code}). Refreshing credentials..."
+
+async def _check_reader(reader: _Reader):
+    """리더 1대의 복제 지연을 측정하여 라우팅 대상 여부 갱신 (상태가 바뀔 때만 로그)"""
+    error = None
+    try:
+        async with reader.async_engine.connect() as conn:
+            lag = await asyncio.wait_for(
+                conn.run_sync(_replica_lag_seconds), settings.DB_READER_LAG_CHECK_INTERVAL
             )
+    except Exception as e:
+        lag, error = None, e
 
-            # 기존 세션 정리
-            if db is not None:
-                db.close()
+    healthy = lag is not None and lag <= settings.DB_READER_MAX_LAG_SECONDS
+    if healthy and not reader.healthy:
+        logger.info(f"✅ [Database] Reader {reader.endpoint} in rotation (lag={lag:.3f}s)")
+    elif not healthy and (reader.healthy or not reader.checked):
+        logger.warning(
+            f"⚠️ [Database] Reader {reader.endpoint} out of rotation "
+            f"(lag={lag}, error={error}); reads fall back to writer"
+        )
+    reader.lag, reader.healthy, reader.checked = lag, healthy, True
+    DB_REPLICA_LAG.labels(reader.endpoint).set(lag if lag is not None else -1)
 
-            # 비밀번호 갱신 (Pool 재생성)
-            _init_db_pool()
 
-            # 새 세션으로 재시도
-            db = _SessionLocal()
-            yield db
-        else:
-            # 인증 에러가 아니면 그대로 raise
-            raise e
+async def _replica_monitor_loop():
+    while True:
+        pool = _pool
+        if pool is not None and pool.readers:
+            await asyncio.gather(*(_check_reader(reader) for reader in pool.readers))
+        await asyncio.sleep(settings.DB_READER_LAG_CHECK_INTERVAL)
+
+
+def start_replica_monitor():
+    """리더가 설정된 경우 복제 지연 측정 시작 (DB 초기화 후 호출)"""
+    global _replica_monitor_task
+    if _reader_endpoints() and _replica_monitor_task is None:
+        _replica_monitor_task = asyncio.create_task(_replica_monitor_loop())
+
+
+async def init_db():
+    """
+    Pool 생성 + 테이블 자동 생성 (환경별 모델 로드 후 호출).
+    Vault/Secrets Manager 조회와 DDL은 블로킹 I/O이므로 스레드에서 수행.
+    """
+    pool = await asyncio.to_thread(_init_db_pool)
+    await asyncio.to_thread(Base.metadata.create_all, bind=pool.engine)
+    # 요청 경로는 sync 엔진을 쓰지 않으므로 테이블 생성에 쓴 연결은 Pool에 남기지 않고 닫음
+    await asyncio.to_thread(pool.engine.dispose)
+
+
+async def _init_db_with_retry(started: float):
+    delay = 1.0
+    while True:
+        try:
+            await init_db()
+            break
+        except Exception as e:
+            # Vault/DB가 아직 준비되지 않은 경우: 프로세스는 살려 두고 /ready만 503으로 유지
+            logger.error(f"❌ [Database] Startup initialization failed, retrying in {delay:.0f}s: {e}")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 30.0)
+
+    elapsed = time.perf_counter() - started
+    STARTUP_DURATION.labels("db_ready").set(elapsed)
+    logger.info(f"✅ [Database] Ready ({elapsed:.2f}s after startup)")
+
+    # Credential lease를 알게 된 뒤에 선제 교체 주기를 계산해야 하므로 초기화 후 시작
+    start_credential_refresher()
+    # 리더 목록은 Secret/Vault 조회 후 확정되므로 초기화 후 시작
+    start_replica_monitor()
+
+
+def start_db_init(started: float):
+    """
+    FastAPI lifespan 시작 시 호출: DB 초기화를 백그라운드로 시작하고 즉시 반환.
+    /health는 바로 응답하고, DB를 쓰는 요청은 get_async_db_session에서 완료를 기다림.
+    started: 시작 시각 (time.perf_counter 기준, 준비 완료까지의 시간 기록용)
+    """
+    global _init_task
+    if _init_task is None:
+        _init_task = asyncio.create_task(_init_db_with_retry(started))
+
+
+def is_db_ready() -> bool:
+    """시작 시 초기화가 끝났는지 (/ready 판단용)"""
+    return _init_task is not None and _init_task.done() and not _init_task.cancelled()
+
+
+async def _wait_db_ready():
+    init_task = _init_task
+    if init_task is None or init_task.done():
+        return
+    try:
+        # shield: 요청이 타임아웃/취소돼도 초기화 태스크는 계속 진행
+        await asyncio.wait_for(asyncio.shield(init_task), settings.DB_INIT_WAIT_TIMEOUT)
+    except asyncio.TimeoutError:
+        raise HTTPException(
+            status_code=503,
+            detail="Database is not ready yet",
+            headers={"Retry-After": "1"},
+        )
+
+
+async def close_db_pools():
+    """FastAPI lifespan 종료 시 호출: 초기화/Refresh/지연 측정 중단 및 모든 Pool 연결 정리"""
+    global _pool, _refresher_task, _init_task, _replica_monitor_task
+
+    if _init_task is not None:
+        _init_task.cancel()
+        _init_task = None
+
+    if _replica_monitor_task is not None:
+        _replica_monitor_task.cancel()
+        _replica_monitor_task = None
+
+    if _refresher_task is not None:
+        _refresher_task.cancel()
+        _refresher_task = None
+
+    for task in list(_background_tasks):
+        task.cancel()
+
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        await pool.dispose()
+
+
+def reset_after_fork():
+    """
+    gunicorn post_fork 훅에서 호출: 부모(preload) 프로세스에서 물려받은 Pool/Credential/Secret 캐시 폐기.
+    연결 소켓은 부모와 공유되므로 닫지 않고(close=False) 참조만 버려 워커가 자신의 연결을 새로 만들게 함.
+    """
+    global _pool, _refresher_task, _init_task, _replica_monitor_task
+    global _credentials_url, _credentials_lease
+
+    pool, _pool = _pool, None
+    if pool is not None:
+        pool.engine.dispose(close=False)
+        pool.async_engine.sync_engine.dispose(close=False)
+        for reader in pool.readers:
+            reader.async_engine.sync_engine.dispose(close=False)
+
+    # 부모의 이벤트 루프에 속한 태스크는 이 프로세스에서 실행되지 않으므로 참조만 제거
+    _refresher_task = None
+    _init_task = None
+    _replica_monitor_task = None
+    _background_tasks.clear()
+
+    _credentials_url = None
+    _credentials_lease = 0
+    if settings.DB_SECRET_ARN:
+        settings.DATABASE_URL = None  # Secrets Manager에서 다시 로드
+    clear_secret_cache()
+    if settings.IS_ONPREM:
+        get_credential_provider().invalidate()
+
+
+def get_db_session():
+    """
+    Connection Pool에서 세션을 가져와 반환.
+    Stale 연결은 pool_pre_ping이, 인증 실패(Credential Rotation)는 연결 생성 시점의
+    do_connect 훅이 처리하므로 체크아웃 시 별도 연결 테스트를 하지 않음.
+    연결은 여기서 미리 체크아웃하여 Pool 대기 시간을 db_pool_checkout 단계로 측정.
+    """
+    db = _get_pool().SessionLocal()
+    try:
+        with DB_POOL_WAITERS.labels("sync").track_inprogress(), timed("db_pool_checkout"):
+            db.connection()
+        yield db
     finally:
-        if db is not None:
-            db.close()  # Pool에 연결 반환
+        db.close()  # Pool에 연결 반환
 
 
 # 호환성: get_db는 get_db_session의 별칭
@@ -116,16 +625,105 @@ def get_db():
     yield from get_db_session()
 
 
-# 초기화: engine 전역 변수 설정 (테이블 생성용)
+async def get_async_db_session():
+    """
+    비동기 Connection Pool에서 AsyncSession을 가져와 반환.
+    인증 실패 시 자동 복구는 get_db_session과 동일하게 do_connect 훅에서 처리.
+    시작 시 초기화(테이블 생성 포함)가 진행 중이면 DB_INIT_WAIT_TIMEOUT까지 기다림.
+    """
+    pool = await _get_ready_pool()
+    db = await _open_session(pool.AsyncSessionLocal, "async")
+    try:
+        yield db
+    finally:
+        await db.close()  # Pool에 연결 반환
+
+
+async def _get_ready_pool() -> DatabasePool:
+    await _wait_db_ready()
+
+    pool = _pool
+    if pool is None:
+        # Pool이 없으면 초기화 (Vault/Secrets 조회는 블로킹 I/O이므로 스레드에서 수행)
+        pool = await asyncio.to_thread(_init_db_pool)
+    return pool
+
+
+async def _open_session(session_factory, engine_label: str):
+    """세션을 만들고 연결을 미리 체크아웃 (Pool 대기 시간을 db_pool_checkout 단계로 측정)"""
+    db = session_factory()
+    try:
+        with DB_POOL_WAITERS.labels(engine_label).track_inprogress(), timed("db_pool_checkout"):
+            await db.connection()
+    except BaseException:
+        await db.close()
+        raise
+    return db
+
+
+def _pick_reader(pool: DatabasePool) -> Optional[_Reader]:
+    """지연 임계치 이내인 리더 중 Round-Robin으로 선택 (없으면 None)"""
+    global _reader_cursor
+    healthy = [reader for reader in pool.readers if reader.healthy]
+    if not healthy:
+        return None
+    _reader_cursor += 1
+    return healthy[_reader_cursor % len(healthy)]
+
+
+def is_reader_session(db) -> bool:
+    """리더(Replica)에 연결된 읽기 세션인지 (Writer 대체 세션이면 False)"""
+    return "reader" in db.info
+
+
+async def get_async_read_db_session():
+    """
+    읽기 전용 AsyncSession. 리더(Replica)로 보내고, 다음 경우 Writer로 대체:
+    - 리더 미설정 / 모든 리더의 복제 지연이 DB_READER_MAX_LAG_SECONDS 초과 (지연 측정 결과 기준)
+    - 리더 연결 실패 (해당 리더는 다음 지연 측정까지 제외)
+    복제 지연만큼 오래된 데이터를 읽을 수 있으므로 방금 쓴 데이터를 읽어야 하는 경로에는 사용하지 않음.
+    (방금 생성됐을 수 있는 행을 찾는 경우 is_reader_session으로 확인해 못 찾은 행만 Writer에서 다시 조회)
+    """
+    pool = await _get_ready_pool()
+
+    db = None
+    reader = _pick_reader(pool)
+    if reader is not None:
+        try:
+            db = await _open_session(reader.AsyncSessionLocal, "reader")
+            db.info["reader"] = reader.endpoint
+            DB_READ_SESSIONS.labels("reader").inc()
+        except DBAPIError as e:
+            reader.healthy = False
+            logger.warning(f"⚠️ [Database] Reader {reader.endpoint} unavailable, using writer: {e}")
+    if db is None:
+        db = await _open_session(pool.AsyncSessionLocal, "async")
+        DB_READ_SESSIONS.labels("writer_fallback" if pool.readers else "writer").inc()
+    try:
+        yield db
+    finally:
+        await db.close()
+
+
+# get_async_db는 get_async_db_session의 별칭. async 라우터에서 Depends(get_async_db) 형태로 사용.
+# (async generator는 yield from이 없으므로 래핑하지 않고 그대로 노출해야 예외가 전달됨)
+get_async_db = get_async_db_session
+
+# 읽기 전용 조회 라우터용: Depends(get_async_read_db)
+get_async_read_db = get_async_read_db_session
+
+# 요청 밖(백그라운드 작업 등)에서 사용: async with async_session_scope() as db: ...
+async_session_scope = asynccontextmanager(get_async_db_session)
+async_read_session_scope = asynccontextmanager(get_async_read_db_session)
+
+
 def get_engine():
     """
     현재 엔진을 반환합니다. 없으면 초기화합니다.
     """
-    global _engine
-    if _engine is None:
-        _init_db_pool()
-    return _engine
+    return _get_pool().engine
 
 
-# 모듈 임포트 시 engine 초기화
-engine = get_engine()
+def get_async_engine():
+    """현재 비동기 엔진을 반환합니다. 없으면 초기화합니다."""
+    return _get_pool().async_engine
@@ -0,0 +1,160 @@
+"""
+구조화(JSON) 로깅 파이프라인.
+
+요청 경로의 logger 호출은 레코드를 큐에 넣기만 하고, 포맷팅과 stdout 쓰기는
+백그라운드 QueueListener 스레드가 담당 (stdout이 막혀도 이벤트 루프가 기다리지 않음).
+- 메시지는 %-스타일 인자로 넘겨 출력 시점에만 포맷팅 (샘플링으로 버려지면 포맷팅 비용 없음).
+  인자는 원시 값만 전달 (ORM 객체를 넘기면 리스너 스레드에서 지연 로딩이 일어날 수 있음)
+- extra=SAMPLED: 요청마다 남는 대량 INFO 로그는 LOG_SAMPLE_RATE 비율만 기록
+- 접근 로그: uvicorn 접근 로그 대신 ASGI 미들웨어가 route 템플릿 기준으로 기록하며,
+  프로브/스크레이프 경로(QUIET_ROUTES)는 성공 응답이면 남기지 않음
+
+설정/DB 모듈을 임포트하지 않으므로 metrics 등 하위 모듈에서도 사용 가능 (설정은 configure_logging 인자로 전달).
+"""
+import json
+import logging
+import queue
+import random
+import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import List, Optional, Tuple
+
+# logger.info("...", value, extra=SAMPLED): 샘플링 대상 표시
+SAMPLED = {"sampled": True}
+
+# 성공 시 접근 로그를 남기지 않는 경로 (route 템플릿 기준, 문자열 검색 아님)
+QUIET_ROUTES = frozenset({"/health", "/ready", "/metrics"})
+
+# 앱 로그는 기존과 같이 "uvicorn" 로거를 사용하고, 접근 로그만 별도 로거로 분리
+_APP_LOGGERS = ("uvicorn", "app")
+access_logger = logging.getLogger("app.access")
+
+# LogRecord 기본 속성 (이 외의 속성은 extra로 전달된 필드로 보고 JSON에 포함)
+_RECORD_ATTRS = frozenset(
+    vars(logging.LogRecord("", 0, "", 0, "", None, None))
+) | {"message", "asctime", "taskName", "color_message", "sampled"}
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄 JSON: ts, level, logger, message + extra 필드 (+ 예외 traceback)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS:
+                payload[key] = value
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class _SamplingFilter(logging.Filter):
+    """extra=SAMPLED로 표시된 INFO 이하 로그를 rate 비율만 통과 (큐에 넣기 전, 호출 스레드에서 판단)"""
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.rate < 1.0 and record.levelno <= logging.INFO and getattr(record, "sampled", False):
+            return random.random() < self.rate
+        return True
+
+
+class _LazyQueueHandler(QueueHandler):
+    """
+    같은 프로세스 안의 큐이므로 레코드를 직렬화할 필요가 없음:
+    기본 QueueHandler.prepare()의 메시지 포맷팅을 생략하고 리스너 스레드에서 포맷팅.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+_listener: Optional[QueueListener] = None
+_saved: List[Tuple[logging.Logger, list, bool, int, bool]] = []
+_access_log_enabled = False
+
+
+def configure_logging(
+    level: str = "INFO", fmt: str = "json", sample_rate: float = 1.0, access_log: bool = True
+):
+    """
+    FastAPI lifespan 시작 시 호출 (워커 프로세스마다, fork 이후).
+    uvicorn/앱 로거의 핸들러를 큐 핸들러로 교체하고 리스너 스레드 시작.
+    """
+    global _listener, _access_log_enabled
+    if _listener is not None:
+        return
+
+    stream = logging.StreamHandler(sys.stdout)
+    if fmt == "json":
+        stream.setFormatter(JsonFormatter())
+    else:
+        stream.setFormatter(logging.Formatter("%(asctime)s %(levelname)s [%(name)s] %(message)s"))
+
+    log_queue = queue.SimpleQueue()
+    handler = _LazyQueueHandler(log_queue)
+    handler.addFilter(_SamplingFilter(sample_rate))
+    _listener = QueueListener(log_queue, stream, respect_handler_level=True)
+    _listener.start()
+
+    for name in _APP_LOGGERS + ("uvicorn.access",):
+        logger = logging.getLogger(name)
+        _saved.append((logger, logger.handlers[:], logger.propagate, logger.level, logger.disabled))
+        logger.propagate = False
+        if name == "uvicorn.access":
+            # 미들웨어 접근 로그(app.access)로 대체
+            logger.handlers = []
+            logger.disabled = True
+        else:
+            logger.handlers = [handler]
+            logger.setLevel(level)
+
+    _access_log_enabled = access_log
+
+
+def shutdown_logging():
+    """FastAPI lifespan 종료 시 호출: 큐에 남은 로그를 모두 출력하고 원래 핸들러 복원"""
+    global _listener, _access_log_enabled
+    if _listener is None:
+        return
+
+    _listener.stop()  # 큐를 비운 뒤 종료
+    _listener = None
+    _access_log_enabled = False
+
+    while _saved:
+        logger, handlers, propagate, level, disabled = _saved.pop()
+        logger.handlers = handlers
+        logger.propagate = propagate
+        logger.setLevel(level)
+        logger.disabled = disabled
+
+
+def log_access(method: str, route: str, path: str, status: int, duration: float, client: str):
+    """요청 1건의 접근 로그 (MetricsMiddleware에서 호출)"""
+    if not _access_log_enabled or (route in QUIET_ROUTES and status < 400):
+        return
+    access_logger.info(
+        "%s %s %d",
+        method,
+        path,
+        status,
+        extra={
+            "method": method,
+            "route": route,
+            "path": path,
+            "status": status,
+            "duration_ms": round(duration * 1000, 3),
+            "client": client,
+        },
+    )
@@ -0,0 +1,174 @@
+"""
+Prometheus 메트릭 정의.
+설정/DB 모듈을 임포트하지 않으므로 config, aws_secrets 등 어디서든 순환 없이 사용 가능.
+
+멀티 워커(gunicorn)에서는 PROMETHEUS_MULTIPROC_DIR이 설정되어 워커별 값이 파일로 기록되고
+/metrics가 합산해 노출함 (Gauge는 multiprocess_mode로 합산 방식 지정).
+"""
+import time
+from contextlib import contextmanager
+from prometheus_client import REGISTRY, Counter, Gauge, Histogram
+from prometheus_client.core import GaugeMetricFamily
+from app.core.logging_config import log_access
+
+# 요청 단위 지연: route는 경로 템플릿(/bookings/{booking_id}/confirm)으로 기록해 카디널리티 제한
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"],
+)
+
+# 요청 내부 세부 단계 지연 (Pool 체크아웃, 온프레미스 호출, Vault/Secrets 조회, 견적 계산 등)
+HOT_PATH_DURATION = Histogram(
+    "hot_path_duration_seconds",
+    "Latency of instrumented sub-steps on the request path",
+    ["step"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+
+# Pool에서 연결을 기다리는 중인 요청 수 (QueuePool은 대기자 수를 제공하지 않으므로 직접 집계)
+DB_POOL_WAITERS = Gauge(
+    "db_pool_checkout_waiters",
+    "Requests currently waiting for a connection from the pool",
+    ["engine"],
+    multiprocess_mode="livesum",
+)
+
+# 리더(Replica) 복제 지연 (초, 측정 실패 시 -1)
+DB_REPLICA_LAG = Gauge(
+    "db_replica_lag_seconds",
+    "Replication lag of each read replica as last measured (-1 if unavailable)",
+    ["reader"],
+    multiprocess_mode="livemax",
+)
+
+# 읽기 전용 세션이 실제로 연결된 대상 (reader, writer: 리더 미설정, writer_fallback: 지연/장애로 우회)
+DB_READ_SESSIONS = Counter(
+    "db_read_sessions_total",
+    "Read-only sessions by the pool that served them",
+    ["target"],
+)
+
+# Circuit Breaker 상태 (0=closed, 1=half_open, 2=open)
+CIRCUIT_STATE = Gauge(
+    "circuit_breaker_state",
+    "Circuit breaker state (0=closed, 1=half_open, 2=open)",
+    ["name"],
+    multiprocess_mode="livemax",  # 워커별 Circuit 중 가장 나쁜 상태
+)
+
+# 내부 PII API 호출자별 거절 수 (reason: rate=토큰 버킷 소진, concurrency=동시 요청 상한) / 처리 중 요청 수
+INTERNAL_RATE_LIMITED = Counter(
+    "internal_api_rate_limited_total",
+    "Internal API requests rejected with 429 by caller and reason",
+    ["caller", "reason"],
+)
+INTERNAL_INFLIGHT = Gauge(
+    "internal_api_inflight_requests",
+    "Internal API requests currently being served per caller",
+    ["caller"],
+    multiprocess_mode="livesum",
+)
+
+# 시작 소요 시간 (초, 앱 모듈 임포트 시작 기준). phase: serving(/health 응답 가능), db_ready(/ready 통과)
+STARTUP_DURATION = Gauge(
+    "app_startup_duration_seconds",
+    "Seconds from app import until each startup phase completed",
+    ["phase"],
+    multiprocess_mode="max",
+)
+
+
+@contextmanager
+def timed(step: str):
+    """with timed("onprem_pii_fetch"): ... 블록의 소요 시간을 HOT_PATH_DURATION에 기록"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        HOT_PATH_DURATION.labels(step).observe(time.perf_counter() - started)
+
+
+def observe(step: str, seconds: float):
+    """이미 측정된 소요 시간 기록 (프로세스 풀 워커에서 측정한 계산 시간 등)"""
+    HOT_PATH_DURATION.labels(step).observe(seconds)
+
+
+class _PoolCollector:
+    """
+    스크레이프 시점에 현재 DatabasePool의 상태를 읽어 Gauge로 노출.
+    Rotation으로 Pool이 교체돼도 항상 현재 Pool 기준으로 보고함.
+    """
+
+    def describe(self):
+        # 등록 시점에 collect()가 호출되지 않도록 메트릭 이름만 제공 (database 모듈 순환 임포트 방지)
+        return list(self._families().values())
+
+    def collect(self):
+        from app.core.database import get_pool_status
+
+        families = self._families()
+        for engine_name, status in get_pool_status().items():
+            for key, family in families.items():
+                family.add_metric([engine_name], status[key])
+        yield from families.values()
+
+    @staticmethod
+    def _families() -> dict:
+        return {
+            "size": GaugeMetricFamily(
+                "db_pool_size", "Configured pool size", labels=["engine"]
+            ),
+            "checked_out": GaugeMetricFamily(
+                "db_pool_checked_out", "Connections currently in use", labels=["engine"]
+            ),
+            "checked_in": GaugeMetricFamily(
+                "db_pool_checked_in", "Idle connections in the pool", labels=["engine"]
+            ),
+            "overflow": GaugeMetricFamily(
+                "db_pool_overflow",
+                "Connections opened beyond pool_size (max_overflow budget in use)",
+                labels=["engine"],
+            ),
+        }
+
+
+# Pool 상태는 스크레이프 시점에 읽는 값이라 워커 간 합산 불가: 멀티 워커 모드에서는 응답한 워커의 값만 노출
+pool_collector = _PoolCollector()
+REGISTRY.register(pool_collector)
+
+
+class MetricsMiddleware:
+    """
+    요청별 지연을 route 템플릿 기준으로 기록하는 ASGI 미들웨어 (접근 로그도 여기서 기록).
+    BaseHTTPMiddleware를 거치지 않아 요청당 추가 태스크/스트림 비용이 없음.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # 라우터가 매칭한 경로 템플릿 (매칭 실패 시 원시 경로 대신 고정 라벨)
+            elapsed = time.perf_counter() - started
+            route = getattr(scope.get("route"), "path", "unmatched")
+            HTTP_REQUEST_DURATION.labels(scope["method"], route, str(status_code)).observe(elapsed)
+            client = scope.get("client")
+            log_access(
+                scope["method"], route, scope["path"], status_code, elapsed, client[0] if client else "-"
+            )
@@ -0,0 +1,305 @@
+import asyncio
+import logging
+import math
+import random
+import time
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional
+import httpx
+from fastapi import HTTPException
+from app.core.circuit_breaker import CircuitBreaker, CircuitOpenError
+from app.core.config import settings
+from app.core.logging_config import SAMPLED
+from app.core.metrics import timed
+
+logger = logging.getLogger("uvicorn")
+
+# 전역 변수: 앱 수명 동안 공유되는 온프레미스 HTTP 클라이언트 (Keep-Alive Pool)
+_client: Optional[httpx.AsyncClient] = None
+
+# 온프레미스 장애 시 즉시 실패시키는 Circuit Breaker (/health에 상태 노출)
+circuit_breaker = CircuitBreaker(
+    "onprem",
+    failure_rate_threshold=settings.ONPREM_CIRCUIT_FAILURE_RATE,
+    window_size=settings.ONPREM_CIRCUIT_WINDOW,
+    min_calls=settings.ONPREM_CIRCUIT_MIN_CALLS,
+    open_seconds=settings.ONPREM_CIRCUIT_OPEN_SECONDS,
+)
+# 프로세스 전체 온프레미스 동시 호출 상한 (Python 3.9는 생성 시점의 이벤트 루프에 묶이므로 첫 호출 시 생성)
+_concurrency: Optional[asyncio.Semaphore] = None
+
+
+def _build_client() -> httpx.AsyncClient:
+    limits = httpx.Limits(
+        max_connections=settings.ONPREM_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.ONPREM_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=settings.ONPREM_KEEPALIVE_EXPIRY,
+    )
+    timeout = httpx.Timeout(
+        settings.ONPREM_TIMEOUT,
+        connect=settings.ONPREM_CONNECT_TIMEOUT,
+        pool=settings.ONPREM_POOL_TIMEOUT,
+    )
+    return httpx.AsyncClient(
+        base_url=getattr(settings, "ONPREM_SERVICE_URL", "http://10.10.10.20:8000"),
+        headers={
+            "x-internal-token": getattr(
+                settings, "INTERNAL_API_TOKEN", "my-secret-token"
+            )
+        },
+        limits=limits,
+        timeout=timeout,
+        http2=settings.ONPREM_HTTP2,
+    )
+
+
+def start_onprem_client():
+    """
+    온프레미스 HTTP 클라이언트 생성 (FastAPI lifespan 시작 시 호출).
+    TCP/TLS 연결을 요청 간에 재사용하여 VPN 핸드셰이크 비용을 제거.
+    """
+    global _client
+    if _client is None:
+        _client = _build_client()
+        logger.info(
+            f"✅ [On-Prem Client] Connection pool started "
+            f"(max={settings.ONPREM_MAX_CONNECTIONS}, http2={settings.ONPREM_HTTP2})"
+        )
+
+
+async def close_onprem_client():
+    """FastAPI lifespan 종료 시 호출: 진행 중인 요청 완료 후 연결 정리"""
+    global _client
+    if _client is not None:
+        client, _client = _client, None
+        await client.aclose()
+        logger.info("🔌 [On-Prem Client] Connection pool closed.")
+
+
+def get_onprem_client() -> httpx.AsyncClient:
+    """공유 클라이언트 반환. lifespan 밖(스크립트 등)에서 호출되면 지연 생성."""
+    if _client is None:
+        start_onprem_client()
+    return _client
+
+
+def _chunked(items: List[str], size: int) -> List[List[str]]:
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def _unavailable(detail: str, retry_after: float = 1.0) -> HTTPException:
+    return HTTPException(
+        status_code=503,
+        detail=detail,
+        headers={"Retry-After": str(max(math.ceil(retry_after), 1))},
+    )
+
+
+def _retry_after(response: httpx.Response) -> float:
+    """온프레미스 응답의 Retry-After (초). 없거나 날짜 형식이면 1초"""
+    try:
+        return max(float(response.headers.get("Retry-After", "1")), 0.0)
+    except ValueError:
+        return 1.0
+
+
+async def _acquire_slot(semaphore: asyncio.Semaphore, timeout: float) -> bool:
+    """
+    timeout 안에 슬롯을 얻으면 True (얻은 슬롯은 호출자가 반환).
+    Python 3.9의 wait_for는 획득과 타임아웃이 겹치면 획득한 슬롯을 버린 채 TimeoutError를 낼 수 있어
+    (슬롯이 영구히 줄어듦) 대기 태스크의 완료 여부로 직접 판단.
+    """
+    if not semaphore.locked():
+        await semaphore.acquire()  # 여유가 있으면 대기 없이 즉시 획득
+        return True
+
+    acquire = asyncio.ensure_future(semaphore.acquire())
+    try:
+        done, _ = await asyncio.wait({acquire}, timeout=timeout)
+    except BaseException:
+        # 호출자 취소: 이미 획득했으면 반환하고, 아니면 대기만 취소
+        if acquire.done() and not acquire.cancelled():
+            semaphore.release()
+        else:
+            acquire.cancel()
+        raise
+    if done:
+        return True
+    acquire.cancel()
+    return False
+
+
+async def _send_once(send: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+    """동시 호출 슬롯 확보 -> Circuit 확인 -> 호출 1회 -> 결과를 Circuit에 기록"""
+    global _concurrency
+    if _concurrency is None:
+        _concurrency = asyncio.Semaphore(settings.ONPREM_MAX_CONCURRENCY)
+
+    if not await _acquire_slot(_concurrency, settings.ONPREM_QUEUE_TIMEOUT):
+        logger.warning("⚠️ [On-Prem] Concurrency limit reached, failing fast")
+        raise _unavailable("On-Premise concurrency limit reached")
+
+    try:
+        try:
+            circuit_breaker.before_call()
+        except CircuitOpenError as exc:
+            raise _unavailable(
+                "On-Premise service unavailable (circuit open)", exc.retry_after
+            )
+
+        try:
+            response = await send()
+        except httpx.RequestError:
+            circuit_breaker.record_failure()
+            raise
+        except BaseException:
+            circuit_breaker.record_ignored()
+            raise
+
+        # 404 등 4xx는 온프레미스가 정상 응답한 것이므로 실패로 치지 않음
+        if response.status_code >= 500:
+            circuit_breaker.record_failure()
+        else:
+            circuit_breaker.record_success()
+        return response
+    finally:
+        _concurrency.release()
+
+
+async def _send_with_retry(send: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+    """
+    조회(읽기 전용) 호출용: 네트워크 에러/5xx면 Full Jitter 백오프 후 최대 ONPREM_RETRY_ATTEMPTS회 재시도.
+    전체 소요가 ONPREM_TIMEOUT을 넘지 않도록 남은 시간이 없으면 재시도하지 않음.
+    재시도 후에도 5xx면 마지막 응답을 그대로 반환 (호출자가 502로 변환).
+    429(온프레미스 호출자 한도 초과)는 Retry-After 이후에만 재시도하고, 남은 시간 안에 못 하면 그대로 반환.
+    Circuit OPEN/동시 호출 상한 초과(503)는 재시도하지 않음.
+    """
+    deadline = time.monotonic() + settings.ONPREM_TIMEOUT
+    attempt = 0
+    while True:
+        error: Optional[httpx.RequestError] = None
+        response: Optional[httpx.Response] = None
+        try:
+            response = await _send_once(send)
+        except httpx.RequestError as exc:
+            error = exc
+        if response is not None and response.status_code < 500 and response.status_code != 429:
+            return response
+
+        backoff = random.uniform(0, settings.ONPREM_RETRY_BACKOFF * (2**attempt))
+        if response is not None and response.status_code == 429:
+            backoff = max(backoff, _retry_after(response))
+        attempt += 1
+        if attempt > settings.ONPREM_RETRY_ATTEMPTS or time.monotonic() + backoff >= deadline:
+            if error is not None:
+                raise error
+            return response
+
+        logger.warning(
+            "🔁 [On-Prem] Retrying (%d/%d) after %s",
+            attempt,
+            settings.ONPREM_RETRY_ATTEMPTS,
+            error or response.status_code,
+        )
+        await asyncio.sleep(backoff)
+
+
+async def fetch_pii(user_id: str, timeout: Optional[float] = None) -> dict:
+    """
+    온프레미스 /pii/internal/{user_id} 호출 (Cloud 전용).
+    timeout을 지정하면 해당 호출에만 read/write 타임아웃을 덮어씀.
+    """
+    client = get_onprem_client()
+    request_timeout = (
+        httpx.Timeout(timeout, connect=settings.ONPREM_CONNECT_TIMEOUT)
+        if timeout is not None
+        else httpx.USE_CLIENT_DEFAULT
+    )
+
+    try:
+        with timed("onprem_pii_fetch"):
+            response = await _send_with_retry(
+                lambda: client.get(f"/pii/internal/{user_id}", timeout=request_timeout)
+            )
+    except httpx.RequestError as exc:
+        logger.error("❌ [Network Error] Could not connect to On-Premise: %s", exc)
+        raise HTTPException(status_code=503, detail="On-Premise service unavailable")
+
+    if response.status_code == 429:
+        # 호출자 한도 초과: 클라이언트도 같은 시간만큼 물러나도록 503 + Retry-After로 전달
+        raise _unavailable("On-Premise rate limit exceeded", _retry_after(response))
+    if response.status_code != 200:
+        logger.error("❌ [On-Prem Error] Status: %d, Body: %s", response.status_code, response.text)
+        raise HTTPException(
+            status_code=502, detail="Failed to fetch PII from On-Premise"
+        )
+
+    return response.json()
+
+
+async def _fetch_pii_chunk(
+    client: httpx.AsyncClient, user_ids: List[str], request_timeout
+) -> dict:
+    """온프레미스 /pii/internal/batch 1회 호출 (읽기 전용이므로 재시도 대상)"""
+    response = await _send_with_retry(
+        lambda: client.post(
+            "/pii/internal/batch", json={"user_ids": user_ids}, timeout=request_timeout
+        )
+    )
+
+    if response.status_code == 429:
+        raise _unavailable("On-Premise rate limit exceeded", _retry_after(response))
+    if response.status_code != 200:
+        logger.error(
+            "❌ [On-Prem Error] Batch status: %d, Body: %s", response.status_code, response.text
+        )
+        raise HTTPException(
+            status_code=502, detail="Failed to fetch PII from On-Premise"
+        )
+
+    return response.json()["results"]
+
+
+async def fetch_pii_batch(
+    user_ids: Iterable[str], timeout: Optional[float] = None
+) -> Dict[str, Optional[dict]]:
+    """
+    여러 user_id의 PII를 온프레미스에서 일괄 조회 (Cloud 전용).
+    PII_BATCH_MAX_SIZE 단위로 나눠 VPN 호출 횟수를 최소화하고 (최대 PII_BATCH_CONCURRENCY개 동시),
+    존재하지 않는 user_id는 None으로 반환.
+    """
+    unique_ids = list(dict.fromkeys(user_ids))
+    if not unique_ids:
+        return {}
+
+    client = get_onprem_client()
+    request_timeout = (
+        httpx.Timeout(timeout, connect=settings.ONPREM_CONNECT_TIMEOUT)
+        if timeout is not None
+        else httpx.USE_CLIENT_DEFAULT
+    )
+    chunks = _chunked(unique_ids, settings.PII_BATCH_MAX_SIZE)
+    logger.info(
+        "🔗 [Integration] Fetching PII for %d users in %d batch call(s)...",
+        len(unique_ids),
+        len(chunks),
+        extra=SAMPLED,
+    )
+
+    # 청크 동시 호출 수를 PII_BATCH_CONCURRENCY로 제한
+    semaphore = asyncio.Semaphore(settings.PII_BATCH_CONCURRENCY)
+
+    async def fetch_chunk(chunk: List[str]) -> dict:
+        async with semaphore:
+            return await _fetch_pii_chunk(client, chunk, request_timeout)
+
+    try:
+        with timed("onprem_pii_batch_fetch"):
+            chunk_results = await asyncio.gather(*(fetch_chunk(chunk) for chunk in chunks))
+    except httpx.RequestError as exc:
+        logger.error("❌ [Network Error] Could not connect to On-Premise: %s", exc)
+        raise HTTPException(status_code=503, detail="On-Premise service unavailable")
+
+    results: Dict[str, Optional[dict]] = {}
+    for chunk_result in chunk_results:
+        results.update(chunk_result)
+    return results
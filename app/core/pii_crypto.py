@@ -0,0 +1,279 @@
+"""
+PII 필드 암호화 (Envelope Encryption, On-Prem).
+
+- 필드: 데이터 키(DEK, AES-256)로 AES-GCM 암호화. AAD에 user_id와 필드명을 넣어 행/필드 간 암호문 바꿔치기 방지
+- 데이터 키: KEK(Vault Transit 또는 로컬 마스터 키)로 래핑하여 pii_data_keys에 저장.
+  현재 키는 PII_DATA_KEY_TTL_SECONDS/PII_DATA_KEY_MAX_USES마다 교체하고,
+  복호화용 키는 LRU 캐시에 보관하여 요청마다 KEK(Vault) 왕복이 없도록 함
+- email: 암호문은 매번 달라지므로 HMAC-SHA256 Blind Index(email_bidx)로 인덱스 검색
+"""
+import asyncio
+import base64
+import hashlib
+import hmac
+import logging
+import os
+import time
+import uuid
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.core.metrics import timed
+from app.models import pii as models
+
+logger = logging.getLogger("uvicorn")
+
+PII_FIELDS = ("name", "email", "phone", "passport_no")
+_NONCE_SIZE = 12
+_DEFAULT_MASTER_KEY = "my-pii-master-key"  # config 기본값 (저장소에 공개된 값)
+
+
+def _derive_key(secret: str, purpose: bytes) -> bytes:
+    """설정 문자열에서 용도별 256bit 키 파생 (KEK와 Blind Index 키를 분리)"""
+    return HKDF(algorithm=hashes.SHA256(), length=32, salt=None, info=purpose).derive(
+        secret.encode()
+    )
+
+
+def _master_key() -> str:
+    """
+    로컬 KEK / Blind Index 키를 파생할 PII_MASTER_KEY.
+    공개된 기본값은 PII_ALLOW_DEFAULT_MASTER_KEY=true(로컬 개발)일 때만 허용.
+    """
+    if settings.PII_MASTER_KEY == _DEFAULT_MASTER_KEY:
+        if not settings.PII_ALLOW_DEFAULT_MASTER_KEY:
+            raise ValueError(
+                "PII_MASTER_KEY is not set: refusing to encrypt PII with the default key "
+                "(set PII_ALLOW_DEFAULT_MASTER_KEY=true for local development only)"
+            )
+        logger.error("🚨 [PII Crypto] Using the default PII_MASTER_KEY (local development only)")
+    return settings.PII_MASTER_KEY
+
+
+# -----------------------------------------------------------------------------
+# KEK Provider: 데이터 키 발급(generate)과 래핑 해제(unwrap). 블로킹 I/O이므로 스레드에서 호출
+# -----------------------------------------------------------------------------
+class LocalKeyProvider:
+    """KMS 대체: PII_MASTER_KEY에서 파생한 KEK로 데이터 키를 AES-GCM 래핑 (개발/PoC용)"""
+
+    name = "local"
+
+    def __init__(self, master_key: str):
+        self._kek = AESGCM(_derive_key(master_key, b"pii-kek"))
+
+    def generate_data_key(self) -> Tuple[bytes, str]:
+        key = AESGCM.generate_key(bit_length=256)
+        nonce = os.urandom(_NONCE_SIZE)
+        wrapped = nonce + self._kek.encrypt(nonce, key, b"pii-data-key")
+        return key, "local:" + base64.b64encode(wrapped).decode()
+
+    def unwrap(self, wrapped_keys: List[str]) -> List[bytes]:
+        keys = []
+        for wrapped in wrapped_keys:
+            raw = base64.b64decode(wrapped.split(":", 1)[1])
+            keys.append(self._kek.decrypt(raw[:_NONCE_SIZE], raw[_NONCE_SIZE:], b"pii-data-key"))
+        return keys
+
+
+class VaultTransitKeyProvider:
+    """Vault Transit Engine: 데이터 키 발급/복호화 (KEK는 Vault 밖으로 나오지 않음)"""
+
+    name = "vault"
+
+    def __init__(self, key_name: str):
+        self.key_name = key_name
+
+    def _client(self):
+        from app.core.security import get_credential_provider
+
+        return get_credential_provider().client()
+
+    def generate_data_key(self) -> Tuple[bytes, str]:
+        response = self._client().secrets.transit.generate_data_key(
+            name=self.key_name, key_type="plaintext"
+        )
+        data = response["data"]
+        return base64.b64decode(data["plaintext"]), data["ciphertext"]
+
+    def unwrap(self, wrapped_keys: List[str]) -> List[bytes]:
+        # 여러 데이터 키를 batch_input으로 한 번에 복호화 (Vault 왕복 1회)
+        response = self._client().secrets.transit.decrypt_data(
+            name=self.key_name,
+            batch_input=[{"ciphertext": wrapped} for wrapped in wrapped_keys],
+        )
+        return [base64.b64decode(r["plaintext"]) for r in response["data"]["batch_results"]]
+
+
+def _create_provider():
+    if settings.PII_KEY_PROVIDER == "vault":
+        return VaultTransitKeyProvider(settings.PII_TRANSIT_KEY_NAME)
+    if settings.PII_KEY_PROVIDER != "local":
+        raise ValueError(f"Unknown PII_KEY_PROVIDER '{settings.PII_KEY_PROVIDER}'")
+    return LocalKeyProvider(_master_key())
+
+
+class _DataKey:
+    __slots__ = ("key_id", "aead", "expires_at", "remaining_uses")
+
+    def __init__(self, key_id: str, key: bytes):
+        self.key_id = key_id
+        self.aead = AESGCM(key)
+        self.expires_at = time.monotonic() + settings.PII_DATA_KEY_TTL_SECONDS
+        self.remaining_uses = settings.PII_DATA_KEY_MAX_USES
+
+
+class PIICipher:
+    """
+    PII 행 단위 암호화/복호화 (이벤트 루프 단일 스레드 전용).
+    - encrypt: 현재 데이터 키로 필드 암호화 (키 교체 시에만 KEK 호출 + pii_data_keys INSERT)
+    - decrypt_rows: 여러 행에 필요한 데이터 키를 모아 캐시 Miss만 한 번에 래핑 해제한 뒤 복호화
+    """
+
+    def __init__(self):
+        self._provider = None
+        self._current: Optional[_DataKey] = None
+        self._keys: "OrderedDict[str, AESGCM]" = OrderedDict()  # key_id -> AESGCM (LRU)
+        self._rotate_lock: Optional[asyncio.Lock] = None
+        self._index_key: Optional[bytes] = None
+
+    @property
+    def provider(self):
+        if self._provider is None:
+            self._provider = _create_provider()
+        return self._provider
+
+    @property
+    def index_key(self) -> bytes:
+        if self._index_key is None:
+            self._index_key = (
+                base64.b64decode(settings.PII_BLIND_INDEX_KEY)
+                if settings.PII_BLIND_INDEX_KEY
+                else _derive_key(_master_key(), b"pii-blind-index")
+            )
+        return self._index_key
+
+    def check_config(self):
+        """On-Prem 시작 시 호출: 키 설정 오류(기본 PII_MASTER_KEY 등)를 첫 요청이 아닌 시작 시점에 발생"""
+        self.provider
+        self.index_key
+
+    def blind_index(self, email: str) -> str:
+        """email Blind Index (대소문자/공백 정규화 후 HMAC-SHA256)"""
+        return hmac.new(
+            self.index_key, email.strip().lower().encode(), hashlib.sha256
+        ).hexdigest()
+
+    def _cache_key(self, key_id: str, aead: AESGCM):
+        self._keys[key_id] = aead
+        self._keys.move_to_end(key_id)
+        while len(self._keys) > settings.PII_DATA_KEY_CACHE_SIZE:
+            self._keys.popitem(last=False)
+
+    async def _current_key(self, db: AsyncSession) -> _DataKey:
+        current = self._current
+        if current is not None and current.remaining_uses > 0 and time.monotonic() < current.expires_at:
+            return current
+
+        if self._rotate_lock is None:
+            self._rotate_lock = asyncio.Lock()
+        async with self._rotate_lock:
+            current = self._current
+            if current is None or current.remaining_uses <= 0 or time.monotonic() >= current.expires_at:
+                with timed("pii_data_key_fetch"):
+                    key, wrapped = await asyncio.to_thread(self.provider.generate_data_key)
+                current = _DataKey(str(uuid.uuid4()), key)
+                # 키를 먼저 커밋: 이 키로 암호화한 행이 래핑 키 없이 저장되는 일이 없도록
+                db.add(
+                    models.PIIDataKey(
+                        key_id=current.key_id, wrapped_key=wrapped, provider=self.provider.name
+                    )
+                )
+                await db.commit()
+                self._cache_key(current.key_id, current.aead)
+                self._current = current
+                logger.info("🔑 [PII Crypto] New data key %s (%s)", current.key_id, self.provider.name)
+            return current
+
+    async def encrypt(self, db: AsyncSession, user_id: str, values: Dict[str, str]) -> dict:
+        """PII 필드를 암호화하여 UserPII 컬럼 값(dict)으로 반환 (key_id, email_bidx 포함)"""
+        data_key = await self._current_key(db)
+        data_key.remaining_uses -= 1
+
+        columns = {"key_id": data_key.key_id, "email_bidx": self.blind_index(values["email"])}
+        for field in PII_FIELDS:
+            nonce = os.urandom(_NONCE_SIZE)
+            columns[field] = nonce + data_key.aead.encrypt(
+                nonce, values[field].encode(), f"{user_id}:{field}".encode()
+            )
+        return columns
+
+    async def _load_keys(self, db: AsyncSession, key_ids: Iterable[str]) -> Dict[str, AESGCM]:
+        """key_id별 AESGCM. 캐시에 없는 키만 모아 KEK로 한 번에 래핑 해제"""
+        found, missing = {}, []
+        for key_id in set(key_ids):
+            aead = self._keys.get(key_id)
+            if aead is None:
+                missing.append(key_id)
+            else:
+                found[key_id] = aead
+        if not missing:
+            return found
+
+        rows = (
+            await db.execute(
+                select(models.PIIDataKey.key_id, models.PIIDataKey.wrapped_key).where(
+                    models.PIIDataKey.key_id.in_(missing)
+                )
+            )
+        ).all()
+        if len(rows) != len(missing):
+            lost = sorted(set(missing) - {row.key_id for row in rows})
+            logger.error("❌ [PII Crypto] Data key(s) not found in pii_data_keys: %s", ", ".join(lost))
+            raise HTTPException(
+                status_code=500, detail=f"PII data key not found: {', '.join(lost)}"
+            )
+
+        with timed("pii_data_key_fetch"):
+            keys = await asyncio.to_thread(self.provider.unwrap, [row.wrapped_key for row in rows])
+        for row, key in zip(rows, keys):
+            found[row.key_id] = AESGCM(key)
+            self._cache_key(row.key_id, found[row.key_id])
+        return found
+
+    async def decrypt_rows(
+        self, db: AsyncSession, rows: List[models.UserPII], fields: Iterable[str] = PII_FIELDS
+    ) -> List[dict]:
+        """
+        UserPII 행(ORM 객체 또는 select 컬럼 Row) 목록을 평문 dict 목록으로 복호화.
+        데이터 키는 행 전체에 대해 한 번만 조회하고, fields에 지정한 필드만 복호화 (user_id + fields 순서).
+        """
+        fields = tuple(fields)
+        keys = await self._load_keys(db, (row.key_id for row in rows if row.key_id))
+
+        with timed("pii_decrypt"):
+            results = []
+            for row in rows:
+                plain = {"user_id": row.user_id}
+                aead = keys[row.key_id] if row.key_id else None
+                for field in fields:
+                    value = getattr(row, field)
+                    if aead is None:
+                        # 암호화 도입 전 평문 행
+                        plain[field] = value.decode() if isinstance(value, bytes) else value
+                    else:
+                        plain[field] = aead.decrypt(
+                            value[:_NONCE_SIZE],
+                            value[_NONCE_SIZE:],
+                            f"{row.user_id}:{field}".encode(),
+                        ).decode()
+                results.append(plain)
+        return results
+
+
+pii_cipher = PIICipher()
@@ -0,0 +1,103 @@
+import hashlib
+import math
+import random
+import time
+from typing import Callable, List, Optional, Sequence
+import numpy as np
+
+# 가격 모델 상수 (기존 calculate_quote 루프와 동일)
+QUOTE_ITERATIONS = 6000
+BASE_PRICE = 1000.0
+MIN_PRICE = 500.0  # 최저가 제한
+DISCOUNT_MODULO = 50
+
+# 앱 시작(모듈 임포트) 시 1회만 계산하는 테이블
+_INDEX = np.arange(QUOTE_ITERATIONS, dtype=np.float64)
+_SQRT_TABLE = np.sqrt(_INDEX)
+# base_price의 sin(i) 누적분은 난수와 무관하므로 상수로 미리 계산
+_ADJUSTED_BASE_PRICE = BASE_PRICE + float(np.sum(np.sin(_INDEX) * 0.01))
+
+
+def draw_random(count: int, seed: Optional[int] = None) -> np.ndarray:
+    """
+    견적 count건에 필요한 난수 행렬 (count x QUOTE_ITERATIONS).
+    seed가 주어지면 모든 건이 동일한 난수열을 사용 (재현 가능 모드, 회귀 비교용).
+    """
+    if seed is not None:
+        row = np.random.default_rng(seed).random(QUOTE_ITERATIONS)
+        return np.broadcast_to(row, (count, QUOTE_ITERATIONS))
+    return np.random.default_rng().random((count, QUOTE_ITERATIONS))
+
+
+def compute_prices(draws: np.ndarray) -> np.ndarray:
+    """벡터화된 가격 계산: discount = Σ sqrt(i) * r_i 를 행렬곱 한 번으로 처리"""
+    discount_factor = draws @ _SQRT_TABLE
+    return np.maximum(
+        _ADJUSTED_BASE_PRICE - np.mod(discount_factor, DISCOUNT_MODULO), MIN_PRICE
+    )
+
+
+def compute_price_reference(draws: Optional[Sequence[float]] = None) -> float:
+    """
+    기존 calculate_quote의 순수 Python 루프 구현 (회귀 비교용 기준값).
+    draws를 넘기면 random.random() 대신 해당 난수열을 사용.
+    """
+    base_price = BASE_PRICE
+    discount_factor = 0.0
+
+    for i in range(QUOTE_ITERATIONS):
+        r = draws[i] if draws is not None else random.random()
+        discount_factor += math.sqrt(i) * r
+        base_price = base_price + (math.sin(i) * 0.01)
+
+    return max(base_price - (discount_factor % DISCOUNT_MODULO), MIN_PRICE)
+
+
+def quote_token(user_id: str, destination: str, final_price: float, departure_date) -> str:
+    # 위변조 방지 토큰 생성 (SHA-256 해싱)
+    quote_data = f"{user_id}#{destination}#{final_price}#{departure_date}"
+    return hashlib.sha256(quote_data.encode()).hexdigest()
+
+
+def calculate_quotes(bookings: List[dict], seed: Optional[int] = None) -> List[dict]:
+    """
+    예약 요청 목록의 견적을 한 번에 산출.
+    bookings 항목은 user_id, destination, departure_date 키를 가진 dict.
+    """
+    if not bookings:
+        return []
+
+    prices = compute_prices(draw_random(len(bookings), seed))
+
+    quotes = []
+    for booking, price in zip(bookings, prices.tolist()):
+        quotes.append(
+            {
+                "user_id": booking["user_id"],
+                "destination": booking["destination"],
+                "estimated_price": round(price, 2),
+                "quote_token": quote_token(
+                    booking["user_id"],
+                    booking["destination"],
+                    price,
+                    booking["departure_date"],
+                ),
+                "valid_until": "15 minutes",
+            }
+        )
+    return quotes
+
+
+# -----------------------------------------------------------------------------
+# 프로세스 풀 워커에서 실행되는 함수
+# (워커가 설정/DB 모듈을 임포트하지 않도록 의존성이 없는 이 모듈에 둠)
+# -----------------------------------------------------------------------------
+def warm_up():
+    """워커 시작 시 호출: 모듈 임포트만으로 NumPy와 테이블이 준비됨"""
+
+
+def timed_call(fn: Callable, args: tuple):
+    # 순수 계산 시간만 측정해 결과와 함께 반환
+    started = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - started
@@ -0,0 +1,120 @@
+import asyncio
+import logging
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Optional
+from starlette.concurrency import run_in_threadpool
+from app.core.config import settings
+from app.core.metrics import observe
+from app.core.quote_engine import timed_call, warm_up
+
+logger = logging.getLogger("uvicorn")
+
+
+class QuoteExecutorSaturated(Exception):
+    """대기열이 가득 차 새 견적 작업을 받을 수 없음 (429로 응답)"""
+
+
+class QuoteExecutor:
+    """
+    CPU 집약적인 견적 계산을 별도 프로세스 풀로 넘겨 이벤트 루프/GIL 경합을 차단.
+    대기 중 + 실행 중 작업이 max_pending에 도달하면 즉시 거절 (Backpressure).
+    max_workers=0이면 프로세스 풀 없이 Starlette 스레드풀에서 실행.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+        # 메트릭
+        self.pending = 0  # 대기 + 실행 중
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.exec_seconds_total = 0.0
+        self.exec_seconds_max = 0.0
+        self.wait_seconds_total = 0.0
+
+    def start(self):
+        """FastAPI lifespan 시작 시 호출: 워커 프로세스 생성"""
+        if self.max_workers <= 0 or self._executor is not None:
+            return
+
+        # spawn: 이벤트 루프/DB Pool 등 부모 프로세스 상태를 복제하지 않음
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=warm_up,
+        )
+        # 워커는 작업 제출 시점에 생성되므로 미리 띄워 첫 요청의 spawn 지연을 제거
+        for _ in range(self.max_workers):
+            self._executor.submit(warm_up)
+        logger.info(
+            f"✅ [Quote Executor] Process pool started "
+            f"(workers={self.max_workers}, max_pending={self.max_pending})"
+        )
+
+    async def shutdown(self):
+        """FastAPI lifespan 종료 시 호출: 대기 작업 취소 후 워커 종료"""
+        if self._executor is not None:
+            executor, self._executor = self._executor, None
+            await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
+            logger.info("🔌 [Quote Executor] Process pool stopped.")
+
+    async def run(self, fn: Callable, *args: Any) -> Any:
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise QuoteExecutorSaturated()
+
+        self.pending += 1
+        submitted = time.perf_counter()
+        try:
+            if self._executor is None:
+                result, exec_seconds = await run_in_threadpool(timed_call, fn, args)
+            else:
+                loop = asyncio.get_running_loop()
+                result, exec_seconds = await loop.run_in_executor(
+                    self._executor, timed_call, fn, args
+                )
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            self.pending -= 1
+
+        wait_seconds = max(time.perf_counter() - submitted - exec_seconds, 0.0)
+        self.completed += 1
+        self.exec_seconds_total += exec_seconds
+        self.exec_seconds_max = max(self.exec_seconds_max, exec_seconds)
+        self.wait_seconds_total += wait_seconds
+        # 워커에서 측정한 순수 계산 시간과 큐/IPC 대기 시간을 분리해 기록
+        observe("quote_compute", exec_seconds)
+        observe("quote_queue_wait", wait_seconds)
+        return result
+
+    def stats(self) -> dict:
+        workers = self.max_workers if self._executor is not None else 0
+        return {
+            "workers": workers,
+            "max_pending": self.max_pending,
+            "pending": self.pending,
+            "queue_depth": max(self.pending - workers, 0) if workers else 0,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "avg_exec_ms": round(self.exec_seconds_total / self.completed * 1000, 3)
+            if self.completed
+            else 0.0,
+            "max_exec_ms": round(self.exec_seconds_max * 1000, 3),
+            "avg_wait_ms": round(self.wait_seconds_total / self.completed * 1000, 3)
+            if self.completed
+            else 0.0,
+        }
+
+
+quote_executor = QuoteExecutor(
+    max_workers=settings.QUOTE_PROCESS_WORKERS,
+    max_pending=settings.QUOTE_MAX_PENDING,
+)
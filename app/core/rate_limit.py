@@ -0,0 +1,251 @@
+"""
+내부 PII API 호출자별 Rate Limit / 동시 요청 상한 (On-Prem).
+
+클라우드 배치 작업 하나가 온프레미스 DB Pool을 점유하지 않도록 호출자(내부 토큰으로 식별)마다
+- 토큰 버킷: 초당 INTERNAL_RATE_LIMIT_RPS개 충전, 최대 INTERNAL_RATE_LIMIT_BURST개까지 몰아서 허용
+- 동시 요청 상한: 처리 중인 요청이 INTERNAL_MAX_CONCURRENCY_PER_CALLER개면 대기 없이 거절
+일괄 조회는 user_id 수만큼 토큰을 차감 (charge). 초과 시 RateLimitExceeded(retry_after)를 발생시키고 라우터가 429 + Retry-After로 응답.
+주 호출자(클라우드 서비스, "default")는 INTERNAL_DEFAULT_CALLER_* 한도를 따로 사용
+(클라우드의 동시 호출 상한 ONPREM_MAX_CONCURRENCY 이상, 토큰 버킷은 RPS가 0이면 미적용).
+
+토큰 버킷 저장소 (RATE_LIMIT_BACKEND):
+- memory: 프로세스 메모리 (기본). 워커마다 따로 세므로 전체 한도는 워커 수만큼 커짐
+- redis: Lua 스크립트로 원자적으로 차감하여 워커/호스트 간 공유 (redis 패키지 필요).
+  Redis 장애 시에는 내부 API 전체가 막히지 않도록 허용하고 동시 요청 상한만 적용
+동시 요청 상한은 항상 프로세스 단위.
+"""
+import logging
+import time
+from typing import Dict, Optional, Tuple
+from app.core.config import settings
+from app.core.metrics import INTERNAL_INFLIGHT, INTERNAL_RATE_LIMITED
+from app.core.security import DEFAULT_INTERNAL_CALLER
+
+logger = logging.getLogger("uvicorn")
+
+
+class RateLimitExceeded(Exception):
+    """호출자 한도 초과: retry_after초 후 재시도"""
+
+    def __init__(self, caller: str, reason: str, retry_after: float):
+        super().__init__(f"Rate limit exceeded for '{caller}' ({reason})")
+        self.caller = caller
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class MemoryTokenBucket:
+    """프로세스 메모리 토큰 버킷 (이벤트 루프 단일 스레드 전용, 호출자 수만큼만 키가 생김)"""
+
+    name = "memory"
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._buckets: Dict[str, Tuple[float, float]] = {}  # key -> (남은 토큰, 갱신 시각)
+
+    async def take(self, key: str, cost: float = 1.0) -> float:
+        """cost만큼 차감. 허용하면 0, 토큰이 부족하면 충전까지 남은 시간 (초)"""
+        now = time.monotonic()
+        tokens, updated_at = self._buckets.get(key, (self.burst, now))
+        tokens = min(self.burst, tokens + (now - updated_at) * self.rate)
+        if tokens >= cost:
+            self._buckets[key] = (tokens - cost, now)
+            return 0.0
+        self._buckets[key] = (tokens, now)
+        return (cost - tokens) / self.rate
+
+    async def close(self):
+        self._buckets.clear()
+
+
+class RedisTokenBucket:
+    """Redis 토큰 버킷: 충전/차감을 Lua 스크립트 1회로 처리 (시각은 Redis 서버 기준)"""
+
+    name = "redis"
+
+    # 반환값은 재시도까지 남은 시간 문자열 (Lua number는 정수로 잘리므로)
+    _SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or burst
+local ts = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+local retry_after = 0
+if tokens >= cost then
+  tokens = tokens - cost
+else
+  retry_after = (cost - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate) + 1)
+return tostring(retry_after)
+"""
+
+    def __init__(self, url: str, rate: float, burst: int, prefix: str = "ratelimit:pii:"):
+        import redis.asyncio as redis  # 선택 의존성: RATE_LIMIT_BACKEND=redis일 때만 필요
+
+        self.rate = rate
+        self.burst = burst
+        self.prefix = prefix
+        self._redis = redis.from_url(url)
+        self._script = self._redis.register_script(self._SCRIPT)
+        self._failing = False
+
+    async def take(self, key: str, cost: float = 1.0) -> float:
+        try:
+            retry_after = await self._script(
+                keys=[self.prefix + key], args=[self.rate, self.burst, cost]
+            )
+        except Exception as exc:
+            # 장애 시작 시 1회만 로그 (요청마다 남기지 않음)
+            if not self._failing:
+                logger.warning("⚠️ [Rate Limit] Redis unavailable, allowing requests: %s", exc)
+                self._failing = True
+            return 0.0
+        if self._failing:
+            logger.info("✅ [Rate Limit] Redis reachable again")
+            self._failing = False
+        return float(retry_after)
+
+    async def close(self):
+        await self._redis.aclose()
+
+
+def _create_bucket(rate: float, burst: int):
+    """토큰 버킷 저장소 생성 (rate가 0 이하면 None: 토큰 버킷 미적용)"""
+    if rate <= 0:
+        return None
+    if settings.RATE_LIMIT_BACKEND == "redis":
+        return RedisTokenBucket(settings.RATE_LIMIT_REDIS_URL, rate, burst)
+    if settings.RATE_LIMIT_BACKEND != "memory":
+        raise ValueError(f"Unknown RATE_LIMIT_BACKEND '{settings.RATE_LIMIT_BACKEND}'")
+    return MemoryTokenBucket(rate, burst)
+
+
+class CallerLimiter:
+    """
+    호출자별 토큰 버킷 + 동시 요청 상한 (이벤트 루프 단일 스레드 전용).
+    bucket은 take(key, cost) -> retry_after / close()를 제공하는 저장소 (MemoryTokenBucket 등, None이면 미적용).
+    overrides는 호출자 이름 -> (bucket, max_concurrency)로 기본 한도 대신 쓸 호출자별 한도.
+    """
+
+    def __init__(
+        self,
+        bucket,
+        max_concurrency: int,
+        overrides: Optional[Dict[str, Tuple[object, int]]] = None,
+    ):
+        self.bucket = bucket
+        self.max_concurrency = max_concurrency
+        self.overrides = overrides or {}
+        self._inflight: Dict[str, int] = {}
+
+    def _budget(self, caller: str) -> Tuple[object, int]:
+        return self.overrides.get(caller, (self.bucket, self.max_concurrency))
+
+    def _reject(self, caller: str, reason: str, retry_after: float):
+        INTERNAL_RATE_LIMITED.labels(caller, reason).inc()
+        logger.warning(
+            "⛔ [Rate Limit] %s rejected (%s, retry after %.2fs)", caller, reason, retry_after
+        )
+        raise RateLimitExceeded(caller, reason, retry_after)
+
+    def _set_inflight(self, caller: str, count: int):
+        if count:
+            self._inflight[caller] = count
+        else:
+            self._inflight.pop(caller, None)
+        INTERNAL_INFLIGHT.labels(caller).set(count)
+
+    async def acquire(self, caller: str, cost: float = 1.0):
+        """caller의 동시 요청 슬롯 1개를 점유 (처리 후 release 필수). 한도 초과면 RateLimitExceeded"""
+        bucket, max_concurrency = self._budget(caller)
+        inflight = self._inflight.get(caller, 0)
+        if max_concurrency > 0 and inflight >= max_concurrency:
+            # 처리 중인 요청이 끝나야 자리가 나므로 짧게 대기 후 재시도하도록 안내
+            self._reject(caller, "concurrency", 1.0)
+
+        # 슬롯을 먼저 확보 (Redis 응답을 기다리는 동안 다른 요청이 상한을 넘지 않도록)
+        self._set_inflight(caller, inflight + 1)
+        if bucket is None:
+            return
+        try:
+            retry_after = await bucket.take(caller, cost)
+        except BaseException:
+            self.release(caller)
+            raise
+        if retry_after > 0:
+            self.release(caller)
+            self._reject(caller, "rate", retry_after)
+
+    async def charge(self, caller: str, cost: float):
+        """
+        이미 슬롯을 점유한 요청에 토큰을 추가로 차감 (일괄 조회 등 요청 크기에 비례한 비용).
+        버킷 크기보다 큰 비용은 버킷 크기로 제한 (가득 찬 버킷이면 항상 통과할 수 있도록).
+        """
+        bucket, _ = self._budget(caller)
+        if bucket is None:
+            return
+        cost = min(cost, bucket.burst)
+        if cost <= 0:
+            return
+        retry_after = await bucket.take(caller, cost)
+        if retry_after > 0:
+            self._reject(caller, "rate", retry_after)
+
+    def release(self, caller: str):
+        self._set_inflight(caller, max(self._inflight.get(caller, 0) - 1, 0))
+
+    async def close(self):
+        """토큰 버킷 저장소 정리 (Redis 연결 등)"""
+        for bucket in [self.bucket, *(bucket for bucket, _ in self.overrides.values())]:
+            if bucket is not None:
+                await bucket.close()
+
+
+_limiter: Optional[CallerLimiter] = None
+
+
+def get_internal_limiter() -> CallerLimiter:
+    """내부 PII API용 Limiter (첫 요청 시 생성: fork 이후 워커마다 따로 만들어짐)"""
+    global _limiter
+    if _limiter is None:
+        default_bucket = _create_bucket(
+            settings.INTERNAL_DEFAULT_CALLER_RATE_LIMIT_RPS,
+            settings.INTERNAL_DEFAULT_CALLER_RATE_LIMIT_BURST,
+        )
+        _limiter = CallerLimiter(
+            _create_bucket(settings.INTERNAL_RATE_LIMIT_RPS, settings.INTERNAL_RATE_LIMIT_BURST),
+            settings.INTERNAL_MAX_CONCURRENCY_PER_CALLER,
+            overrides={
+                DEFAULT_INTERNAL_CALLER: (
+                    default_bucket,
+                    settings.INTERNAL_DEFAULT_CALLER_MAX_CONCURRENCY,
+                )
+            },
+        )
+        logger.info(
+            "✅ [Rate Limit] %s bucket (%.0f rps, burst %d), max %d in-flight per caller; "
+            "%s: %s, max %d in-flight",
+            settings.RATE_LIMIT_BACKEND,
+            settings.INTERNAL_RATE_LIMIT_RPS,
+            settings.INTERNAL_RATE_LIMIT_BURST,
+            settings.INTERNAL_MAX_CONCURRENCY_PER_CALLER,
+            DEFAULT_INTERNAL_CALLER,
+            f"{settings.INTERNAL_DEFAULT_CALLER_RATE_LIMIT_RPS:.0f} rps" if default_bucket else "no rate limit",
+            settings.INTERNAL_DEFAULT_CALLER_MAX_CONCURRENCY,
+        )
+    return _limiter
+
+
+async def close_internal_limiter():
+    """FastAPI lifespan 종료 시 호출 (Redis 연결 정리)"""
+    global _limiter
+    if _limiter is not None:
+        limiter, _limiter = _limiter, None
+        await limiter.close()
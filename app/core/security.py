@@ -1,40 +1,109 @@
+import hmac
 import logging
+import threading
+import time
+from functools import lru_cache
+from typing import Optional, Tuple
 import hvac
 from app.core.config import settings
+from app.core.metrics import timed
 
 logger = logging.getLogger("uvicorn")
 
+# 토큰 만료 몇 초 전에 갱신할지 (네트워크 지연 여유분)
+_TOKEN_RENEW_MARGIN = 30
 
-def get_db_credentials():
+
+def _parse_duration(value) -> int:
+    """Vault TTL 표기("3600", "30m", "1h", 3600)를 초 단위로 변환"""
+    if value is None or value == "":
+        return 0
+    if isinstance(value, (int, float)):
+        return int(value)
+
+    value = str(value).strip()
+    units = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+    if value[-1] in units:
+        return int(float(value[:-1]) * units[value[-1]])
+    return int(float(value))
+
+
+class VaultCredentialProvider:
     """
-    Vault에 AppRole로 로그인하여 DB 접속 정보를 가져옴.
-    이 함수는 온프레미스 환경에서만 호출되어야 함.
+    Vault AppRole 토큰과 DB Secret을 캐시하는 Credential Provider.
+    - 토큰은 만료 전에 renew-self로 연장하고, 연장할 수 없으면 재로그인
+    - Secret은 lease_duration / KV metadata(ttl) 기간 동안 캐시 (없으면 VAULT_SECRET_CACHE_TTL)
+    - 동시 조회는 락 하나로 합쳐 Vault 호출을 1회만 수행
     """
-    # Cloud 모드이거나 ID가 없으면 에러
-    if not settings.IS_ONPREM:
-        raise RuntimeError("Vault access is NOT allowed in Cloud mode.")
 
-    if not settings.VAULT_ROLE_ID or not settings.VAULT_SECRET_ID:
-        raise ValueError("Vault Credentials (RoleID/SecretID) are missing!")
+    def __init__(self, url: str, role_id: str, secret_id: str, path: str = "pii-db"):
+        self.url = url
+        self.role_id = role_id
+        self.secret_id = secret_id
+        self.path = path
+
+        self._lock = threading.Lock()
+        self._client: Optional[hvac.Client] = None
+        self._token_expires_at = 0.0
+        self._token_renewable = False
 
-    client = hvac.Client(url=settings.VAULT_ADDR)
+        self._credentials: Optional[dict] = None
+        self._lease_duration = 0  # Vault가 알려준 Credential 유효 기간 (0이면 정보 없음)
+        self._fetched_at = 0.0
+        self._cache_expires_at = 0.0
 
-    try:
-        # 1. AppRole 로그인
-        logger.info(f"🔐 [Vault] Connecting to {settings.VAULT_ADDR}...")
-        client.auth.approle.login(
-            role_id=settings.VAULT_ROLE_ID, secret_id=settings.VAULT_SECRET_ID
+    def _login(self):
+        client = hvac.Client(url=self.url)
+        logger.info(f"🔐 [Vault] Connecting to {self.url}...")
+        response = client.auth.approle.login(
+            role_id=self.role_id, secret_id=self.secret_id
         )
+        auth = response.get("auth") or {}
+        self._client = client
+        self._token_renewable = bool(auth.get("renewable"))
+        self._token_expires_at = _token_expiry(auth.get("lease_duration"))
+
+    def _ensure_token(self) -> hvac.Client:
+        """캐시된 토큰 반환. 만료가 가까우면 연장(renew) 또는 재로그인."""
+        now = time.monotonic()
+        if self._client is not None and now < self._token_expires_at - _TOKEN_RENEW_MARGIN:
+            return self._client
 
-        # 2. Secret 조회 (KV Engine v2 기준)
+        if self._client is not None and self._token_renewable:
+            try:
+                response = self._client.auth.token.renew_self()
+                auth = response.get("auth") or {}
+                self._token_expires_at = _token_expiry(auth.get("lease_duration"))
+                logger.info("🔄 [Vault] Token renewed.")
+                return self._client
+            except Exception as e:
+                logger.warning(f"⚠️ [Vault] Token renew failed, re-authenticating: {str(e)}")
+
+        self._login()
+        return self._client
+
+    def client(self) -> hvac.Client:
+        """인증된 Vault 클라이언트 (Transit 등 다른 Secret Engine 호출용, 토큰 캐시 공유)"""
+        with self._lock:
+            return self._ensure_token()
+
+    def _read_secret(self, client: hvac.Client) -> dict:
+        # Secret 조회 (KV Engine v2 기준)
         # mount_point='secret', path='pii-db'
-        read_response = client.secrets.kv.v2.read_secret_version(path="pii-db")
+        read_response = client.secrets.kv.v2.read_secret_version(path=self.path)
 
-        # 3. 데이터 추출 (kv v2는 data['data']['data'] 구조일 수 있음, hvac 버전에 따라 data['data']일수도 있음)
+        # 데이터 추출 (kv v2는 data['data']['data'] 구조일 수 있음, hvac 버전에 따라 data['data']일수도 있음)
         # 보통 hvac read_secret_version 응답의 'data' 키 안에 실제 secret data가 'data' 키로 들어있음
         secret_payload = read_response["data"]["data"]
+        metadata = read_response["data"].get("metadata") or {}
+        custom_metadata = metadata.get("custom_metadata") or {}
 
-        logger.info("✅ [Vault] DB Credentials retrieved successfully.")
+        # Credential 유효 기간: Dynamic Secret은 lease_duration, KV는 metadata/ttl 필드 사용
+        self._lease_duration = (
+            _parse_duration(read_response.get("lease_duration"))
+            or _parse_duration(custom_metadata.get("ttl"))
+            or _parse_duration(secret_payload.get("ttl"))
+        )
 
         return {
             "user": secret_payload["username"],
@@ -42,8 +111,123 @@ def get_db_credentials():
             "host": secret_payload.get("host", "10.10.10.10"),
             "port": int(secret_payload.get("port", 3306)),
             "db": "pii_db",
+            # 읽기 전용 Replica (쉼표로 구분한 host[:port], 같은 Credential 사용)
+            "reader_hosts": secret_payload.get("reader_hosts", ""),
         }
 
-    except Exception as e:
-        logger.error(f"❌ [Vault Error] Failed to get secrets: {str(e)}")
-        raise e
+    def get_db_credentials(self, force_refresh: bool = False) -> dict:
+        """
+        DB Credential 반환 (캐시 우선).
+        force_refresh=True면 Vault에서 다시 읽되, 락을 기다리는 동안 다른 스레드가
+        이미 새로 읽었다면 그 결과를 공유.
+        """
+        requested_at = time.monotonic()
+        with self._lock:
+            now = time.monotonic()
+            fresh = self._credentials is not None and (
+                self._fetched_at >= requested_at
+                or (not force_refresh and now < self._cache_expires_at)
+            )
+
+            if not fresh:
+                try:
+                    with timed("vault_fetch"):
+                        client = self._ensure_token()
+                        try:
+                            self._credentials = self._read_secret(client)
+                        except hvac.exceptions.Forbidden:
+                            # 토큰이 서버 측에서 폐기된 경우: 재로그인 후 1회 재시도
+                            self._login()
+                            self._credentials = self._read_secret(self._client)
+                except Exception as e:
+                    logger.error(f"❌ [Vault Error] Failed to get secrets: {str(e)}")
+                    raise e
+
+                now = time.monotonic()
+                self._fetched_at = now
+                self._cache_expires_at = now + (
+                    self._lease_duration or settings.VAULT_SECRET_CACHE_TTL
+                )
+                logger.info("✅ [Vault] DB Credentials retrieved successfully.")
+
+            credentials = dict(self._credentials)
+            # 남은 유효 기간 (Pool 선제 교체 시점 계산용)
+            credentials["lease_duration"] = (
+                max(int(self._fetched_at + self._lease_duration - now), 0)
+                if self._lease_duration
+                else 0
+            )
+            return credentials
+
+    def invalidate(self):
+        """캐시된 토큰/Secret 폐기 (프로세스 fork 이후 등)"""
+        with self._lock:
+            self._client = None
+            self._credentials = None
+            self._token_expires_at = 0.0
+            self._cache_expires_at = 0.0
+
+
+def _token_expiry(lease_duration) -> float:
+    # lease_duration이 0이면 만료 없는 토큰 (root 등)
+    ttl = _parse_duration(lease_duration)
+    return time.monotonic() + ttl if ttl else float("inf")
+
+
+_provider: Optional[VaultCredentialProvider] = None
+_provider_lock = threading.Lock()
+
+
+def get_credential_provider() -> VaultCredentialProvider:
+    global _provider
+    with _provider_lock:
+        if _provider is None:
+            _provider = VaultCredentialProvider(
+                settings.VAULT_ADDR, settings.VAULT_ROLE_ID, settings.VAULT_SECRET_ID
+            )
+        return _provider
+
+
+def get_db_credentials(force_refresh: bool = False):
+    """
+    Vault에 AppRole로 로그인하여 DB 접속 정보를 가져옴 (토큰/Secret 캐시 사용).
+    이 함수는 온프레미스 환경에서만 호출되어야 함.
+    """
+    # Cloud 모드이거나 ID가 없으면 에러
+    if not settings.IS_ONPREM:
+        raise RuntimeError("Vault access is NOT allowed in Cloud mode.")
+
+    if not settings.VAULT_ROLE_ID or not settings.VAULT_SECRET_ID:
+        raise ValueError("Vault Credentials (RoleID/SecretID) are missing!")
+
+    return get_credential_provider().get_db_credentials(force_refresh=force_refresh)
+
+
+# INTERNAL_API_TOKEN으로 식별되는 주 호출자 (클라우드 서비스)
+DEFAULT_INTERNAL_CALLER = "default"
+
+
+@lru_cache(maxsize=4)
+def _internal_callers(default_token: str, callers: str) -> Tuple[Tuple[str, bytes], ...]:
+    """INTERNAL_API_TOKEN + INTERNAL_API_CALLERS("이름:토큰,...") -> ((이름, 토큰), ...)"""
+    entries = [(DEFAULT_INTERNAL_CALLER, default_token)]
+    for item in callers.split(","):
+        name, _, token = item.strip().partition(":")
+        if name and token:
+            entries.append((name, token))
+    return tuple((name, token.encode()) for name, token in entries if token)
+
+
+def identify_internal_caller(token: Optional[str]) -> Optional[str]:
+    """
+    내부 통신 토큰에 대응하는 호출자 이름 (없으면 None).
+    모든 토큰을 hmac.compare_digest로 비교하여 응답 시간으로 토큰을 추측할 수 없도록 함.
+    """
+    presented = (token or "").encode()
+    caller = None
+    for name, expected in _internal_callers(
+        settings.INTERNAL_API_TOKEN, settings.INTERNAL_API_CALLERS
+    ):
+        if hmac.compare_digest(presented, expected) and caller is None:
+            caller = name
+    return caller
@@ -0,0 +1,63 @@
+"""
+응답 Fast-path 직렬화.
+
+DB에서 읽은 값(또는 요청 검증을 이미 통과한 입력)으로 만든 응답은 response_model로 다시 검증하지 않고
+필요한 필드만 dict로 뽑아 orjson으로 바로 직렬화 (엔드포인트가 Response를 반환하면 FastAPI는
+response_model 검증/직렬화를 생략함). response_model은 OpenAPI 문서용으로 그대로 둠.
+- Projection: 응답 모델의 필드 목록과 getter를 모델당 1회만 만들어 행/ORM 객체/dict를 dict로 변환
+- RESPONSE_FAST_PATH=false면 dict를 그대로 반환하여 기존 검증 경로(response_model)로 처리
+
+앱 기본 응답 클래스는 바꾸지 않음: 최신 FastAPI는 response_model이 있는 응답을 pydantic-core로
+바로 JSON 직렬화하는데, 기본 응답 클래스를 지정하면 이 경로가 꺼짐.
+"""
+from operator import attrgetter, itemgetter
+from typing import Any, Optional, Type
+import orjson
+from fastapi import Response
+from pydantic import BaseModel
+from app.core.config import settings
+
+
+class ORJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        # date/datetime/UUID는 orjson이 ISO 형식으로 직접 직렬화
+        return orjson.dumps(content)
+
+
+class Projection:
+    """응답 모델 필드 순서대로 값을 뽑아 dict로 만드는 변환기 (검증 없음, 2개 이상 필드 모델용)"""
+
+    __slots__ = ("fields", "_attrs", "_items")
+
+    def __init__(self, model: Type[BaseModel]):
+        self.fields = tuple(model.model_fields)
+        self._attrs = attrgetter(*self.fields)
+        self._items = itemgetter(*self.fields)
+
+    def columns(self, entity) -> tuple:
+        """SELECT할 ORM 컬럼 (행 전체 대신 응답에 필요한 컬럼만 조회)"""
+        return tuple(getattr(entity, field) for field in self.fields)
+
+    def from_attributes(self, obj) -> dict:
+        """ORM 객체 / Row(select 컬럼 튜플) -> dict"""
+        return dict(zip(self.fields, self._attrs(obj)))
+
+    def from_mapping(self, mapping) -> dict:
+        """dict / RowMapping -> dict (응답 모델에 없는 키는 버림)"""
+        return dict(zip(self.fields, self._items(mapping)))
+
+
+def fast_response(content: Any, response: Optional[Response] = None):
+    """
+    신뢰된 데이터를 검증 없이 orjson으로 응답.
+    response: 엔드포인트에 주입된 Response (설정한 status_code/헤더를 그대로 옮김)
+    """
+    if not settings.RESPONSE_FAST_PATH:
+        return content
+    if response is None:
+        return ORJSONResponse(content)
+    fast = ORJSONResponse(content, status_code=response.status_code or 200)
+    fast.headers.update(response.headers)
+    return fast
@@ -0,0 +1,237 @@
+"""
+벤더 호출 Outbox 워커 (Cloud).
+
+확정 요청은 예약 선점(PENDING -> PROCESSING)과 vendor_outbox INSERT를 한 트랜잭션으로 커밋하고
+바로 202로 응답 (confirm_pipeline.enqueue_confirmation). 워커는 처리 대기 행을 배치로 가져와
+PII 일괄 조회 -> 벤더 동시 호출 -> 확정/재시도 상태 반영을 커밋 1회로 수행.
+- 가져간 행은 OUTBOX_LEASE_SECONDS 동안 다른 워커가 가져가지 않으므로 API 워커 여러 개와
+  별도 워커 프로세스(scripts/outbox_worker.py)를 함께 실행해도 중복 처리하지 않음
+- 최소 1회(at-least-once) 실행: 벤더 호출 후 커밋 전에 중단되면 리스 만료 뒤 다시 호출되므로
+  실제 벤더 연동 시 booking_id를 멱등 키로 전달해야 함
+"""
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+from fastapi import HTTPException
+from sqlalchemy import and_, select, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.cache import get_pii_batch_cached
+from app.core.config import settings
+from app.core.confirm_pipeline import execute_vendor_booking, mark_confirmed, release_claims
+from app.core.database import async_session_scope
+from app.core.metrics import timed
+from app.models import booking as models
+
+logger = logging.getLogger("uvicorn")
+
+_worker_task: Optional[asyncio.Task] = None
+_wakeup: Optional[asyncio.Event] = None  # 같은 프로세스의 확정 요청이 폴링 간격을 기다리지 않도록 깨움
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _retry_delay(attempts: int) -> float:
+    return min(
+        settings.OUTBOX_RETRY_BACKOFF * (2 ** (attempts - 1)), settings.OUTBOX_RETRY_BACKOFF_MAX
+    )
+
+
+async def _claim_batch(db: AsyncSession, batch_size: int) -> List[dict]:
+    """
+    처리 시각이 된 PENDING 행을 가져가 리스 설정 (next_attempt_at을 리스 만료로 미루고 attempts + 1) 후 커밋.
+    claim_bookings와 같은 방식: RETURNING 지원 DB는 UPDATE 한 문장, MySQL은 FOR UPDATE SKIP LOCKED.
+    """
+    outbox = models.VendorOutbox
+    now = _utcnow()
+    due = and_(outbox.status == "PENDING", outbox.next_attempt_at <= now)
+    lease = update(outbox).values(
+        next_attempt_at=now + timedelta(seconds=settings.OUTBOX_LEASE_SECONDS),
+        attempts=outbox.attempts + 1,
+    )
+
+    if db.bind.dialect.update_returning:
+        candidates = (
+            select(outbox.outbox_id).where(due).order_by(outbox.next_attempt_at).limit(batch_size)
+        )
+        rows = await db.execute(
+            lease.where(outbox.outbox_id.in_(candidates), due).returning(
+                outbox.outbox_id, outbox.booking_id, outbox.attempts
+            ),
+            execution_options={"synchronize_session": False},
+        )
+        entries = [row._asdict() for row in rows]
+    else:
+        rows = await db.execute(
+            select(outbox.outbox_id, outbox.booking_id, outbox.attempts)
+            .where(due)
+            .order_by(outbox.next_attempt_at)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        entries = [dict(row._asdict(), attempts=row.attempts + 1) for row in rows]
+        if entries:
+            await db.execute(
+                lease.where(outbox.outbox_id.in_([e["outbox_id"] for e in entries])).execution_options(
+                    synchronize_session=False
+                )
+            )
+    await db.commit()
+    return entries
+
+
+async def _process_batch(db: AsyncSession, entries: List[dict]):
+    """가져간 행의 벤더 호출을 실행하고 결과(확정/재시도/실패)를 커밋 1회로 반영"""
+    rows = await db.execute(
+        select(models.Booking).where(
+            models.Booking.booking_id.in_([e["booking_id"] for e in entries])
+        )
+    )
+    bookings = {booking.booking_id: booking for booking in rows.scalars()}
+    pending = [b for b in bookings.values() if b.status == "PROCESSING"]
+
+    # PII Fan-in (중복 user_id는 1회만 조회)
+    pii_by_user: Dict[str, Optional[dict]] = {}
+    pii_error: Optional[str] = None
+    if pending:
+        try:
+            pii_by_user = await get_pii_batch_cached(b.user_id for b in pending)
+        except HTTPException as exc:
+            pii_error = f"PII unavailable: {exc.detail}"
+
+    semaphore = asyncio.Semaphore(settings.CONFIRM_VENDOR_CONCURRENCY)
+
+    async def run_vendor(entry: dict):
+        """(entry, hotel_name, error, retryable)"""
+        booking = bookings.get(entry["booking_id"])
+        if booking is None or booking.status != "PROCESSING":
+            # 이미 확정/삭제된 예약: 벤더 호출 없이 완료 처리
+            return entry, None, None, False
+        if pii_error is not None:
+            return entry, None, pii_error, True
+        pii_data = pii_by_user.get(booking.user_id)
+        if pii_data is None:
+            return entry, None, "User PII not found", False
+        async with semaphore:
+            try:
+                return entry, await execute_vendor_booking(booking, pii_data), None, True
+            except Exception as exc:
+                logger.error("❌ [Outbox] Vendor call failed for #%s: %s", booking.booking_id, exc)
+                return entry, None, f"Vendor call failed: {exc}", True
+
+    now = _utcnow()
+    confirmed, done, retries, failed = [], [], [], []
+    for entry, hotel_name, error, retryable in await asyncio.gather(
+        *(run_vendor(entry) for entry in entries)
+    ):
+        if hotel_name is not None:
+            confirmed.append({"booking_id": entry["booking_id"], "hotel_name": hotel_name})
+            done.append({"outbox_id": entry["outbox_id"], "status": "DONE", "processed_at": now})
+        elif error is None:
+            done.append({"outbox_id": entry["outbox_id"], "status": "DONE", "processed_at": now})
+        elif retryable and entry["attempts"] < settings.OUTBOX_MAX_ATTEMPTS:
+            retries.append(
+                {
+                    "outbox_id": entry["outbox_id"],
+                    "next_attempt_at": now + timedelta(seconds=_retry_delay(entry["attempts"])),
+                    "last_error": error[:255],
+                }
+            )
+        else:
+            failed.append(entry["booking_id"])
+            done.append(
+                {
+                    "outbox_id": entry["outbox_id"],
+                    "status": "FAILED",
+                    "processed_at": now,
+                    "last_error": error[:255],
+                }
+            )
+
+    # 상태 일괄 업데이트 (PK + PROCESSING 조건 executemany, 커밋 1회). 실패 시 리스 만료 후 재처리
+    try:
+        await mark_confirmed(db, confirmed)
+        # executemany는 행마다 같은 컬럼이어야 하므로 last_error 유무로 나눔
+        for rows in (
+            [row for row in done if "last_error" not in row],
+            [row for row in done if "last_error" in row],
+            retries,
+        ):
+            if rows:
+                await db.execute(update(models.VendorOutbox), rows)
+        # 재시도 소진/영구 실패: 예약을 PENDING으로 되돌려 다시 확정 요청 가능
+        await release_claims(db, failed)
+        await db.commit()
+    except SQLAlchemyError as exc:
+        await db.rollback()
+        logger.error("❌ [Outbox] Batch status update failed: %s", exc)
+        return
+
+    logger.info(
+        "✅ [Outbox] Processed %d row(s): %d confirmed, %d retrying, %d failed",
+        len(entries),
+        len(confirmed),
+        len(retries),
+        len(failed),
+    )
+
+
+async def drain_outbox(batch_size: Optional[int] = None) -> int:
+    """처리 대기 행을 한 배치 처리하고 가져간 행 수를 반환 (0이면 대기 행 없음)"""
+    async with async_session_scope() as db:
+        entries = await _claim_batch(db, batch_size or settings.OUTBOX_BATCH_SIZE)
+        if entries:
+            with timed("vendor_outbox_batch"):
+                await _process_batch(db, entries)
+    return len(entries)
+
+
+async def run_outbox_worker():
+    """배치가 가득 차면 바로 다음 배치, 아니면 OUTBOX_POLL_INTERVAL(또는 새 요청 알림)까지 대기"""
+    global _wakeup
+    _wakeup = asyncio.Event()
+    while True:
+        _wakeup.clear()
+        try:
+            processed = await drain_outbox()
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            # DB 준비 전(503)/일시 장애: 다음 폴링에서 재시도
+            logger.error("❌ [Outbox] Drain failed: %s", exc)
+            processed = 0
+
+        if processed >= settings.OUTBOX_BATCH_SIZE:
+            continue
+        try:
+            await asyncio.wait_for(_wakeup.wait(), settings.OUTBOX_POLL_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
+
+
+def notify_outbox_worker():
+    """Outbox에 행을 커밋한 뒤 호출: 같은 프로세스의 워커를 즉시 깨움"""
+    if _wakeup is not None:
+        _wakeup.set()
+
+
+def start_outbox_worker():
+    """FastAPI lifespan 시작 시 호출 (OUTBOX_WORKER_ENABLED)"""
+    global _worker_task
+    if _worker_task is None:
+        _worker_task = asyncio.create_task(run_outbox_worker())
+        logger.info("✅ [Outbox] Worker started (batch=%d)", settings.OUTBOX_BATCH_SIZE)
+
+
+async def stop_outbox_worker():
+    """FastAPI lifespan 종료 시 호출: 처리 중인 배치는 커밋되지 않고 리스 만료 후 재처리됨"""
+    global _worker_task, _wakeup
+    if _worker_task is None:
+        return
+    _worker_task.cancel()
+    await asyncio.gather(_worker_task, return_exceptions=True)
+    _worker_task = None
+    _wakeup = None
@@ -1,38 +1,73 @@
+import time
+
+# 콜드 스타트 측정 기준 시각 (앱 모듈 임포트 시작)
+_IMPORT_STARTED = time.perf_counter()
+
 import logging
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from app.core.config import settings
-from app.core.database import Base, engine
-from app.routers import health
+from app.core.database import close_db_pools, start_db_init
+from app.core.logging_config import configure_logging, shutdown_logging
+from app.core.metrics import STARTUP_DURATION, MetricsMiddleware
+from app.routers import health, metrics
 
 logger = logging.getLogger("uvicorn")
 
 
-# 로그 필터링
-class HealthCheckFilter(logging.Filter):
-    """GET /health 요청이 200 OK로 응답하면 로그를 기록하지 않음"""
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 앱 수명 동안 공유되는 리소스 시작/정리
+    # 로깅: 큐 + 백그라운드 리스너 (워커 프로세스마다 fork 이후 시작, 헬스체크 접근 로그는 route 기준 생략)
+    configure_logging(
+        settings.LOG_LEVEL, settings.LOG_FORMAT, settings.LOG_SAMPLE_RATE, settings.ACCESS_LOG
+    )
+    # DB(Vault/Secrets 조회, Pool, 테이블 생성)는 백그라운드로 초기화하여 /health를 바로 응답
+    if settings.IS_ONPREM:
+        from app.core.pii_crypto import pii_cipher
+
+        # PII 키 설정 오류는 요청을 받기 전에 실패 (공개된 기본 PII_MASTER_KEY로 암호화하지 않도록)
+        pii_cipher.check_config()
+    start_db_init(_IMPORT_STARTED)
+    if not settings.IS_ONPREM:
+        from app.core import onprem_client
+        from app.core.confirm_pipeline import shutdown_confirm_jobs
+        from app.core.quote_executor import quote_executor
+        from app.core import vendor_outbox
+
+        onprem_client.start_onprem_client()
+        quote_executor.start()
+        if settings.OUTBOX_WORKER_ENABLED:
+            vendor_outbox.start_outbox_worker()
 
-    def filter(self, record: logging.LogRecord) -> bool:
-        try:
-            msg = record.getMessage()
-            # /health 경로 요청이 200 OK인 경우 필터링
-            if "/health" in msg and "200 OK" in msg:
-                return False
-            if "/health" in msg and "200" in msg:
-                return False
-        except Exception:
-            pass
-        return True
+    elapsed = time.perf_counter() - _IMPORT_STARTED
+    STARTUP_DURATION.labels("serving").set(elapsed)
+    if elapsed > settings.STARTUP_TARGET_SECONDS:
+        logger.warning(
+            "⚠️ [Startup] Serving after %.2fs (target %ss)", elapsed, settings.STARTUP_TARGET_SECONDS
+        )
+    else:
+        logger.info("🚀 [Startup] Serving after %.2fs", elapsed)
+    yield
+    if not settings.IS_ONPREM:
+        await vendor_outbox.stop_outbox_worker()
+        await shutdown_confirm_jobs()
+        await quote_executor.shutdown()
+        await onprem_client.close_onprem_client()
+    else:
+        from app.core.rate_limit import close_internal_limiter
 
+        await close_internal_limiter()
+    await close_db_pools()
+    shutdown_logging()
 
-# 모든 uvicorn 로거에 필터 적용
-for logger_name in ["uvicorn.access", "uvicorn"]:
-    logger = logging.getLogger(logger_name)
-    logger.addFilter(HealthCheckFilter())
 
-app = FastAPI(title=settings.PROJECT_NAME)
+app = FastAPI(title=settings.PROJECT_NAME, lifespan=lifespan)
+app.add_middleware(MetricsMiddleware)
 
-# 1. 공통 라우터 (Health Check) - 어디서든 동작
+# 1. 공통 라우터 (Health Check, Prometheus 메트릭) - 어디서든 동작
 app.include_router(health.router)
+app.include_router(metrics.router)
 
 # 2. 환경별 라우터 분기 (조건부 import로 모델 로딩 제어)
 if settings.IS_ONPREM:
@@ -43,15 +78,16 @@ if settings.IS_ONPREM:
 else:
     logger.info("☁️ [Startup] CLOUD Mode Detected.")
     from app.routers import bookings as bookings_router
+    from app.routers import pii_cache as pii_cache_router
     from app.models import booking as booking_models
     app.include_router(bookings_router.router)
+    app.include_router(pii_cache_router.router)
 
-# 데이터베이스 테이블 자동 생성 (환경별 모델 로드 후 실행)
-Base.metadata.create_all(bind=engine)
+# 데이터베이스 테이블 자동 생성은 lifespan의 start_db_init()에서 수행 (환경별 모델 로드 후)
 
 
 if __name__ == "__main__":
     import uvicorn
 
-    print(f"Starting server on port {settings.PORT}...")
+    logger.info("Starting server on port %s...", settings.PORT)
     uvicorn.run(app, host="0.0.0.0", port=settings.PORT)
@@ -1,3 +1,3 @@
 # Hybrid PII Service PoC - Models Package
 
-__all__ = ["UserPII", "Booking"]
+__all__ = ["UserPII", "PIIDataKey", "Booking", "VendorOutbox"]
@@ -1,23 +1,58 @@
-from sqlalchemy import Column, Integer, String, DateTime, func
+from sqlalchemy import Column, Integer, String, Date, DateTime, Index, func
 from app.core.database import Base
 
 
 class Booking(Base):
     __tablename__ = "bookings"
+    # 목록 조회(GET /bookings) Keyset Pagination용 복합 인덱스: 필터 컬럼 + 정렬 키 (created_at, booking_id)
+    # user_id 단일 인덱스는 ix_bookings_user_created가 prefix로 대체
+    __table_args__ = (
+        Index("ix_bookings_created", "created_at", "booking_id"),
+        Index("ix_bookings_user_created", "user_id", "created_at", "booking_id"),
+        Index("ix_bookings_status_created", "status", "created_at", "booking_id"),
+        # 목적지별 출발일 범위 조회 (운영 리포트/견적 통계)
+        Index("ix_bookings_destination_departure", "destination", "departure_date"),
+    )
 
     booking_id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(String(36), nullable=False, index=True)  # user_pii.user_id와 매핑
+    user_id = Column(String(36), nullable=False)  # user_pii.user_id와 매핑
 
     # 출장 일정 정보
-    departure_date = Column(String(10), nullable=False)  # YYYY-MM-DD
-    arrival_date = Column(String(10), nullable=False)  # YYYY-MM-DD
+    # 기존 String(10) 컬럼은 scripts/migrate_bookings.py dates로 DATE 변환
+    departure_date = Column(Date, nullable=False)
+    arrival_date = Column(Date, nullable=False)
     destination = Column(String(100), nullable=False)
 
     # 자동 배정 결과
     hotel_name = Column(String(100), nullable=True)  # 예약 확정 시 기입
 
-    # 상태 관리 (PENDING, CONFIRMED, FAILED)
+    # 상태 관리 (PENDING, PROCESSING, CONFIRMED, FAILED)
+    # PROCESSING: 확정 요청이 선점하여 PII 조회/벤더 호출 중 (중복 확정 방지)
     status = Column(String(20), default="PENDING")
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+
+class VendorOutbox(Base):
+    """
+    벤더 호출 Outbox: 예약 선점(PENDING -> PROCESSING)과 같은 트랜잭션으로 기록하고
+    app/core/vendor_outbox.py 워커가 일괄 처리 (요청 응답과 벤더 호출을 분리).
+    """
+
+    __tablename__ = "vendor_outbox"
+    # 워커 폴링: 처리 대기(PENDING) 행을 예정 시각 순으로 조회
+    __table_args__ = (Index("ix_vendor_outbox_status_due", "status", "next_attempt_at"),)
+
+    outbox_id = Column(Integer, primary_key=True)
+    booking_id = Column(Integer, nullable=False, index=True)
+
+    # PENDING(처리 대기/재시도 대기), DONE(벤더 호출 + 확정 커밋 완료), FAILED(재시도 소진)
+    status = Column(String(20), nullable=False, default="PENDING")
+    attempts = Column(Integer, nullable=False, default=0)
+    # 다음 처리 가능 시각 (UTC). 워커가 가져갈 때 리스 만료 시각으로 미뤄 다른 워커와 중복 처리 방지
+    next_attempt_at = Column(DateTime, nullable=False)
+    last_error = Column(String(255), nullable=True)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    processed_at = Column(DateTime(timezone=True), nullable=True)
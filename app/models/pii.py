@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, DateTime, func
+from sqlalchemy import Column, String, DateTime, LargeBinary, Text, func
 from app.core.database import Base
 
 
@@ -9,11 +9,28 @@ class UserPII(Base):
     # UUID를 PK로 사용 (두 DB 간의 연결 고리)
     user_id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
 
-    # 암호화되어 저장될 필드들
-    name = Column(String(255), nullable=False)
-    email = Column(String(255), nullable=False, index=True)
-    phone = Column(String(255), nullable=False)
-    passport_no = Column(String(255), nullable=False)
+    # 필드별 AES-GCM 암호문 (nonce + ciphertext + tag, app/core/pii_crypto.py)
+    # key_id가 NULL인 행은 암호화 도입 전 평문 (scripts/migrate_pii.py로 변환)
+    name = Column(LargeBinary, nullable=False)
+    email = Column(LargeBinary, nullable=False)
+    phone = Column(LargeBinary, nullable=False)
+    passport_no = Column(LargeBinary, nullable=False)
+
+    # 암호화에 사용한 데이터 키 (pii_data_keys.key_id)
+    key_id = Column(String(36), nullable=True)
+    # email 조회용 Blind Index (HMAC-SHA256). 암호문은 매번 달라지므로 이 컬럼으로 검색
+    email_bidx = Column(String(64), nullable=True, index=True)
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+
+class PIIDataKey(Base):
+    """데이터 키(DEK) 보관: 평문 키는 저장하지 않고 KEK(Vault Transit / 로컬 마스터 키)로 래핑한 값만 저장"""
+
+    __tablename__ = "pii_data_keys"
+
+    key_id = Column(String(36), primary_key=True)
+    wrapped_key = Column(Text, nullable=False)
+    provider = Column(String(20), nullable=False)  # local, vault
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
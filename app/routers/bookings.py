@@ -1,25 +1,51 @@
+import base64
+import binascii
+import json
 import logging
-import httpx
-import hashlib
-import random
-import math
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from app.core.database import get_db
+from datetime import date, datetime
+from typing import AsyncIterator, List, Optional, Tuple
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from fastapi.responses import JSONResponse
+from pydantic import ValidationError
+from sqlalchemy import DateTime, and_, bindparam, insert, or_, select
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.database import get_async_db, get_async_read_db
 from app.models import booking as models
 from app.schemas import booking as schemas
+from app.core import quote_engine
+from app.core.cache import get_pii_cached, idempotency_cache, run_idempotent
+from app.core.confirm_pipeline import (
+    claim_booking,
+    confirm_bookings,
+    enqueue_confirmation,
+    execute_vendor_booking,
+    get_confirm_job,
+    release_claims,
+    start_confirm_job,
+)
+from app.core.quote_executor import QuoteExecutorSaturated, quote_executor
+from app.core.serialization import Projection, fast_response
+from app.core.vendor_outbox import notify_outbox_worker
 from app.core.config import settings
+from app.core.logging_config import SAMPLED
 
 logger = logging.getLogger("uvicorn")
 
 router = APIRouter(prefix="/bookings", tags=["Bookings (Cloud)"])
 
+# 응답 Fast-path: 응답 모델 필드만 뽑아 검증 없이 직렬화 (app/core/serialization.py)
+_BOOKING_RESPONSE = Projection(schemas.BookingResponse)
+
 
 # -----------------------------------------------------------------------------
 # 1. 예약 생성 (퍼블릭 데이터만 Aurora에 저장)
 # -----------------------------------------------------------------------------
 @router.post("/", response_model=schemas.BookingResponse)
-def create_booking(booking_in: schemas.BookingCreate, db: Session = Depends(get_db)):
+async def create_booking(
+    booking_in: schemas.BookingCreate, db: AsyncSession = Depends(get_async_db)
+):
     db_booking = models.Booking(
         user_id=booking_in.user_id,
         departure_date=booking_in.departure_date,
@@ -28,114 +54,490 @@ def create_booking(booking_in: schemas.BookingCreate, db: Session = Depends(get_
         status="PENDING",
     )
     db.add(db_booking)
-    db.commit()
-    db.refresh(db_booking)
+    await db.commit()  # booking_id는 INSERT 시 채워지므로 refresh(SELECT) 없이 응답
 
     logger.info(
-        f"📅 [Booking] Created booking {db_booking.booking_id} for user {booking_in.user_id}"
+        "📅 [Booking] Created booking %s for user %s",
+        db_booking.booking_id,
+        booking_in.user_id,
+        extra=SAMPLED,
     )
-    return db_booking
+    return fast_response(_BOOKING_RESPONSE.from_attributes(db_booking))
+
+
+# -----------------------------------------------------------------------------
+# 1-1. 예약 일괄 등록 (여행사 파트너 일정 업로드)
+# -----------------------------------------------------------------------------
+_NDJSON_CONTENT_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+_MAX_REPORTED_ERRORS = 20
+
+
+async def _iter_ndjson_lines(request: Request) -> AsyncIterator[bytes]:
+    # 본문 전체를 버퍼링하지 않고 스트림에서 한 줄씩 분리
+    buffer = b""
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield line
+    if buffer.strip():
+        yield buffer
+
+
+async def _read_bulk_bookings(request: Request) -> List[schemas.BookingCreate]:
+    """
+    JSON 배열 또는 NDJSON(한 줄에 BookingCreate 1건) 본문을 읽어 전체 검증.
+    한 건이라도 잘못되면 아무것도 저장하지 않고 422로 위치별 에러를 반환.
+    (DB 세션보다 먼저 해석되도록 의존성으로 선언: 업로드 수신 중에는 DB 연결을 잡지 않음)
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    max_size = settings.BOOKING_BULK_MAX_SIZE
+
+    items = []
+    try:
+        if content_type in _NDJSON_CONTENT_TYPES:
+            async for line in _iter_ndjson_lines(request):
+                items.append(json.loads(line))
+                if len(items) > max_size:
+                    break  # 상한 초과가 확정되면 나머지 스트림은 읽지 않음
+        else:
+            items = json.loads(await request.body())
+            if not isinstance(items, list):
+                raise HTTPException(
+                    status_code=422, detail="Request body must be a JSON array"
+                )
+    except json.JSONDecodeError as exc:
+        raise HTTPException(
+            status_code=422, detail=f"Invalid JSON at record {len(items)}: {exc.msg}"
+        )
+
+    if len(items) > max_size:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Too many bookings (max {settings.BOOKING_BULK_MAX_SIZE})",
+        )
+    if not items:
+        raise HTTPException(status_code=422, detail="No bookings in request body")
+
+    records, errors = [], []
+    for index, item in enumerate(items):
+        try:
+            records.append(schemas.BookingCreate.model_validate(item))
+        except ValidationError as exc:
+            errors.append({"index": index, "errors": exc.errors(include_url=False)})
+    if errors:
+        raise HTTPException(
+            status_code=422,
+            detail={
+                "message": f"{len(errors)} invalid booking(s)",
+                "invalid": errors[:_MAX_REPORTED_ERRORS],
+            },
+        )
+    return records
+
+
+async def _insert_bookings(db: AsyncSession, rows: List[dict]) -> List[int]:
+    """
+    rows를 INSERT 1회로 저장하고 입력 순서대로 booking_id 반환 (행별 refresh 없음).
+    - RETURNING 지원 DB (SQLite, MariaDB 등): executemany + RETURNING (입력 순서 보장)
+    - MySQL: multi-row INSERT 1문장. 단일 문장의 AUTO_INCREMENT 값은 연속 할당되므로
+      lastrowid(첫 행 ID)부터 순서대로 계산 (auto_increment_increment=1 전제)
+    """
+    table = models.Booking.__table__
+    if db.bind.dialect.insert_executemany_returning_sort_by_parameter_order:
+        result = await db.execute(
+            insert(table).returning(table.c.booking_id, sort_by_parameter_order=True),
+            rows,
+        )
+        return list(result.scalars())
+
+    result = await db.execute(insert(table).values(rows))
+    first_id = result.lastrowid
+    return list(range(first_id, first_id + len(rows)))
+
+
+@router.post("/bulk", response_model=schemas.BookingBulkResponse)
+async def create_bookings_bulk(
+    bookings_in: List[schemas.BookingCreate] = Depends(_read_bulk_bookings),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    예약 일괄 등록. Content-Type: application/json (배열) 또는 application/x-ndjson.
+    BOOKING_BULK_CHUNK_SIZE 단위로 multi-row INSERT + 커밋하므로 행당 왕복이 없음.
+    중간 청크 실패 시 이미 커밋된 booking_id를 에러 응답에 포함 (재전송 시 중복 방지용).
+    """
+    chunk_size = settings.BOOKING_BULK_CHUNK_SIZE
+    booking_ids: List[int] = []
+
+    for start in range(0, len(bookings_in), chunk_size):
+        rows = [
+            dict(booking_in.model_dump(), status="PENDING")
+            for booking_in in bookings_in[start : start + chunk_size]
+        ]
+        try:
+            chunk_ids = await _insert_bookings(db, rows)
+            await db.commit()
+        except SQLAlchemyError as exc:
+            await db.rollback()
+            logger.error(
+                "❌ [Booking] Bulk insert failed at record %d (%d committed): %s",
+                start,
+                len(booking_ids),
+                exc,
+            )
+            raise HTTPException(
+                status_code=500,
+                detail={
+                    "message": f"Bulk insert failed at record {start}",
+                    "committed_count": len(booking_ids),
+                    "committed_booking_ids": booking_ids,
+                },
+            )
+        booking_ids.extend(chunk_ids)
+
+    logger.info("📅 [Booking] Bulk created %d booking(s)", len(booking_ids))
+    return {"count": len(booking_ids), "booking_ids": booking_ids}
 
 
 # -----------------------------------------------------------------------------
 # 2. 예약 확정 (Data Aggregation & Mock Execution)
 # -----------------------------------------------------------------------------
-@router.post("/{booking_id}/confirm", response_model=schemas.BookingResponse)
-async def confirm_booking(booking_id: int, db: Session = Depends(get_db)):
-    # A. 예약 정보 조회 (Aurora)
-    booking = (
-        db.query(models.Booking).filter(models.Booking.booking_id == booking_id).first()
-    )
+async def _confirm_one(db: AsyncSession, booking_id: int) -> dict:
+    # A. 예약 정보 조회 (Aurora Writer: 바로 다음 단계가 같은 세션의 조건부 UPDATE이므로 리더로 보내지 않음)
+    booking = await db.get(models.Booking, booking_id)
     if not booking:
         raise HTTPException(status_code=404, detail="Booking not found")
 
     if booking.status == "CONFIRMED":
-        return booking
+        return _BOOKING_RESPONSE.from_attributes(booking)
 
-    # B. PII 조회 (온프레미스 API 호출 via VPN)
-    onprem_url = getattr(settings, "ONPREM_SERVICE_URL", "http://10.10.10.20:8000")
-    token = getattr(settings, "INTERNAL_API_TOKEN", "my-secret-token")
+    # B. 선점 (PENDING -> PROCESSING). 동시 요청 중 하나만 이후 단계를 수행
+    #    Outbox 모드: 선점과 Outbox 기록을 함께 커밋하고 PII 조회/벤더 호출은 워커가 수행
+    claim = enqueue_confirmation if settings.CONFIRM_USE_OUTBOX else claim_booking
+    if not await claim(db, booking_id):
+        await db.refresh(booking)
+        if booking.status == "CONFIRMED":
+            return _BOOKING_RESPONSE.from_attributes(booking)
+        if booking.status == "PROCESSING":
+            raise HTTPException(
+                status_code=409,
+                detail="Booking confirmation already in progress",
+                headers={"Retry-After": "1"},
+            )
+        raise HTTPException(
+            status_code=409,
+            detail=f"Booking cannot be confirmed in status {booking.status}",
+        )
 
-    logger.info(
-        f"🔗 [Integration] Fetching PII from {onprem_url} for user {booking.user_id}..."
-    )
+    if settings.CONFIRM_USE_OUTBOX:
+        notify_outbox_worker()
+        logger.info("📨 [Booking] Queued confirmation for booking #%s", booking_id, extra=SAMPLED)
+        return dict(_BOOKING_RESPONSE.from_attributes(booking), status="PROCESSING")
 
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.get(
-                f"{onprem_url}/pii/internal/{booking.user_id}",
-                headers={"x-internal-token": token},
-            )
+        # C. PII 조회 (Cloud 캐시 -> Miss 시 온프레미스 API 호출 via VPN)
+        logger.info("🔗 [Integration] Fetching PII for user %s...", booking.user_id, extra=SAMPLED)
 
-            if response.status_code != 200:
-                logger.error(
-                    f"❌ [On-Prem Error] Status: {response.status_code}, Body: {response.text}"
-                )
-                raise HTTPException(
-                    status_code=502, detail="Failed to fetch PII from On-Premise"
-                )
+        pii_data = await get_pii_cached(booking.user_id)
 
-            pii_data = response.json()
+        # D. Mock Business Logic (여권번호 + 일정으로 예약 수행)
+        hotel_name = await execute_vendor_booking(booking, pii_data)
 
-    except httpx.RequestError as exc:
-        logger.error(f"❌ [Network Error] Could not connect to On-Premise: {exc}")
-        raise HTTPException(status_code=503, detail="On-Premise service unavailable")
+        # E. 상태 업데이트 (Aurora)
+        booking.status = "CONFIRMED"
+        booking.hotel_name = hotel_name
+        await db.commit()
+    except Exception:
+        # 실패 시 선점 해제 (PENDING으로 되돌려 재시도 가능)
+        await db.rollback()
+        await release_claims(db, [booking_id])
+        await db.commit()
+        raise
 
-    # C. Mock Business Logic (여권번호 + 일정으로 예약 수행)
-    passport = pii_data.get("passport_no", "UNKNOWN")
-    user_name = pii_data.get("name", "UNKNOWN")
+    logger.info("✅ [Booking] Confirmed booking #%s", booking_id)
+    return _BOOKING_RESPONSE.from_attributes(booking)
 
-    print("=" * 60)
-    print(f"✈️  [MOCK EXECUTION] Processing Booking #{booking_id}")
-    print(f"    - User: {user_name} (Passport: {passport})")
-    print(f"    - Destination: {booking.destination}")
-    print(f"    - Date: {booking.departure_date} ~ {booking.arrival_date}")
-    print(f"    -> Sending request to Airline/Hotel Vendor API... SUCCESS")
-    print("=" * 60)
 
-    # D. 상태 업데이트 (Aurora)
-    booking.status = "CONFIRMED"
-    booking.hotel_name = f"Hilton {booking.destination} (Auto-Assigned)"
+async def _refresh_queued_confirm(
+    db: AsyncSession, booking_id: int, cache_key: str
+) -> Tuple[dict, bool]:
+    """
+    재사용한 결과가 Outbox 대기(PROCESSING)면 현재 예약 상태로 다시 응답 (워커가 확정한 뒤에도 202가 반복되지 않도록).
+    - 아직 PROCESSING: 202 유지 / CONFIRMED: 확정 결과로 교체하여 저장
+    - 그 외 (워커 실패로 PENDING 복귀 등): 저장된 결과를 버리고 확정을 다시 수행
+    """
+    booking = await db.get(models.Booking, booking_id)
+    if booking is not None and booking.status in ("PROCESSING", "CONFIRMED"):
+        result = _BOOKING_RESPONSE.from_attributes(booking)
+        if booking.status == "CONFIRMED":
+            idempotency_cache.set(cache_key, result)
+        return result, True
+    idempotency_cache.invalidate(cache_key)
+    return await run_idempotent(cache_key, lambda: _confirm_one(db, booking_id))
 
-    db.commit()
-    db.refresh(booking)
 
-    logger.info(f"✅ [Booking] Confirmed booking #{booking_id}")
-    return booking
+@router.post(
+    "/{booking_id}/confirm",
+    response_model=schemas.BookingResponse,
+    responses={202: {"model": schemas.BookingResponse}},
+)
+async def confirm_booking(
+    booking_id: int,
+    response: Response,
+    idempotency_key: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    예약 확정. Idempotency-Key 헤더가 있으면 같은 키의 재시도는 저장된 결과로 응답
+    (Idempotent-Replayed: true)하고 온프레미스/벤더 호출을 반복하지 않음.
+    CONFIRM_USE_OUTBOX면 선점 후 202(status=PROCESSING)로 즉시 응답하고,
+    확정 결과는 GET /bookings/{booking_id}로 조회 (이미 확정된 예약은 200).
+    저장된 결과가 202면 같은 키의 재시도는 현재 예약 상태로 응답 (워커가 확정했으면 200).
+    """
+    if not idempotency_key:
+        result = await _confirm_one(db, booking_id)
+    else:
+        cache_key = f"confirm:{booking_id}:{idempotency_key}"
+        result, replayed = await run_idempotent(cache_key, lambda: _confirm_one(db, booking_id))
+        if replayed and result["status"] == "PROCESSING":
+            result, replayed = await _refresh_queued_confirm(db, booking_id, cache_key)
+        if replayed:
+            response.headers["Idempotent-Replayed"] = "true"
+
+    if result["status"] == "PROCESSING":
+        response.status_code = status.HTTP_202_ACCEPTED
+    return fast_response(result, response)
+
+
+# -----------------------------------------------------------------------------
+# 2-1. 예약 일괄 확정 (PII 일괄 조회 + 벤더 동시 호출 + 상태 일괄 커밋)
+# -----------------------------------------------------------------------------
+@router.post(
+    "/confirm",
+    response_model=schemas.BookingConfirmBatchResponse,
+    responses={202: {"model": schemas.BookingConfirmJobResponse}},
+)
+async def confirm_bookings_batch(
+    batch_in: schemas.BookingConfirmBatchRequest,
+    response: Response,
+    background: bool = False,
+    idempotency_key: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    여러 예약을 한 번에 확정하고 건별 결과를 반환.
+    background=true면 즉시 202와 job_id를 반환하고 GET /bookings/confirm/jobs/{job_id}로 결과 조회.
+    Idempotency-Key 재시도는 같은 결과(백그라운드 모드는 같은 job_id)를 반환.
+    """
+    if len(batch_in.booking_ids) > settings.BOOKING_CONFIRM_BATCH_MAX_SIZE:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Too many bookings (max {settings.BOOKING_CONFIRM_BATCH_MAX_SIZE})",
+        )
+
+    async def run() -> dict:
+        if background:
+            job = start_confirm_job(batch_in.booking_ids)
+            logger.info(
+                "📅 [Booking] Started confirm job %s (%d booking(s))", job["job_id"], job["total"]
+            )
+            return job
+        return await confirm_bookings(db, batch_in.booking_ids)
+
+    if idempotency_key:
+        # 같은 키로 다른 예약 목록을 보내면 별개 요청으로 취급
+        ids_key = ",".join(map(str, sorted(set(batch_in.booking_ids))))
+        result, replayed = await run_idempotent(
+            f"confirm-batch:{background}:{ids_key}:{idempotency_key}", run
+        )
+        if replayed:
+            response.headers["Idempotent-Replayed"] = "true"
+    else:
+        result, replayed = await run(), False
+
+    if background:
+        headers = {"Idempotent-Replayed": "true"} if replayed else None
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content=schemas.BookingConfirmJobResponse(**result).model_dump(),
+            headers=headers,
+        )
+    return result
+
+
+@router.get("/confirm/jobs/{job_id}", response_model=schemas.BookingConfirmJobResponse)
+def get_confirm_job_status(job_id: str):
+    job = get_confirm_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Confirm job not found or expired")
+    return job
+
+
+@router.get("/{booking_id}", response_model=schemas.BookingResponse)
+async def get_booking(booking_id: int, db: AsyncSession = Depends(get_async_read_db)):
+    """예약 단건 조회 (Outbox 확정 요청 후 CONFIRMED 여부 확인용)"""
+    booking = (
+        await db.execute(
+            select(*_BOOKING_RESPONSE.columns(models.Booking)).where(
+                models.Booking.booking_id == booking_id
+            )
+        )
+    ).first()
+    if booking is None:
+        raise HTTPException(status_code=404, detail="Booking not found")
+    return fast_response(_BOOKING_RESPONSE.from_attributes(booking))
 
 
 # -----------------------------------------------------------------------------
 # 3. 실시간 견적 산출 (CPU Intensive) - 오토스케일링 테스트용
 # -----------------------------------------------------------------------------
+async def _run_quotes(bookings_in: List[schemas.BookingCreate]) -> List[dict]:
+    """견적 계산을 프로세스 풀로 넘김. 대기열이 가득 차면 429로 즉시 거절."""
+    try:
+        return await quote_executor.run(
+            quote_engine.calculate_quotes,
+            [booking_in.model_dump() for booking_in in bookings_in],
+            settings.QUOTE_SEED,
+        )
+    except QuoteExecutorSaturated:
+        logger.warning("⚠️ [Quote] Executor saturated, rejecting request")
+        raise HTTPException(
+            status_code=429,
+            detail="Quote engine is busy, retry later",
+            headers={"Retry-After": "1"},
+        )
+
+
 @router.post("/quote", response_model=schemas.QuoteResponse)
-def calculate_quote(booking_in: schemas.BookingCreate):
+async def calculate_quote(booking_in: schemas.BookingCreate):
+    logger.info(
+        "💰 [Quote] Calculating complex pricing for %s...", booking_in.destination, extra=SAMPLED
+    )
 
-    base_price = 1000.0
-    discount_factor = 0.0
+    # NumPy 벡터화 엔진으로 산출 (QUOTE_SEED 설정 시 재현 가능 모드)
+    quote = (await _run_quotes([booking_in]))[0]
 
     logger.info(
-        f"💰 [Quote] Calculating complex pricing for {booking_in.destination}..."
+        "💰 [Quote] ✅ Quote calculated: %s = $%.2f",
+        booking_in.destination,
+        quote["estimated_price"],
+        extra=SAMPLED,
     )
+    return quote
 
-    for i in range(6000):
-        discount_factor += math.sqrt(i) * random.random()
-        base_price = base_price + (math.sin(i) * 0.01)
 
-    # 결과 정제
-    final_price = max(base_price - (discount_factor % 50), 500.0)  # 최저가 제한
+# -----------------------------------------------------------------------------
+# 4. 일괄 견적 산출 (여러 건을 행렬 연산 한 번으로 처리)
+# -----------------------------------------------------------------------------
+@router.post("/quotes", response_model=List[schemas.QuoteResponse])
+async def calculate_quotes(bookings_in: List[schemas.BookingCreate]):
+    if len(bookings_in) > settings.QUOTE_BATCH_MAX_SIZE:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Too many quote requests (max {settings.QUOTE_BATCH_MAX_SIZE})",
+        )
 
-    # 위변조 방지 토큰 생성 (SHA-256 해싱)
-    quote_data = f"{booking_in.user_id}#{booking_in.destination}#{final_price}#{booking_in.departure_date}"
-    quote_token = hashlib.sha256(quote_data.encode()).hexdigest()
+    quotes = await _run_quotes(bookings_in)
 
-    logger.info(
-        f"💰 [Quote] ✅ Quote calculated: {booking_in.destination} = ${final_price:.2f}"
-    )
+    logger.info("💰 [Quote] ✅ Batch quotes calculated: %d item(s)", len(quotes), extra=SAMPLED)
+    return quotes
 
-    return {
-        "user_id": booking_in.user_id,
-        "destination": booking_in.destination,
-        "estimated_price": round(final_price, 2),
-        "quote_token": quote_token,
-        "valid_until": "15 minutes",
-    }
+
+# 견적 프로세스 풀 상태 (대기열 깊이, 실행 시간)
+@router.get("/quote/stats")
+def get_quote_executor_stats():
+    return quote_executor.stats()
+
+
+# -----------------------------------------------------------------------------
+# 5. 예약 목록 조회 (Keyset Pagination, 대시보드용)
+# -----------------------------------------------------------------------------
+_LIST_ITEM = Projection(schemas.BookingListItem)
+_LIST_COLUMNS = _LIST_ITEM.columns(models.Booking)
+# 커서의 created_at 바인딩 타입. SQLite는 server_default(CURRENT_TIMESTAMP)를 초 단위 문자열로 저장하므로
+# 같은 형식으로 바인딩 (기본 형식은 마이크로초가 붙어 같은 시각이 '크다'로 비교됨). MySQL은 DATETIME 범위 비교
+_CURSOR_TIME = DateTime(timezone=True).with_variant(
+    sqlite.DATETIME(truncate_microseconds=True), "sqlite"
+)
+
+
+def _encode_cursor(created_at: Optional[datetime], booking_id: int) -> str:
+    raw = json.dumps([created_at.isoformat() if created_at else None, booking_id])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> Tuple[Optional[datetime], int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, booking_id = json.loads(base64.urlsafe_b64decode(padded))
+        if created_at is not None:
+            created_at = datetime.fromisoformat(created_at)
+        return created_at, int(booking_id)
+    except (binascii.Error, ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+@router.get("/", response_model=schemas.BookingPage)
+async def list_bookings(
+    user_id: Optional[str] = None,
+    status_filter: Optional[str] = Query(None, alias="status"),
+    departure_from: Optional[date] = None,
+    departure_to: Optional[date] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    """
+    최신순 (created_at DESC, booking_id DESC) 예약 목록.
+    OFFSET 대신 마지막 행의 정렬 키(cursor) 이후만 읽으므로 깊은 페이지도 비용이 일정하고,
+    필터별 복합 인덱스(user_id/status + created_at, booking_id)를 그대로 타도록 조건을 구성.
+    ORM 객체를 만들지 않고 필요한 컬럼만 조회.
+    """
+    query = select(*_LIST_COLUMNS)
+    if user_id is not None:
+        query = query.where(models.Booking.user_id == user_id)
+    if status_filter is not None:
+        query = query.where(models.Booking.status == status_filter)
+    if departure_from is not None:
+        query = query.where(models.Booking.departure_date >= departure_from)
+    if departure_to is not None:
+        query = query.where(models.Booking.departure_date <= departure_to)
+
+    if cursor is not None:
+        # (created_at, booking_id) < (c, id)를 인덱스 범위 조건으로 풀어서 작성.
+        # created_at이 NULL인 행은 DESC 정렬에서 마지막 (MySQL/SQLite는 NULL을 가장 작은 값으로 정렬)
+        last_created_at, last_booking_id = _decode_cursor(cursor)
+        created_at = models.Booking.created_at
+        if last_created_at is None:
+            query = query.where(created_at.is_(None), models.Booking.booking_id < last_booking_id)
+        else:
+            last_created_at = bindparam("cursor_created_at", last_created_at, type_=_CURSOR_TIME)
+            query = query.where(
+                or_(
+                    created_at < last_created_at,
+                    and_(
+                        created_at == last_created_at,
+                        models.Booking.booking_id < last_booking_id,
+                    ),
+                    created_at.is_(None),
+                )
+            )
+
+    # 다음 페이지 존재 여부 확인용으로 1건 더 조회
+    rows = (
+        await db.execute(
+            query.order_by(
+                models.Booking.created_at.desc(), models.Booking.booking_id.desc()
+            ).limit(limit + 1)
+        )
+    ).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = _encode_cursor(rows[-1].created_at, rows[-1].booking_id)
+
+    return fast_response(
+        {"items": [_LIST_ITEM.from_attributes(row) for row in rows], "next_cursor": next_cursor}
+    )
@@ -1,14 +1,38 @@
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse
 import socket
 from app.core.config import settings
+from app.core.database import is_db_ready
 
 router = APIRouter()
 
 
+# Liveness: 프로세스가 요청을 받을 수 있으면 200 (DB/온프레미스 상태와 무관하게 빠르게 응답)
 @router.get("/health")
 def health_check():
-    return {
+    payload = {
         "status": "ok",
         "hostname": socket.gethostname(),
         "mode": "on-premise" if settings.IS_ONPREM else "cloud",
     }
+    if not settings.IS_ONPREM:
+        from app.core.onprem_client import circuit_breaker
+
+        # 온프레미스 의존성 상태. Circuit이 열려도 이 인스턴스 자체는 정상이므로 200 유지
+        # (ALB가 모든 태스크를 교체하지 않도록 하고, 대시보드/알람은 이 값을 사용)
+        onprem = circuit_breaker.snapshot()
+        payload["onprem"] = onprem
+        if onprem["state"] != "closed":
+            payload["status"] = "degraded"
+    return payload
+
+
+# Readiness: 시작 시 초기화(DB Pool, 테이블 생성)가 끝나야 200. 그 전에는 503으로 트래픽에서 제외
+@router.get("/ready")
+def readiness_check():
+    checks = {"database": is_db_ready()}
+    ready = all(checks.values())
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={"status": "ready" if ready else "starting", "checks": checks},
+    )
@@ -0,0 +1,23 @@
+import os
+from fastapi import APIRouter, Response
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, generate_latest
+from prometheus_client import multiprocess
+from app.core.metrics import pool_collector
+
+router = APIRouter()
+
+
+def _registry():
+    # 멀티 워커 모드: 모든 워커가 기록한 값을 합산 (PROMETHEUS_MULTIPROC_DIR, gunicorn.conf.py에서 설정)
+    if not os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    registry.register(pool_collector)
+    return registry
+
+
+@router.get("/metrics", include_in_schema=False)
+def metrics():
+    # Prometheus 스크레이프 엔드포인트 (HTTP 지연, 세부 단계 지연, DB Pool 상태)
+    return Response(generate_latest(_registry()), media_type=CONTENT_TYPE_LATEST)
@@ -1,59 +1,206 @@
 import logging
-from fastapi import APIRouter, Depends, HTTPException, Header
-from sqlalchemy.orm import Session
-from app.core.database import get_db
+import math
+import uuid
+from typing import List, Optional
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Header, Request
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.database import (
+    async_session_scope,
+    get_async_db,
+    get_async_read_db,
+    is_reader_session,
+)
 from app.models import pii as models
 from app.schemas import pii as schemas
 from app.core.config import settings
+from app.core.cloud_client import notify_pii_invalidation
+from app.core.logging_config import SAMPLED
+from app.core.pii_crypto import PII_FIELDS, pii_cipher
+from app.core.rate_limit import RateLimitExceeded, get_internal_limiter
+from app.core.security import identify_internal_caller
+from app.core.serialization import Projection, fast_response
 
 logger = logging.getLogger("uvicorn")
 
 router = APIRouter(prefix="/pii", tags=["PII (On-Premise)"])
 
+# 응답 Fast-path: PIIResponse에 있는 컬럼만 조회/복호화 (phone 등 응답에 없는 필드는 읽지 않음)
+_PII_RESPONSE = Projection(schemas.PIIResponse)
+_PII_RESPONSE_FIELDS = tuple(f for f in _PII_RESPONSE.fields if f in PII_FIELDS)
+_PII_COLUMNS = _PII_RESPONSE.columns(models.UserPII) + (models.UserPII.key_id,)
+
+
+def _verify_internal_token(x_internal_token: str, target: str) -> str:
+    """내부 통신용 보안 헤더 체크 (상수 시간 비교). 토큰에 대응하는 호출자 이름 반환"""
+    caller = identify_internal_caller(x_internal_token)
+
+    if caller is None:
+        logger.warning("⛔ [Access Denied] Invalid Token request for %s", target)
+        raise HTTPException(status_code=403, detail="Unauthorized access")
+    return caller
+
+
+def _too_many_requests(exc: RateLimitExceeded) -> HTTPException:
+    return HTTPException(
+        status_code=429,
+        detail="Too many requests",
+        headers={"Retry-After": str(max(math.ceil(exc.retry_after), 1))},
+    )
+
+
+async def _internal_caller(request: Request, x_internal_token: str = Header(None)):
+    """
+    내부 API 공통 의존성: 토큰 확인 후 호출자별 Rate Limit/동시 요청 슬롯을 응답까지 점유.
+    DB 세션보다 먼저 선언하여 거절되는 요청은 DB 연결을 쓰지 않도록 함.
+    """
+    caller = _verify_internal_token(x_internal_token, request.url.path)
+    if not settings.INTERNAL_RATE_LIMIT_ENABLED:
+        yield caller
+        return
+
+    limiter = get_internal_limiter()
+    try:
+        await limiter.acquire(caller)
+    except RateLimitExceeded as exc:
+        raise _too_many_requests(exc)
+    try:
+        yield caller
+    finally:
+        limiter.release(caller)
+
+
+async def _select_pii(db: AsyncSession, condition, limit: Optional[int] = None) -> List[dict]:
+    """응답 컬럼만 조회하여 복호화 (데이터 키 조회는 키 단위 1회)"""
+    stmt = select(*_PII_COLUMNS).where(condition)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    rows = (await db.execute(stmt)).all()
+    return await pii_cipher.decrypt_rows(db, rows, _PII_RESPONSE_FIELDS)
+
+
+async def _select_pii_from_writer(db: AsyncSession, condition, limit: Optional[int] = None) -> List[dict]:
+    """
+    리더에서 못 찾은 행을 Writer에서 다시 조회 (db가 리더 세션이 아니면 빈 목록).
+    방금 생성된 PII가 복제 지연으로 404가 되면 클라우드 Outbox는 재시도 없이 실패 처리하므로
+    not found는 Writer 기준으로만 응답.
+    """
+    if not is_reader_session(db):
+        return []
+    async with async_session_scope() as writer:
+        return await _select_pii(writer, condition, limit)
+
 
 # -----------------------------------------------------------------------------
 # [Public] PII 생성
 # -----------------------------------------------------------------------------
 @router.post("/", response_model=schemas.PIIResponse)
-def create_pii(pii_in: schemas.PIICreate, db: Session = Depends(get_db)):
-    # 암호화 없이 바로 저장
-    db_pii = models.UserPII(
-        name=pii_in.name,
-        email=pii_in.email,
-        phone=pii_in.phone,
-        passport_no=pii_in.passport_no,
-    )
+async def create_pii(
+    pii_in: schemas.PIICreate,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_async_db),
+):
+    # 필드별 암호화 후 저장 (AAD에 user_id를 쓰므로 ID를 먼저 발급)
+    user_id = str(uuid.uuid4())
+    values = pii_in.model_dump()
+    db_pii = models.UserPII(user_id=user_id, **await pii_cipher.encrypt(db, user_id, values))
     db.add(db_pii)
-    db.commit()
-    db.refresh(db_pii)
+    await db.commit()
 
-    return db_pii
+    # 클라우드 측 PII 캐시 무효화 통지 (응답 이후 비동기 처리)
+    background_tasks.add_task(notify_pii_invalidation, user_id)
+
+    # 입력 평문으로 응답 (refresh/복호화 왕복 없음, 요청 검증을 통과한 값이므로 재검증 생략)
+    return fast_response(_PII_RESPONSE.from_mapping({"user_id": user_id, **values}))
 
 
 # -----------------------------------------------------------------------------
-# [Internal] PII 조회
+# [Internal] email로 PII 조회 (Blind Index 컬럼으로 인덱스 검색)
 # -----------------------------------------------------------------------------
-@router.get("/internal/{user_id}", response_model=schemas.PIIResponse)
-def get_internal_pii(
-    user_id: str, db: Session = Depends(get_db), x_internal_token: str = Header(None)
+@router.post("/internal/lookup", response_model=schemas.PIIResponse)
+async def lookup_internal_pii(
+    lookup_in: schemas.PIILookupRequest,
+    caller: str = Depends(_internal_caller),
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    condition = models.UserPII.email_bidx == pii_cipher.blind_index(lookup_in.email)
+    found = await _select_pii(db, condition, 1) or await _select_pii_from_writer(db, condition, 1)
+    if not found:
+        raise HTTPException(status_code=404, detail="User PII not found")
+
+    logger.info(
+        "🔓 [Internal API] PII provided for user %s via VPN (lookup)", found[0]["user_id"], extra=SAMPLED
+    )
+    return fast_response(found[0])
+
+
+# -----------------------------------------------------------------------------
+# [Internal] PII 일괄 조회 (N건을 VPN 1회 왕복 + IN 쿼리 1회로 처리)
+# -----------------------------------------------------------------------------
+@router.post("/internal/batch", response_model=schemas.PIIBatchResponse)
+async def get_internal_pii_batch(
+    batch_in: schemas.PIIBatchRequest,
+    caller: str = Depends(_internal_caller),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     """
-    [Internal Only] VPN을 통해 접근하는 퍼블릭 클라우드 서비스에 PII 제공
+    [Internal Only] 여러 user_id의 PII를 한 번에 제공.
+    응답은 user_id 기준으로 묶이며, 존재하지 않는 ID는 null로 표시되고 not_found에 포함됨.
     """
-    # 1. 보안 헤더 체크
-    expected_token = getattr(settings, "INTERNAL_API_TOKEN", "my-secret-token")
+    # 1. 중복 제거 (요청 순서 유지) 및 크기 제한
+    user_ids = list(dict.fromkeys(batch_in.user_ids))
+    if len(user_ids) > settings.PII_BATCH_MAX_SIZE:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Too many user_ids (max {settings.PII_BATCH_MAX_SIZE})",
+        )
+    # 호출자 한도는 user_id 수만큼 차감 (의존성에서 1개 차감했으므로 나머지만)
+    if settings.INTERNAL_RATE_LIMIT_ENABLED:
+        try:
+            await get_internal_limiter().charge(caller, len(user_ids) - 1)
+        except RateLimitExceeded as exc:
+            raise _too_many_requests(exc)
 
-    if x_internal_token != expected_token:
-        logger.warning(f"⛔ [Access Denied] Invalid Token request for {user_id}")
-        raise HTTPException(status_code=403, detail="Unauthorized access")
+    # 2. DB 조회 (IN 쿼리 1회) 및 복호화. 리더에서 못 찾은 ID만 Writer에서 다시 조회
+    found = {
+        row["user_id"]: row
+        for row in await _select_pii(db, models.UserPII.user_id.in_(user_ids))
+    }
+    missing = [user_id for user_id in user_ids if user_id not in found]
+    if missing:
+        for row in await _select_pii_from_writer(db, models.UserPII.user_id.in_(missing)):
+            found[row["user_id"]] = row
 
-    # 2. DB 조회
-    user_pii = (
-        db.query(models.UserPII).filter(models.UserPII.user_id == user_id).first()
+    results = {user_id: found.get(user_id) for user_id in user_ids}
+    not_found = [user_id for user_id in user_ids if user_id not in found]
+
+    logger.info(
+        "🔓 [Internal API] Batch PII provided for %d/%d users via VPN",
+        len(found),
+        len(user_ids),
+        extra=SAMPLED,
     )
+    return fast_response({"results": results, "not_found": not_found})
+
+
+# -----------------------------------------------------------------------------
+# [Internal] PII 조회
+# -----------------------------------------------------------------------------
+@router.get("/internal/{user_id}", response_model=schemas.PIIResponse)
+async def get_internal_pii(
+    user_id: str,
+    caller: str = Depends(_internal_caller),
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    """
+    [Internal Only] VPN을 통해 접근하는 퍼블릭 클라우드 서비스에 PII 제공
+    """
+    # DB 조회 (보안 헤더/호출자 한도는 _internal_caller 의존성에서 확인)
+    condition = models.UserPII.user_id == user_id
+    found = await _select_pii(db, condition) or await _select_pii_from_writer(db, condition)
 
-    if not user_pii:
+    if not found:
         raise HTTPException(status_code=404, detail="User PII not found")
 
-    logger.info(f"🔓 [Internal API] PII provided for user {user_id} via VPN")
-    return user_pii
+    logger.info("🔓 [Internal API] PII provided for user %s via VPN", user_id, extra=SAMPLED)
+    return fast_response(found[0])
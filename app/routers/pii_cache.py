@@ -0,0 +1,43 @@
+import logging
+from fastapi import APIRouter, HTTPException, Header
+from app.core.cache import pii_cache
+from app.core.security import identify_internal_caller
+
+logger = logging.getLogger("uvicorn")
+
+router = APIRouter(prefix="/internal/pii-cache", tags=["PII Cache (Cloud)"])
+
+
+def _verify_internal_token(x_internal_token: str):
+    if identify_internal_caller(x_internal_token) is None:
+        logger.warning("⛔ [Access Denied] Invalid Token request for PII cache")
+        raise HTTPException(status_code=403, detail="Unauthorized access")
+
+
+# -----------------------------------------------------------------------------
+# 캐시 사이징용 통계 (hit/miss/eviction)
+# -----------------------------------------------------------------------------
+@router.get("/stats")
+def get_pii_cache_stats():
+    return pii_cache.stats()
+
+
+# -----------------------------------------------------------------------------
+# [Internal] 온프레미스 PII 변경 시 무효화 훅
+# -----------------------------------------------------------------------------
+@router.delete("/{user_id}")
+def invalidate_pii_cache(user_id: str, x_internal_token: str = Header(None)):
+    _verify_internal_token(x_internal_token)
+
+    removed = pii_cache.invalidate(user_id)
+    logger.info("🧹 [PII Cache] Invalidated user %s (cached=%s)", user_id, removed)
+    return {"user_id": user_id, "invalidated": removed}
+
+
+@router.delete("/")
+def clear_pii_cache(x_internal_token: str = Header(None)):
+    _verify_internal_token(x_internal_token)
+
+    pii_cache.clear()
+    logger.info("🧹 [PII Cache] Cleared all entries")
+    return {"cleared": True}
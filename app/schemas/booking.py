@@ -1,14 +1,21 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field, model_validator
+from datetime import date, datetime
+from typing import List, Optional
 
 
-# 예약 생성 요청
+# 예약 생성 요청 (날짜는 YYYY-MM-DD, 도착일은 출발일 이후)
 class BookingCreate(BaseModel):
     user_id: str
-    departure_date: str
-    arrival_date: str
+    departure_date: date
+    arrival_date: date
     destination: str
 
+    @model_validator(mode="after")
+    def check_dates(self):
+        if self.arrival_date < self.departure_date:
+            raise ValueError("arrival_date must not be earlier than departure_date")
+        return self
+
 
 # 예약 확정 요청
 class BookingConfirm(BaseModel):
@@ -27,6 +34,63 @@ class BookingResponse(BaseModel):
         from_attributes = True
 
 
+# 예약 목록 항목 (ORM 객체 대신 컬럼 Projection으로 채움)
+class BookingListItem(BaseModel):
+    booking_id: int
+    user_id: str
+    destination: str
+    departure_date: date
+    arrival_date: date
+    status: str
+    hotel_name: Optional[str] = None
+    created_at: Optional[datetime] = None
+
+
+# 예약 목록 페이지: next_cursor가 null이면 마지막 페이지
+class BookingPage(BaseModel):
+    items: List[BookingListItem]
+    next_cursor: Optional[str] = None
+
+
+# 예약 일괄 등록 응답 (요청 순서와 동일한 순서의 booking_id)
+class BookingBulkResponse(BaseModel):
+    count: int
+    booking_ids: List[int]
+
+
+# 예약 일괄 확정 요청
+class BookingConfirmBatchRequest(BaseModel):
+    booking_ids: List[int] = Field(..., min_length=1)
+
+
+# 예약 건별 확정 결과
+# outcome: confirmed, already_confirmed, not_found, invalid_status, in_progress,
+#          pii_not_found, pii_unavailable, vendor_failed, commit_failed, claim_lost
+class BookingConfirmResult(BaseModel):
+    booking_id: int
+    outcome: str
+    status: Optional[str] = None
+    hotel_name: Optional[str] = None
+    detail: Optional[str] = None
+
+
+# 예약 일괄 확정 응답
+class BookingConfirmBatchResponse(BaseModel):
+    total: int
+    succeeded: int
+    failed: int
+    results: List[BookingConfirmResult]
+
+
+# 백그라운드 확정 작업 상태 (status: running, completed, failed)
+class BookingConfirmJobResponse(BaseModel):
+    job_id: str
+    status: str
+    total: int
+    result: Optional[BookingConfirmBatchResponse] = None
+    error: Optional[str] = None
+
+
 # 실시간 견적 산출 응답
 class QuoteResponse(BaseModel):
     user_id: str
@@ -1,5 +1,5 @@
-from pydantic import BaseModel, EmailStr
-from typing import Optional
+from pydantic import BaseModel, EmailStr, Field
+from typing import Dict, List, Optional
 
 
 # PII 생성 요청
@@ -20,3 +20,19 @@ class PIIResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+# email로 PII 조회 요청 (Internal, URL/접근 로그에 email이 남지 않도록 본문으로 전달)
+class PIILookupRequest(BaseModel):
+    email: EmailStr
+
+
+# PII 일괄 조회 요청 (Internal)
+class PIIBatchRequest(BaseModel):
+    user_ids: List[str] = Field(..., min_length=1)
+
+
+# PII 일괄 조회 응답: user_id 기준 결과, 없는 ID는 null + not_found 목록
+class PIIBatchResponse(BaseModel):
+    results: Dict[str, Optional[PIIResponse]]
+    not_found: List[str]
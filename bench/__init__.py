@@ -0,0 +1 @@
+# Hybrid PII Service PoC - Benchmarks
@@ -0,0 +1,303 @@
+"""
+하이브리드 예약 흐름 부하/벤치마크 하네스.
+
+On-Prem 모드 앱(또는 Mock 온프레미스 서버)과 Cloud 모드 앱을 로컬 프로세스로 띄우고
+create_booking, confirm_booking, calculate_quote, get_internal_pii를 지정한 동시성으로 호출하여
+처리량과 p50/p95/p99 지연을 JSON으로 출력합니다. 커밋 간 비교용으로 git 커밋 해시를 함께 기록합니다.
+각 서버의 콜드 스타트(프로세스 실행부터 /health, /ready 응답까지의 시간)도 함께 기록합니다.
+
+    python -m bench.load --concurrency 32 --requests 500 --output bench_output.json
+    python -m bench.load --onprem mock --scenarios create_booking,confirm_booking
+    python -m bench.load --cloud-db-url mysql+pymysql://user:pw@127.0.0.1:3306/bench
+
+DB URL을 지정하지 않으면 임시 디렉터리의 SQLite 파일을 사용합니다 (pip install -r bench/requirements.txt).
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, List
+import httpx
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_SCENARIOS = ("create_booking", "confirm_booking", "calculate_quote", "get_internal_pii")
+_INTERNAL_TOKEN = "bench-internal-token"
+_PII_MASTER_KEY = "bench-pii-master-key"
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=_REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+@contextmanager
+def _serve(app_path: str, env: Dict[str, str], log_path: str, startup: Dict[str, float]):
+    """uvicorn 프로세스를 띄우고 /ready가 응답할 때까지 대기 (startup에 단계별 소요 시간 기록)"""
+    port = _free_port()
+    with open(log_path, "w") as log_file:
+        started = time.perf_counter()
+        process = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", app_path, "--port", str(port),
+             "--log-level", "warning", "--no-access-log"],
+            cwd=_REPO_ROOT,
+            env=dict(os.environ, **env),
+            stdout=log_file,
+            stderr=subprocess.STDOUT,
+        )
+        base_url = f"http://127.0.0.1:{port}"
+        try:
+            deadline = time.monotonic() + 60
+            for phase in ("health", "ready"):
+                while True:
+                    if process.poll() is not None:
+                        raise RuntimeError(f"{app_path} exited early, see {log_path}")
+                    try:
+                        if httpx.get(f"{base_url}/{phase}", timeout=1).status_code == 200:
+                            break
+                    except httpx.HTTPError:
+                        pass
+                    if time.monotonic() > deadline:
+                        raise RuntimeError(f"{app_path} did not pass /{phase}, see {log_path}")
+                    time.sleep(0.05)
+                startup[f"{phase}_s"] = round(time.perf_counter() - started, 3)
+            yield base_url
+        finally:
+            process.terminate()
+            process.wait(timeout=30)
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(int(round(q * (len(sorted_values) - 1))), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+async def _drive(
+    requests: int, concurrency: int, call: Callable[[int], Awaitable[httpx.Response]]
+) -> dict:
+    """call(i)를 requests회, 최대 concurrency개 동시 실행하여 지연/에러 집계"""
+    latencies: List[float] = []
+    statuses: Dict[str, int] = {}
+    next_index = 0
+
+    async def worker():
+        nonlocal next_index
+        while next_index < requests:
+            index = next_index
+            next_index += 1
+            started = time.perf_counter()
+            try:
+                status = str((await call(index)).status_code)
+            except httpx.HTTPError as exc:
+                status = type(exc).__name__
+            latencies.append((time.perf_counter() - started) * 1000)
+            statuses[status] = statuses.get(status, 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, requests))))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    errors = sum(n for status, n in statuses.items() if not status.startswith("2"))
+    return {
+        "requests": requests,
+        "errors": errors,
+        "status_counts": statuses,
+        "duration_s": round(elapsed, 3),
+        "throughput_rps": round(requests / elapsed, 2) if elapsed else 0.0,
+        "latency_ms": {
+            "mean": round(sum(latencies) / len(latencies), 3) if latencies else 0.0,
+            "p50": round(_percentile(latencies, 0.50), 3),
+            "p95": round(_percentile(latencies, 0.95), 3),
+            "p99": round(_percentile(latencies, 0.99), 3),
+            "max": round(latencies[-1], 3) if latencies else 0.0,
+        },
+    }
+
+
+def _booking_body(user_id: str, index: int) -> dict:
+    return {
+        "user_id": user_id,
+        "departure_date": "2026-03-01",
+        "arrival_date": "2026-03-05",
+        "destination": f"City-{index % 20}",
+    }
+
+
+async def _run_scenarios(args, cloud_url: str, onprem_url: str, real_onprem: bool) -> dict:
+    limits = httpx.Limits(max_connections=args.concurrency * 2)
+    headers = {"x-internal-token": _INTERNAL_TOKEN}
+    async with httpx.AsyncClient(timeout=30, limits=limits) as client:
+        # 사전 데이터: PII 사용자 생성 (Mock이면 임의 ID 사용)
+        if real_onprem:
+            user_ids = []
+            for i in range(args.users):
+                response = await client.post(
+                    f"{onprem_url}/pii/",
+                    json={
+                        "name": f"Bench User {i}",
+                        "email": f"bench{i}@example.com",
+                        "phone": "010-0000-0000",
+                        "passport_no": f"M{i:08d}",
+                    },
+                )
+                response.raise_for_status()
+                user_ids.append(response.json()["user_id"])
+        else:
+            user_ids = [f"mock-user-{i:04d}" for i in range(args.users)]
+
+        def user_for(index: int) -> str:
+            return user_ids[index % len(user_ids)]
+
+        results = {}
+        for scenario in args.scenarios:
+            if scenario == "create_booking":
+                call = lambda i: client.post(
+                    f"{cloud_url}/bookings/", json=_booking_body(user_for(i), i)
+                )
+            elif scenario == "confirm_booking":
+                # 확정 대상 PENDING 예약을 미리 생성 (측정 제외)
+                booking_ids = []
+                for i in range(args.requests):
+                    response = await client.post(
+                        f"{cloud_url}/bookings/", json=_booking_body(user_for(i), i)
+                    )
+                    response.raise_for_status()
+                    booking_ids.append(response.json()["booking_id"])
+                call = lambda i: client.post(
+                    f"{cloud_url}/bookings/{booking_ids[i]}/confirm"
+                )
+            elif scenario == "calculate_quote":
+                call = lambda i: client.post(
+                    f"{cloud_url}/bookings/quote", json=_booking_body(user_for(i), i)
+                )
+            else:  # get_internal_pii
+                call = lambda i: client.get(
+                    f"{onprem_url}/pii/internal/{user_for(i)}", headers=headers
+                )
+
+            results[scenario] = await _drive(args.requests, args.concurrency, call)
+            print(
+                f"[bench] {scenario}: {results[scenario]['throughput_rps']} rps, "
+                f"p99 {results[scenario]['latency_ms']['p99']} ms",
+                file=sys.stderr,
+            )
+        return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=200, help="requests per scenario")
+    parser.add_argument("--users", type=int, default=50, help="distinct PII users")
+    parser.add_argument(
+        "--scenarios",
+        type=lambda value: [s for s in value.split(",") if s],
+        default=list(_SCENARIOS),
+        help=f"comma separated subset of {','.join(_SCENARIOS)}",
+    )
+    parser.add_argument(
+        "--onprem",
+        choices=("app", "mock"),
+        default="app",
+        help="run the real app in IS_ONPREM mode, or the lightweight mock server",
+    )
+    parser.add_argument("--cloud-db-url", help="defaults to a temporary SQLite file")
+    parser.add_argument("--onprem-db-url", help="defaults to a temporary SQLite file")
+    parser.add_argument("--output", help="write the JSON report to this file")
+    args = parser.parse_args()
+
+    unknown = set(args.scenarios) - set(_SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(sorted(unknown))}")
+
+    cold_start = {"onprem": {}, "cloud": {}}
+    with tempfile.TemporaryDirectory() as tmp:
+        common_env = {
+            "INTERNAL_API_TOKEN": _INTERNAL_TOKEN,
+            "PII_MASTER_KEY": _PII_MASTER_KEY,
+            "DB_SECRET_ARN": "",
+        }
+
+        if args.onprem == "app":
+            onprem = _serve(
+                "app.main:app",
+                dict(
+                    common_env,
+                    IS_ONPREM="true",
+                    DATABASE_URL=args.onprem_db_url or f"sqlite:///{tmp}/onprem.db",
+                ),
+                os.path.join(tmp, "onprem.log"),
+                cold_start["onprem"],
+            )
+        else:
+            onprem = _serve(
+                "bench.mock_onprem:app", {}, os.path.join(tmp, "onprem.log"), cold_start["onprem"]
+            )
+
+        with onprem as onprem_url:
+            cloud = _serve(
+                "app.main:app",
+                dict(
+                    common_env,
+                    IS_ONPREM="false",
+                    DATABASE_URL=args.cloud_db_url or f"sqlite:///{tmp}/cloud.db",
+                    ONPREM_SERVICE_URL=onprem_url,
+                ),
+                os.path.join(tmp, "cloud.log"),
+                cold_start["cloud"],
+            )
+            with cloud as cloud_url:
+                scenarios = asyncio.run(
+                    _run_scenarios(args, cloud_url, onprem_url, args.onprem == "app")
+                )
+
+    if "get_internal_pii" in scenarios and args.onprem == "mock":
+        scenarios["get_internal_pii"]["note"] = "served by mock on-prem server"
+
+    report = {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "concurrency": args.concurrency,
+            "requests_per_scenario": args.requests,
+            "users": args.users,
+            "onprem": args.onprem,
+            "cloud_db": "custom" if args.cloud_db_url else "sqlite",
+            "onprem_db": "custom" if args.onprem_db_url else "sqlite",
+        },
+        "cold_start": cold_start,
+        "scenarios": scenarios,
+    }
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+로컬 Mock 온프레미스 서버 (부하 테스트용).
+
+실제 On-Prem 앱/DB 없이 /pii/internal/* 응답만 흉내내어 Cloud 측 경로만 측정할 때 사용합니다.
+MOCK_ONPREM_LATENCY_MS 환경 변수로 VPN 왕복 지연을 흉내낼 수 있습니다.
+
+    python -m uvicorn bench.mock_onprem:app --port 8101
+"""
+import asyncio
+import os
+from typing import List
+from fastapi import FastAPI
+from pydantic import BaseModel
+
+_LATENCY = float(os.getenv("MOCK_ONPREM_LATENCY_MS", "0")) / 1000
+
+app = FastAPI(title="Mock On-Prem PII Service")
+
+
+class _BatchRequest(BaseModel):
+    user_ids: List[str]
+
+
+def _fake_pii(user_id: str) -> dict:
+    return {
+        "user_id": user_id,
+        "name": f"User {user_id[:8]}",
+        "email": f"{user_id[:8]}@example.com",
+        "passport_no": f"M{abs(hash(user_id)) % 10**8:08d}",
+    }
+
+
+@app.get("/health")
+def health_check():
+    return {"status": "ok", "mode": "mock-onprem"}
+
+
+@app.get("/ready")
+def readiness_check():
+    return {"status": "ready"}
+
+
+@app.get("/pii/internal/{user_id}")
+async def get_internal_pii(user_id: str):
+    if _LATENCY:
+        await asyncio.sleep(_LATENCY)
+    return _fake_pii(user_id)
+
+
+@app.post("/pii/internal/batch")
+async def get_internal_pii_batch(batch_in: _BatchRequest):
+    if _LATENCY:
+        await asyncio.sleep(_LATENCY)
+    user_ids = list(dict.fromkeys(batch_in.user_ids))
+    return {"results": {u: _fake_pii(u) for u in user_ids}, "not_found": []}
@@ -0,0 +1,155 @@
+"""
+요청당 DB 왕복(Round-trip) 횟수 측정.
+
+get_db_session 체크아웃 시 보내던 SELECT 1 프로브의 제거 전(before)/후(after)를
+create_booking(Cloud 모드)과 get_internal_pii(On-Prem 모드)에 대해 비교합니다.
+로컬 SQLite 파일 DB로 실행되며 pool_pre_ping, 실행 SQL, COMMIT/ROLLBACK,
+Pool 반환 시 reset을 모두 왕복 1회로 집계합니다.
+
+    python -m bench.roundtrips [--requests 50]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from collections import Counter
+
+_MODES = {
+    # mode: (IS_ONPREM, 측정 대상 라우트)
+    "cloud": ("false", "create_booking"),
+    "onprem": ("true", "get_internal_pii"),
+}
+
+
+class RoundTripCounter:
+    """SQLAlchemy 엔진 이벤트로 DB 왕복 횟수를 종류별로 집계"""
+
+    def __init__(self):
+        self.counts = Counter()
+
+    def attach(self, engine):
+        from sqlalchemy import event
+
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+        event.listen(engine, "commit", lambda conn: self._hit("commit"))
+        event.listen(engine, "rollback", lambda conn: self._hit("rollback"))
+        event.listen(engine.pool, "reset", lambda *args: self._hit("reset"))
+
+        # pool_pre_ping은 커서 이벤트를 거치지 않으므로 dialect.do_ping을 감싸서 집계
+        dialect = engine.dialect
+        original_ping = dialect.do_ping
+
+        def counting_ping(dbapi_connection):
+            self._hit("ping")
+            return original_ping(dbapi_connection)
+
+        dialect.do_ping = counting_ping
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self._hit("execute")
+
+    def _hit(self, kind: str):
+        self.counts[kind] += 1
+
+    def per_request(self, requests: int) -> dict:
+        result = {kind: round(n / requests, 2) for kind, n in sorted(self.counts.items())}
+        result["total"] = round(sum(self.counts.values()) / requests, 2)
+        return result
+
+
+def _run_worker(mode: str, requests: int) -> dict:
+    """현재 프로세스 설정(IS_ONPREM)으로 앱을 띄우고 before/after 왕복 수 측정"""
+    from fastapi.testclient import TestClient
+    from sqlalchemy import text
+    from app.core import database
+    from app.main import app
+
+    async def legacy_get_async_db():
+        # 제거 전 동작 재현: 세션 체크아웃마다 SELECT 1 연결 테스트
+        async for db in database.get_async_db_session():
+            await db.execute(text("SELECT 1"))
+            yield db
+
+    booking_body = {
+        "user_id": "bench-user",
+        "departure_date": "2026-01-01",
+        "arrival_date": "2026-01-03",
+        "destination": "Seoul",
+    }
+    headers = {"x-internal-token": database.settings.INTERNAL_API_TOKEN}
+
+    with TestClient(app) as client:
+        if mode == "cloud":
+            call = lambda: client.post("/bookings/", json=booking_body)
+        else:
+            user_id = client.post(
+                "/pii/",
+                json={
+                    "name": "Bench User",
+                    "email": "bench@example.com",
+                    "phone": "010-0000-0000",
+                    "passport_no": "M00000000",
+                },
+            ).json()["user_id"]
+            call = lambda: client.get(f"/pii/internal/{user_id}", headers=headers)
+
+        # Warm-up: Lazy Pool 초기화 및 연결 생성 (연결 생성 비용은 측정에서 제외)
+        assert call().status_code == 200
+
+        counter = RoundTripCounter()
+        counter.attach(database.get_async_engine().sync_engine)
+
+        results = {}
+        for label, override in (("before", legacy_get_async_db), ("after", None)):
+            if override is not None:
+                # 읽기 전용 라우트(get_internal_pii)는 리더 라우팅 의존성을 사용 (리더 미설정 시 Writer)
+                app.dependency_overrides[database.get_async_db] = override
+                app.dependency_overrides[database.get_async_read_db] = override
+            else:
+                app.dependency_overrides.clear()
+
+            counter.counts.clear()
+            for _ in range(requests):
+                assert call().status_code == 200
+            results[label] = counter.per_request(requests)
+
+    return {_MODES[mode][1]: results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--worker", choices=sorted(_MODES), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(_run_worker(args.worker, args.requests)))
+        return
+
+    # 모드별로 Settings가 임포트 시점에 결정되므로 별도 프로세스에서 실행
+    report = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode, (is_onprem, _) in _MODES.items():
+            env = dict(
+                os.environ,
+                IS_ONPREM=is_onprem,
+                DATABASE_URL=f"sqlite:///{tmp}/{mode}.db",
+                PII_MASTER_KEY="bench-pii-master-key",
+            )
+            output = subprocess.run(
+                [sys.executable, "-m", "bench.roundtrips", "--worker", mode,
+                 "--requests", str(args.requests)],
+                env=env,
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            report.update(json.loads(output.strip().splitlines()[-1]))
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+응답 직렬화 경로의 요청당 CPU 시간 측정.
+
+RESPONSE_FAST_PATH 끔(before: response_model 검증 + FastAPI 직렬화) / 켬(after: 검증 없이
+orjson 직렬화)을 같은 프로세스에서 번갈아 적용하여 PII/예약 조회 라우트의 요청당 CPU 시간을 비교합니다.
+TestClient로 앱을 프로세스 안에서 호출하므로 CPU 시간에는 클라이언트 측 비용도 포함되며
+(양쪽 동일), 차이가 서버 측 직렬화 비용의 차이입니다. 로컬 SQLite 파일 DB로 실행됩니다.
+
+    python -m bench.serialization [--requests 300] [--rows 100]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+_MODES = {
+    # mode: (IS_ONPREM, 측정 대상 라우트)
+    "cloud": ("false", ("get_booking", "list_bookings")),
+    "onprem": ("true", ("get_internal_pii", "get_internal_pii_batch")),
+}
+
+
+def _measure(call, requests: int) -> dict:
+    """requests회 호출의 요청당 CPU 시간/경과 시간 (ms)"""
+    cpu_started, wall_started = time.process_time(), time.perf_counter()
+    for _ in range(requests):
+        response = call()
+        assert response.status_code == 200, response.text
+    cpu = time.process_time() - cpu_started
+    wall = time.perf_counter() - wall_started
+    return {
+        "cpu_ms_per_request": round(cpu / requests * 1000, 4),
+        "wall_ms_per_request": round(wall / requests * 1000, 4),
+    }
+
+
+def _run_worker(mode: str, requests: int, rows: int) -> dict:
+    """현재 프로세스 설정(IS_ONPREM)으로 앱을 띄우고 before/after CPU 시간 측정"""
+    from fastapi.testclient import TestClient
+    from app.core.config import settings
+    from app.main import app
+
+    headers = {"x-internal-token": settings.INTERNAL_API_TOKEN}
+
+    with TestClient(app) as client:
+        # 사전 데이터 (측정 제외)
+        if mode == "cloud":
+            booking_ids = client.post(
+                "/bookings/bulk",
+                json=[
+                    {
+                        "user_id": f"bench-user-{i % 10}",
+                        "departure_date": "2026-01-01",
+                        "arrival_date": "2026-01-03",
+                        "destination": f"City-{i % 20}",
+                    }
+                    for i in range(rows)
+                ],
+            ).json()["booking_ids"]
+            calls = {
+                "get_booking": lambda: client.get(f"/bookings/{booking_ids[0]}"),
+                "list_bookings": lambda: client.get(f"/bookings/?limit={rows}"),
+            }
+        else:
+            user_ids = [
+                client.post(
+                    "/pii/",
+                    json={
+                        "name": f"Bench User {i}",
+                        "email": f"bench{i}@example.com",
+                        "phone": "010-0000-0000",
+                        "passport_no": f"M{i:08d}",
+                    },
+                ).json()["user_id"]
+                for i in range(rows)
+            ]
+            calls = {
+                "get_internal_pii": lambda: client.get(
+                    f"/pii/internal/{user_ids[0]}", headers=headers
+                ),
+                "get_internal_pii_batch": lambda: client.post(
+                    "/pii/internal/batch", json={"user_ids": user_ids}, headers=headers
+                ),
+            }
+
+        results = {}
+        for route, call in calls.items():
+            results[route] = {}
+            for label, fast_path in (("before", False), ("after", True)):
+                settings.RESPONSE_FAST_PATH = fast_path
+                # Warm-up: Pool 연결, 데이터 키 캐시, 응답 모델 검증기 준비
+                _measure(call, min(requests, 20))
+                results[route][label] = _measure(call, requests)
+            before = results[route]["before"]["cpu_ms_per_request"]
+            after = results[route]["after"]["cpu_ms_per_request"]
+            results[route]["cpu_saved_pct"] = round((1 - after / before) * 100, 1) if before else 0.0
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--requests", type=int, default=300, help="requests per route and mode")
+    parser.add_argument("--rows", type=int, default=100, help="rows per list/batch response")
+    parser.add_argument("--worker", choices=sorted(_MODES), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(_run_worker(args.worker, args.requests, args.rows)))
+        return
+
+    # 모드별로 Settings(IS_ONPREM)가 임포트 시점에 결정되므로 별도 프로세스에서 실행
+    report = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode, (is_onprem, _) in _MODES.items():
+            env = dict(
+                os.environ,
+                IS_ONPREM=is_onprem,
+                DATABASE_URL=f"sqlite:///{tmp}/{mode}.db",
+                PII_MASTER_KEY="bench-pii-master-key",
+                LOG_LEVEL="WARNING",
+                ACCESS_LOG="false",
+            )
+            output = subprocess.run(
+                [sys.executable, "-m", "bench.serialization", "--worker", mode,
+                 "--requests", str(args.requests), "--rows", str(args.rows)],
+                env=env,
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            report.update(json.loads(output.strip().splitlines()[-1]))
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
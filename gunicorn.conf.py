@@ -0,0 +1,42 @@
+"""
+gunicorn 설정 (멀티 워커 실행 모드, Dockerfile 기본 CMD).
+
+    gunicorn -c gunicorn.conf.py app.main:app
+    WEB_CONCURRENCY=4 DB_MAX_CONNECTIONS=40 gunicorn -c gunicorn.conf.py app.main:app
+
+- 워커 수: WEB_CONCURRENCY (0이면 컨테이너 CPU 할당량)
+- DB 연결: DB_MAX_CONNECTIONS를 워커 수로 나눠 워커별 Pool 크기 결정 (database.pool_limits)
+- preload_app: 앱 임포트는 네트워크 I/O 없이 끝나므로 마스터에서 한 번만 임포트하고 fork.
+  Pool/Secret/Vault 토큰은 각 워커의 lifespan에서 생성되고, post_fork에서 혹시 물려받은 상태도 폐기
+"""
+import os
+import shutil
+from app.core.config import settings
+
+bind = f"0.0.0.0:{settings.PORT}"
+workers = settings.web_workers
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+accesslog = None  # 접근 로그는 앱 미들웨어가 JSON으로 기록 (ACCESS_LOG)
+graceful_timeout = 30
+timeout = 60
+
+# 멀티 워커 Prometheus: prometheus_client가 임포트되기 전(preload 이전)에 설정하고
+# 이전 실행의 워커별 메트릭 파일 제거 (on_starting 훅은 preload 이후에 호출되므로 여기서 수행)
+if workers > 1:
+    os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", "/tmp/prometheus_multiproc")
+    shutil.rmtree(os.environ["PROMETHEUS_MULTIPROC_DIR"], ignore_errors=True)
+    os.makedirs(os.environ["PROMETHEUS_MULTIPROC_DIR"], exist_ok=True)
+
+
+def post_fork(server, worker):
+    from app.core.database import reset_after_fork
+
+    reset_after_fork()
+
+
+def child_exit(server, worker):
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(worker.pid)
@@ -0,0 +1,297 @@
+"""
+bookings 테이블 스키마 마이그레이션 도구 (Cloud/Aurora).
+
+create_all()은 이미 존재하는 테이블의 컬럼/인덱스를 바꾸지 않으므로 기존 배포에는 이 도구로 반영합니다.
+
+    python -m scripts.migrate_bookings dates                      # 날짜 컬럼 String(10) -> DATE 변환
+    python -m scripts.migrate_bookings dates --dry-run            # 변환 불가 행만 확인
+    python -m scripts.migrate_bookings indexes                    # 누락된 인덱스 생성
+    python -m scripts.migrate_bookings indexes --drop-redundant   # 복합 인덱스로 대체된 단일 인덱스 제거
+    python -m scripts.migrate_bookings indexes --dry-run
+
+날짜 인덱스(ix_bookings_destination_departure)는 dates 변환 후 indexes로 생성합니다.
+"""
+import argparse
+import logging
+import time
+from datetime import date
+from sqlalchemy import Date, Index, bindparam, column, inspect, or_, select, table, text
+from app.core.database import get_engine
+from app.models.booking import Booking
+
+logger = logging.getLogger("uvicorn")
+
+# 복합 인덱스의 prefix로 대체되어 쓰기 비용만 늘리는 이전 인덱스
+_REDUNDANT_INDEXES = ("ix_bookings_user_id",)
+
+
+def migrate_indexes(engine, dry_run: bool = False, drop_redundant: bool = False):
+    """
+    모델에 정의된 인덱스 중 없는 것만 생성 (재실행해도 안전).
+    MySQL/InnoDB의 CREATE INDEX는 Online DDL(ALGORITHM=INPLACE, LOCK=NONE)로 수행되어
+    생성 중에도 읽기/쓰기가 막히지 않음.
+    """
+    table = Booking.__table__
+    existing = {index["name"] for index in inspect(engine).get_indexes(table.name)}
+
+    for index in sorted(table.indexes, key=lambda i: i.name):
+        if index.name in existing:
+            print(f"= {index.name} (exists)")
+            continue
+        print(f"+ {index.name} ({', '.join(c.name for c in index.columns)})")
+        if not dry_run:
+            index.create(bind=engine)
+
+    if drop_redundant:
+        for name in _REDUNDANT_INDEXES:
+            if name not in existing:
+                continue
+            print(f"- {name}")
+            if not dry_run:
+                Index(name, table.c.user_id).drop(bind=engine)
+
+
+# -----------------------------------------------------------------------------
+# 날짜 컬럼 변환 (Expand -> Backfill -> Swap -> Contract)
+# MODIFY COLUMN으로 타입을 바로 바꾸면 MySQL이 테이블을 복사하며 쓰기를 막으므로
+# 새 DATE 컬럼을 추가하고 PK 구간 단위로 채운 뒤 이름을 맞바꿈. 구 버전 앱이 실행 중이어도 안전:
+# - 교체 전: 구 버전은 원래 문자열 컬럼에 쓰고, 백필/catch-up이 DATE 컬럼으로 옮김
+# - 교체 후: 구 버전이 쓰는 'YYYY-MM-DD' 문자열은 같은 이름의 DATE 컬럼에 그대로 저장됨
+# 교체 후 원래 컬럼(_old)에는 아무도 값을 넣지 않으므로 Expand 단계에서 미리 NULL 허용으로 바꿔 둠
+# (NOT NULL로 남아 있으면 교체 ~ Contract 사이의 모든 INSERT가 실패)
+# -----------------------------------------------------------------------------
+_DATE_COLUMNS = ("departure_date", "arrival_date")
+
+
+def _parse_date(value):
+    if value is None or isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(str(value).strip())
+    except ValueError:
+        return None
+
+
+def backfill_dates(engine, source_suffix: str, target_suffix: str, chunk_size: int, sleep: float) -> int:
+    """
+    {컬럼}{source_suffix} 문자열을 파싱해 비어 있는 {컬럼}{target_suffix}에 기록.
+    booking_id 구간을 chunk_size씩 짧은 트랜잭션으로 나눠 처리하므로 해당 구간 행만 잠김.
+    변환할 수 없는 값은 NULL로 두고 건수를 반환.
+    """
+    sources = [name + source_suffix for name in _DATE_COLUMNS]
+    targets = [name + target_suffix for name in _DATE_COLUMNS]
+    bookings = table(Booking.__tablename__, column("booking_id"), *map(column, sources + targets))
+    pending = or_(*(bookings.c[name].is_(None) for name in targets))
+    update_stmt = (
+        bookings.update()
+        .where(bookings.c.booking_id == bindparam("b_id"))
+        .values({name: bindparam(f"b_{name}") for name in targets})
+    )
+
+    last_id, converted, invalid = 0, 0, 0
+    while True:
+        with engine.begin() as conn:
+            rows = conn.execute(
+                select(bookings.c.booking_id, *(bookings.c[name] for name in sources))
+                .where(bookings.c.booking_id > last_id)
+                .where(pending)
+                .order_by(bookings.c.booking_id)
+                .limit(chunk_size)
+            ).all()
+            if not rows:
+                break
+            last_id = rows[-1][0]
+
+            params = []
+            for booking_id, *values in rows:
+                parsed = [_parse_date(value) for value in values]
+                if None in parsed:
+                    invalid += 1
+                    logger.warning(f"⚠️ [Migrate] booking {booking_id}: unparseable dates {values}")
+                    continue
+                params.append(
+                    {"b_id": booking_id, **{f"b_{name}": v for name, v in zip(targets, parsed)}}
+                )
+            if params:
+                conn.execute(update_stmt, params)
+                converted += len(params)
+
+        print(f"  backfill: {converted} converted, {invalid} invalid (up to booking {last_id})")
+        if sleep:
+            time.sleep(sleep)  # 레플리카 지연/IO 여유
+    return invalid
+
+
+def _alter(engine, statements):
+    with engine.begin() as conn:
+        for statement in statements:
+            print(f"  {statement}")
+            conn.execute(text(statement))
+
+
+def _renames():
+    return [
+        rename
+        for c in _DATE_COLUMNS
+        for rename in (f"RENAME COLUMN {c} TO {c}_old", f"RENAME COLUMN {c}_new TO {c}")
+    ]
+
+
+def _swap_sqlite(engine):
+    """
+    SQLite: 교체 -> 백필 이후 들어온 행 보정 -> _old 제거를 BEGIN IMMEDIATE 한 트랜잭션으로 수행.
+    쓰기 잠금을 잡은 상태라 NOT NULL인 _old 컬럼이 남아 있는 동안 다른 INSERT가 끼어들지 않음.
+    pysqlite는 DDL 앞에서 트랜잭션을 열지 않으므로 드라이버 연결에서 직접 BEGIN/COMMIT.
+    """
+    name = Booking.__tablename__
+    raw = engine.raw_connection()
+    try:
+        sqlite = raw.driver_connection
+        sqlite.isolation_level = None
+        cursor = sqlite.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            for rename in _renames():
+                print(f"  ALTER TABLE {name} {rename}")
+                cursor.execute(f"ALTER TABLE {name} {rename}")
+
+            rows = cursor.execute(
+                f"SELECT booking_id, "
+                + ", ".join(f"{c}_old" for c in _DATE_COLUMNS)
+                + f" FROM {name} WHERE "
+                + " OR ".join(f"{c} IS NULL" for c in _DATE_COLUMNS)
+            ).fetchall()
+            params = []
+            for booking_id, *values in rows:
+                parsed = [_parse_date(value) for value in values]
+                if None in parsed:
+                    raise SystemExit(f"booking {booking_id}: unparseable dates {values}; fix and re-run")
+                params.append([value.isoformat() for value in parsed] + [booking_id])
+            cursor.executemany(
+                f"UPDATE {name} SET "
+                + ", ".join(f"{c} = ?" for c in _DATE_COLUMNS)
+                + " WHERE booking_id = ?",
+                params,
+            )
+            print(f"  catch-up: {len(params)} converted")
+
+            for c in _DATE_COLUMNS:
+                print(f"  ALTER TABLE {name} DROP COLUMN {c}_old")
+                cursor.execute(f"ALTER TABLE {name} DROP COLUMN {c}_old")
+            cursor.execute("COMMIT")
+        except BaseException:
+            cursor.execute("ROLLBACK")
+            raise
+    finally:
+        raw.close()
+
+
+def migrate_dates(engine, chunk_size: int = 1000, sleep: float = 0.0, dry_run: bool = False):
+    """
+    1. Expand: {컬럼}_new DATE NULL 추가 (MySQL 8 ALGORITHM=INSTANT),
+       원래 컬럼을 NULL 허용으로 변경 (MySQL은 INPLACE, LOCK=NONE)
+    2. Backfill: 기존 행을 청크 단위로 변환. 변환 불가 행이 있으면 중단 (수정 후 재실행)
+    3. Swap: 컬럼 이름 교체 (MySQL은 ALTER 한 문장으로 원자적), 교체 직전 들어온 행을 _old에서 다시 채움
+    4. Contract: NOT NULL 적용, _old 컬럼 제거 (MySQL은 INPLACE, LOCK=NONE)
+    단계마다 현재 스키마를 확인하므로 중간에 실패해도 그대로 재실행하면 이어서 진행.
+    SQLite는 NOT NULL 해제를 지원하지 않으므로 3~4를 쓰기 잠금을 잡은 한 트랜잭션으로 수행 (_swap_sqlite).
+    """
+    name = Booking.__tablename__
+    mysql = engine.dialect.name == "mysql"
+    columns = {c["name"]: c for c in inspect(engine).get_columns(name)}
+
+    if "departure_date_old" not in columns:
+        if isinstance(columns["departure_date"]["type"], Date) and "departure_date_new" not in columns:
+            print("= dates (already DATE)")
+            return
+
+        if "departure_date_new" not in columns:
+            print("+ expand")
+            if not dry_run:
+                _alter(engine, [f"ALTER TABLE {name} ADD COLUMN {c}_new DATE NULL" for c in _DATE_COLUMNS])
+
+        # 교체 후 원래 컬럼에는 값이 들어오지 않으므로 NULL 허용 (타입은 그대로 유지)
+        not_null = [c for c in _DATE_COLUMNS if mysql and not columns[c]["nullable"]]
+        if not_null:
+            print("+ expand (nullable)")
+            if not dry_run:
+                _alter(
+                    engine,
+                    [
+                        f"ALTER TABLE {name} "
+                        + ", ".join(
+                            f"MODIFY {c} {columns[c]['type'].compile(dialect=engine.dialect)} NULL"
+                            for c in not_null
+                        )
+                        + ", ALGORITHM=INPLACE, LOCK=NONE"
+                    ],
+                )
+
+        if dry_run:
+            with engine.connect() as conn:
+                rows = conn.execute(select(*map(column, _DATE_COLUMNS)).select_from(table(name)))
+                invalid = sum(None in map(_parse_date, values) for values in rows)
+            print(f"  dry-run: {invalid} booking(s) with unparseable dates")
+            return
+
+        print("+ backfill")
+        invalid = backfill_dates(engine, "", "_new", chunk_size, sleep)
+        if invalid:
+            raise SystemExit(f"{invalid} booking(s) have unparseable dates; fix them and re-run")
+
+        print("+ swap")
+        if not mysql:
+            _swap_sqlite(engine)
+            return
+        _alter(engine, [f"ALTER TABLE {name} " + ", ".join(_renames())])
+    elif dry_run:
+        print("  dry-run: swap already done, contract pending")
+        return
+
+    # 백필 종료 ~ 교체 사이에 구 버전 앱이 넣은 행 보정
+    print("+ catch-up")
+    invalid = backfill_dates(engine, "_old", "", chunk_size, sleep)
+    if invalid:
+        raise SystemExit(f"{invalid} booking(s) have unparseable dates; fix them and re-run")
+
+    print("+ contract")
+    if mysql:
+        _alter(
+            engine,
+            [
+                f"ALTER TABLE {name} "
+                + ", ".join(f"MODIFY {c} DATE NOT NULL" for c in _DATE_COLUMNS)
+                + ", "
+                + ", ".join(f"DROP COLUMN {c}_old" for c in _DATE_COLUMNS)
+                + ", ALGORITHM=INPLACE, LOCK=NONE"
+            ],
+        )
+    else:
+        # SQLite는 NOT NULL 변경을 지원하지 않음 (모델 검증으로 보장)
+        _alter(engine, [f"ALTER TABLE {name} DROP COLUMN {c}_old" for c in _DATE_COLUMNS])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="bookings schema migrations")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    indexes = subparsers.add_parser("indexes", help="create missing indexes")
+    indexes.add_argument("--dry-run", action="store_true")
+    indexes.add_argument("--drop-redundant", action="store_true")
+
+    dates = subparsers.add_parser("dates", help="convert date columns to DATE")
+    dates.add_argument("--chunk-size", type=int, default=1000)
+    dates.add_argument("--sleep", type=float, default=0.0, help="seconds between chunks")
+    dates.add_argument("--dry-run", action="store_true")
+
+    args = parser.parse_args()
+    engine = get_engine()
+
+    if args.command == "indexes":
+        migrate_indexes(engine, dry_run=args.dry_run, drop_redundant=args.drop_redundant)
+    elif args.command == "dates":
+        migrate_dates(engine, chunk_size=args.chunk_size, sleep=args.sleep, dry_run=args.dry_run)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+user_pii 테이블 필드 암호화 마이그레이션 도구 (On-Prem).
+
+암호화 도입 전 평문 행을 청크 단위로 암호화합니다. 변환 중에도 key_id가 NULL인 행은
+평문으로 읽히므로 서비스를 멈추지 않고 실행할 수 있습니다 (재실행 안전).
+
+    python -m scripts.migrate_pii schema --dry-run   # 컬럼/인덱스 변경 확인
+    python -m scripts.migrate_pii schema             # key_id, email_bidx 추가 + PII 컬럼 BLOB 변환
+    python -m scripts.migrate_pii encrypt --chunk-size 500
+
+schema 단계의 PII 컬럼 타입 변경(VARCHAR -> BLOB)은 MySQL에서 테이블 복사(ALGORITHM=COPY)로
+수행되어 쓰기가 막히므로 점검 시간에 실행하거나 gh-ost/pt-online-schema-change로 적용합니다.
+"""
+import argparse
+import asyncio
+import logging
+import time
+from sqlalchemy import LargeBinary, inspect, select, text, update
+from app.core.database import async_session_scope, get_engine
+from app.core.pii_crypto import PII_FIELDS, pii_cipher
+from app.models.pii import PIIDataKey, UserPII
+
+logger = logging.getLogger("uvicorn")
+
+
+def migrate_schema(engine, dry_run: bool = False):
+    """key_id/email_bidx 컬럼, Blind Index 인덱스, pii_data_keys 테이블 추가 및 PII 컬럼 BLOB 변환"""
+    name = UserPII.__tablename__
+    inspector = inspect(engine)
+    columns = {c["name"]: c for c in inspector.get_columns(name)}
+    indexes = {index["name"] for index in inspector.get_indexes(name)}
+    mysql = engine.dialect.name == "mysql"
+
+    statements = []
+    for column, ddl in (("key_id", "VARCHAR(36) NULL"), ("email_bidx", "VARCHAR(64) NULL")):
+        if column not in columns:
+            statements.append(f"ALTER TABLE {name} ADD COLUMN {column} {ddl}")
+    if "ix_user_pii_email_bidx" not in indexes:
+        statements.append(f"CREATE INDEX ix_user_pii_email_bidx ON {name} (email_bidx)")
+
+    # SQLite는 컬럼 타입과 무관하게 BLOB을 저장하므로 MySQL만 변환
+    plaintext = [f for f in PII_FIELDS if not isinstance(columns[f]["type"], LargeBinary)]
+    if mysql and plaintext:
+        # 평문 email 인덱스는 BLOB 변환 시 사용할 수 없고 Blind Index로 대체됨
+        drops = ["DROP INDEX ix_user_pii_email"] if "ix_user_pii_email" in indexes else []
+        statements.append(
+            f"ALTER TABLE {name} "
+            + ", ".join(drops + [f"MODIFY {f} BLOB NOT NULL" for f in plaintext])
+        )
+
+    if not statements:
+        print("= schema (up to date)")
+    for statement in statements:
+        print(f"+ {statement}")
+        if not dry_run:
+            with engine.begin() as conn:
+                conn.execute(text(statement))
+
+    if not dry_run:
+        PIIDataKey.__table__.create(bind=engine, checkfirst=True)
+
+
+async def encrypt_rows(chunk_size: int, sleep: float) -> int:
+    """key_id가 NULL인 평문 행을 user_id 순서로 chunk_size씩 암호화 (청크마다 커밋)"""
+    encrypted, last_user_id = 0, ""
+    async with async_session_scope() as db:
+        while True:
+            rows = (
+                await db.execute(
+                    select(UserPII)
+                    .where(UserPII.key_id.is_(None), UserPII.user_id > last_user_id)
+                    .order_by(UserPII.user_id)
+                    .limit(chunk_size)
+                )
+            ).scalars().all()
+            if not rows:
+                break
+            last_user_id = rows[-1].user_id
+
+            plain_rows = await pii_cipher.decrypt_rows(db, rows)  # 평문 행은 그대로 반환
+            params = []
+            for plain in plain_rows:
+                values = {field: plain[field] for field in PII_FIELDS}
+                params.append(
+                    {"user_id": plain["user_id"], **await pii_cipher.encrypt(db, plain["user_id"], values)}
+                )
+            await db.execute(update(UserPII), params)
+            await db.commit()
+
+            encrypted += len(params)
+            print(f"  encrypt: {encrypted} row(s) (up to {last_user_id})")
+            if sleep:
+                await asyncio.sleep(sleep)
+    return encrypted
+
+
+def main():
+    parser = argparse.ArgumentParser(description="user_pii encryption migrations")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    schema = subparsers.add_parser("schema", help="add encryption columns and indexes")
+    schema.add_argument("--dry-run", action="store_true")
+
+    encrypt = subparsers.add_parser("encrypt", help="encrypt plaintext rows in chunks")
+    encrypt.add_argument("--chunk-size", type=int, default=500)
+    encrypt.add_argument("--sleep", type=float, default=0.0, help="seconds between chunks")
+
+    args = parser.parse_args()
+
+    if args.command == "schema":
+        migrate_schema(get_engine(), dry_run=args.dry_run)
+    elif args.command == "encrypt":
+        started = time.perf_counter()
+        count = asyncio.run(encrypt_rows(args.chunk_size, args.sleep))
+        print(f"= encrypted {count} row(s) in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
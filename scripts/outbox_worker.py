@@ -0,0 +1,44 @@
+"""
+벤더 호출 Outbox 워커 단독 실행 (Cloud).
+
+API 프로세스와 분리해 확장할 때 사용합니다. API는 OUTBOX_WORKER_ENABLED=false로 실행하고
+이 프로세스를 필요한 수만큼 실행합니다 (가져간 행은 리스로 보호되어 중복 처리하지 않음).
+
+    python -m scripts.outbox_worker
+"""
+import asyncio
+import logging
+import signal
+import time
+from app.core import onprem_client
+from app.core.config import settings
+from app.core.database import close_db_pools, start_db_init
+from app.core.logging_config import configure_logging, shutdown_logging
+from app.core.vendor_outbox import run_outbox_worker
+
+logger = logging.getLogger("uvicorn")
+
+
+async def run():
+    configure_logging(settings.LOG_LEVEL, settings.LOG_FORMAT, settings.LOG_SAMPLE_RATE)
+    start_db_init(time.perf_counter())
+    onprem_client.start_onprem_client()
+
+    worker = asyncio.create_task(run_outbox_worker())
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, worker.cancel)
+    logger.info("✅ [Outbox] Standalone worker started (batch=%d)", settings.OUTBOX_BATCH_SIZE)
+
+    try:
+        await worker
+    except asyncio.CancelledError:
+        logger.info("🛑 [Outbox] Worker stopped.")
+    finally:
+        await onprem_client.close_onprem_client()
+        await close_db_pools()
+        shutdown_logging()
+
+
+if __name__ == "__main__":
+    asyncio.run(run())